@@ -0,0 +1,80 @@
+"""
+Decode time of Helix pages for each installed decoder backend.
+
+Compares decoding into plain dicts and straight into models. Pages are
+synthetic 100-item `streams` and `clips` responses unless recorded payloads are
+given, one JSON response body per file, decoded into `--model`.
+
+    python benchmarks/bench_decode.py [-r 200] [--model streams|clips] [payload.json ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+from bench_models import ItemFactory
+from bench_models import clip_item
+from bench_models import stream_item
+
+from twitchAPI.decoders import DECODERS
+from twitchAPI.models.content import FollowedContentClip
+from twitchAPI.models.streams import FollowedStream
+
+MODELS: dict[str, tuple[type, ItemFactory]] = {
+    'streams': (FollowedStream, stream_item),
+    'clips': (FollowedContentClip, clip_item),
+}
+
+
+def synthetic_page(make_item: ItemFactory, size: int = 100) -> bytes:
+    rng = random.Random(0)
+    body = {'data': [make_item(i, rng) for i in range(size)], 'pagination': {'cursor': 'eyJiIjpudWxsfQ'}}
+    return json.dumps(body).encode()
+
+
+def timeit(fn: Callable[[], Any], rounds: int) -> float:
+    """Returns the best of 5 runs of `rounds` calls, in microseconds per call."""
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-r', '--rounds', type=int, default=200)
+    parser.add_argument('--model', choices=sorted(MODELS), default='streams')
+    parser.add_argument('payloads', nargs='*', type=Path)
+    args = parser.parse_args()
+
+    if args.payloads:
+        model = MODELS[args.model][0]
+        cases = [(path.name, model, path.read_bytes()) for path in args.payloads]
+    else:
+        cases = [(name, model, synthetic_page(make_item)) for name, (model, make_item) in MODELS.items()]
+
+    print(f'{"payload":<16} {"decoder":<10} {"dicts µs":>10} {"models µs":>10}')
+    for name, model, content in cases:
+        for decoder_name, decoder_cls in DECODERS.items():
+            try:
+                decoder = decoder_cls()
+            except ImportError:
+                print(f'{name:<16} {decoder_name:<10} {"not installed":>21}')
+                continue
+            plain = timeit(functools.partial(decoder.decode, content), args.rounds)
+            typed = timeit(functools.partial(decoder.decode_page, content, model), args.rounds)
+            print(f'{name:<16} {decoder_name:<10} {plain:>10.1f} {typed:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
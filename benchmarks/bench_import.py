@@ -0,0 +1,93 @@
+"""
+Import time of the package entry points, checked against a budget.
+
+Each module is imported in a fresh interpreter with `-X importtime`, the
+median of `--rounds` runs is compared to its budget. Heavy dependencies a
+module must not pull in at import time are checked as well. Exits with
+status 1 if any budget is exceeded or a dependency is imported too early.
+
+    python benchmarks/bench_import.py [-r 7] [--scale 1.0] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+# module -> (budget in ms, dependencies it must not import).
+BUDGETS: dict[str, tuple[float, tuple[str, ...]]] = {
+    'twitchAPI': (10.0, ('httpx', 'pydantic', 'tenacity', 'dotenv', 'asyncio')),
+    'twitchAPI.auth': (40.0, ('httpx', 'pydantic', 'tenacity', 'dotenv')),
+    'twitchAPI.twitch': (200.0, ('httpx', 'pydantic', 'tenacity', 'dotenv', 'sqlite3')),
+    'twitchAPI.api_helix': (400.0, ('pydantic', 'tenacity', 'dotenv', 'msgspec', 'orjson')),
+}
+
+
+def import_once(module: str) -> tuple[float, list[str], list[tuple[float, str]]]:
+    """Returns (ms, imported top-level packages, heaviest imports) of importing `module`."""
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([str(SRC), os.environ.get('PYTHONPATH', '')])}
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    total = 0.0
+    packages = set()
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len('import time:') :].split('|')
+        name = raw_name.strip()
+        packages.add(name.split('.')[0])
+        timings.append((int(self_us) / 1000, name))
+        # top-level imports are indented by a single space.
+        if name == module and raw_name.startswith(' ') and not raw_name.startswith('  '):
+            total = int(cumulative_us) / 1000
+    heaviest = sorted(timings, reverse=True)[:5]
+    return total, sorted(packages), heaviest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-r', '--rounds', type=int, default=7)
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply every budget, for slower machines')
+    parser.add_argument('--json', type=Path, help='write the results to this file')
+    args = parser.parse_args()
+
+    failures = []
+    results = []
+    print(f'{"module":<22} {"median ms":>10} {"budget ms":>10}  heaviest imports')
+    for module, (budget, forbidden) in BUDGETS.items():
+        runs = [import_once(module) for _ in range(args.rounds)]
+        median = statistics.median(ms for ms, _, _ in runs)
+        _, packages, heaviest = runs[-1]
+        scaled = budget * args.scale
+        early = [name for name in forbidden if name in packages]
+        heavy = ', '.join(f'{name} {ms:.1f}' for ms, name in heaviest)
+        print(f'{module:<22} {median:>10.1f} {scaled:>10.1f}  {heavy}')
+        if median > scaled:
+            failures.append(f'{module}: {median:.1f}ms over its {scaled:.1f}ms budget')
+        if early:
+            failures.append(f'{module}: imports {", ".join(early)} at import time')
+        results.append({'module': module, 'median_ms': round(median, 3), 'budget_ms': scaled, 'imports': early})
+
+    if args.json:
+        args.json.write_text(json.dumps({'python': sys.version.split()[0], 'results': results}, indent=2))
+    for failure in failures:
+        print(f'fail: {failure}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
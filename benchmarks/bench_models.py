@@ -0,0 +1,136 @@
+"""
+Memory and build time of the stream and clip models.
+
+Decodes N synthetic items from 100-item JSON pages, as a Helix response would
+be, into plain dataclasses and column tables. Reports the memory retained
+once the pages are dropped and the time taken by each.
+
+    python benchmarks/bench_models.py [-n 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from twitchAPI.models.compact import ClipTable
+from twitchAPI.models.compact import StreamTable
+from twitchAPI.models.content import FollowedContentClip
+from twitchAPI.models.streams import FollowedStream
+
+GAMES = [(str(i), f'Game {i}') for i in range(200)]
+LANGUAGES = ['en', 'es', 'de', 'fr', 'pt', 'ja', 'ko', 'ru']
+TAGS = [f'tag{i}' for i in range(300)]
+MATURE_SHARE = 0.2
+
+# `typing.Dict`, the alias is evaluated at runtime on Python 3.8.
+ItemFactory = Callable[[int, random.Random], Dict[str, Any]]
+
+
+def stream_item(i: int, rng: random.Random) -> dict[str, Any]:
+    game_id, game_name = rng.choice(GAMES)
+    return {
+        'id': str(40_000_000_000 + i),
+        'game_id': game_id,
+        'game_name': game_name,
+        'is_mature': rng.random() < MATURE_SHARE,
+        'language': rng.choice(LANGUAGES),
+        'started_at': f'2025-01-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00Z',
+        'tag_ids': [],
+        'tags': rng.sample(TAGS, 3),
+        'thumbnail_url': f'https://static-cdn.jtvnw.net/previews-ttv/live_user_user{i}-{{width}}x{{height}}.jpg',
+        'title': f'stream title number {i}',
+        'type': 'live',
+        'user_id': str(100_000 + i),
+        'user_login': f'user{i}',
+        'user_name': f'User{i}',
+        'viewer_count': rng.randint(0, 50_000),
+    }
+
+
+def clip_item(i: int, rng: random.Random) -> dict[str, Any]:
+    game_id, _ = rng.choice(GAMES)
+    return {
+        'broadcaster_id': str(100_000 + i % 500),
+        'broadcaster_name': f'User{i % 500}',
+        'created_at': f'2025-01-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00Z',
+        'creator_id': str(200_000 + i % 5000),
+        'creator_name': f'Clipper{i % 5000}',
+        'duration': round(rng.uniform(5, 60), 1),
+        'embed_url': f'https://clips.twitch.tv/embed?clip=Clip{i}',
+        'game_id': game_id,
+        'id': f'Clip{i}',
+        'language': rng.choice(LANGUAGES),
+        'thumbnail_url': f'https://clips-media-assets2.twitch.tv/{i}-preview-480x272.jpg',
+        'title': f'clip title number {i}',
+        'url': f'https://clips.twitch.tv/Clip{i}',
+        'video_id': '',
+        'view_count': rng.randint(0, 100_000),
+        'vod_offset': None,
+        'is_featured': False,
+    }
+
+
+def pages(items: list[dict[str, Any]], size: int = 100) -> list[bytes]:
+    return [json.dumps({'data': items[i : i + size]}).encode() for i in range(0, len(items), size)]
+
+
+def build_models(model: Callable[..., Any], raw_pages: list[bytes]) -> list[Any]:
+    return [model(**item) for raw in raw_pages for item in json.loads(raw)['data']]
+
+
+def build_table(table: Callable[[], Any], raw_pages: list[bytes]) -> Any:
+    result = table()
+    for raw in raw_pages:
+        result.extend(json.loads(raw)['data'])
+    return result
+
+
+def measure(build: Callable[[], Any]) -> tuple[float, float]:
+    """Returns (MiB retained, seconds) for building the result of `build`."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 2**20, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', type=int, default=50_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    streams = pages([stream_item(i, rng) for i in range(args.n)])
+    clips = pages([clip_item(i, rng) for i in range(args.n)])
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ('FollowedStream', lambda: build_models(FollowedStream, streams)),
+        ('StreamTable', lambda: build_table(StreamTable, streams)),
+        ('FollowedContentClip', lambda: build_models(FollowedContentClip, clips)),
+        ('ClipTable', lambda: build_table(ClipTable, clips)),
+    ]
+    print(f'{"model":<28} {"items":>8} {"MiB":>8} {"ms":>8}')
+    for name, build in cases:
+        mib, seconds = measure(build)
+        print(f'{name:<28} {args.n:>8} {mib:>8.2f} {seconds * 1000:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
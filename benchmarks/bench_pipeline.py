@@ -0,0 +1,254 @@
+"""
+Throughput, latency and memory of the `HelixAPI` request pipeline.
+
+Runs each scenario against the stand-in server of `mock_helix.py`, each in a
+fresh process so its peak RSS is its own. Reports requests/sec, items/sec,
+the p50/p95/p99 latency of a whole call, peak RSS and the memory allocated
+while building the result. `--json` writes the results for `--compare`, which
+exits with status 1 when a metric regressed by more than `--tolerance`.
+
+    python benchmarks/bench_pipeline.py [-r 20] [--latency 0.005] [--json out.json]
+    python benchmarks/bench_pipeline.py --compare baseline.json [--tolerance 0.15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+
+import httpx
+from mock_helix import MockConfig
+from mock_helix import MockHelix
+
+from twitchAPI.__about__ import __version__
+from twitchAPI.api_helix import HelixAPI
+from twitchAPI.decoders import get_decoder
+from twitchAPI.models.channels import ChannelInfo
+from twitchAPI.models.content import FollowedContentClip
+from twitchAPI.models.streams import FollowedStream
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+Op = Callable[[HelixAPI], Awaitable[int]]
+
+# metric -> True if higher is better, compared by `--compare`.
+COMPARED = {'req_per_s': True, 'items_per_s': True, 'p95_ms': False, 'alloc_peak_mib': False}
+
+
+@dataclass
+class Scenario:
+    name: str
+    op: Op
+    config: MockConfig
+
+
+@dataclass
+class Result:
+    scenario: str
+    ops: int
+    requests: int
+    items: int
+    seconds: float
+    req_per_s: float
+    items_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_rss_mib: float | None
+    alloc_peak_mib: float
+    alloc_retained_mib: float
+
+
+def scenarios(n: int, latency: float, jitter: float) -> list[Scenario]:
+    def config(**kwargs: Any) -> MockConfig:
+        return MockConfig(latency=latency, jitter=jitter, **kwargs)
+
+    async def streams(api: HelixAPI) -> int:
+        return len((await api.request_get(httpx.URL('streams'), {}, max_items=n))['data'])
+
+    async def streams_models(api: HelixAPI) -> int:
+        return len((await api.request_get(httpx.URL('streams'), {}, max_items=n, model=FollowedStream))['data'])
+
+    async def followed_channels(api: HelixAPI) -> int:
+        return len(await api.channels.all(max_items=None, model=ChannelInfo))
+
+    async def clips(api: HelixAPI) -> int:
+        # walks until Helix stops handing out cursors, past a trailing empty page.
+        params = {'broadcaster_id': '1'}
+        response = await api.request_get(httpx.URL('clips'), params, max_items=None, model=FollowedContentClip)
+        return len(response['data'])
+
+    async def users_batches(api: HelixAPI) -> int:
+        ids = [str(i) for i in range(n)]
+        return len(await api.request_batches(httpx.URL('users'), 'id', ids))
+
+    async def games_loader(api: HelixAPI) -> int:
+        # many concurrent single-ID lookups, coalesced by the shared loader.
+        loader = api.loader(httpx.URL('games'), 'id')
+        found = await asyncio.gather(*(loader.load(str(i % 500)) for i in range(n)))
+        return sum(game is not None for game in found)
+
+    return [
+        Scenario('paginate_streams', streams, config(items={'streams': n})),
+        Scenario('paginate_streams_models', streams_models, config(items={'streams': n})),
+        Scenario('followed_channels', followed_channels, config(items={'channels/followed': n})),
+        Scenario('clips_capped', clips, config(items={'clips': n}, page_cap=1000, trailing_cursor=True)),
+        Scenario('batch_users', users_batches, config()),
+        Scenario('loader_games', games_loader, config()),
+        Scenario('paginate_ratelimited', streams, config(items={'streams': n}, ratelimit_every=10)),
+    ]
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def peak_rss_mib() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS.
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+async def run(scenario: Scenario, rounds: int) -> Result:
+    helix = MockHelix(scenario.config)
+    api = helix.api()
+    try:
+        await scenario.op(api)  # warm up, builds the server's pages
+        helix.requests = 0
+        latencies: list[float] = []
+        items = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            op_start = time.perf_counter()
+            items += await scenario.op(api)
+            latencies.append(time.perf_counter() - op_start)
+        seconds = time.perf_counter() - start
+        requests = helix.requests
+
+        gc.collect()
+        tracemalloc.start()
+        result = await scenario.op(api)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+    finally:
+        await api.close()
+
+    return Result(
+        scenario=scenario.name,
+        ops=rounds,
+        requests=requests,
+        items=items,
+        seconds=round(seconds, 4),
+        req_per_s=round(requests / seconds, 1),
+        items_per_s=round(items / seconds, 1),
+        p50_ms=round(statistics.median(latencies) * 1000, 3),
+        p95_ms=round(percentile(latencies, 0.95) * 1000, 3),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 3),
+        peak_rss_mib=peak_rss_mib(),
+        alloc_peak_mib=round(peak / 2**20, 3),
+        alloc_retained_mib=round(retained / 2**20, 3),
+    )
+
+
+def run_in_process(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    scenario = next(s for s in scenarios(args.n, args.latency, args.jitter) if s.name == name)
+    return asdict(asyncio.run(run(scenario, args.rounds)))
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Returns a line for each metric worse than the baseline by more than `tolerance`."""
+    before = {r['scenario']: r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        old = before.get(result['scenario'])
+        if old is None:
+            continue
+        for metric, higher_is_better in COMPARED.items():
+            if not old[metric]:
+                continue
+            change = (result[metric] - old[metric]) / old[metric]
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(f'{result["scenario"]}: {metric} {old[metric]} -> {result[metric]} ({change:+.1%})')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', type=int, default=2000, help='items per call')
+    parser.add_argument('-r', '--rounds', type=int, default=20, help='calls per scenario')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds per response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random extra seconds per response')
+    parser.add_argument('-k', '--scenario', action='append', help='run only these scenarios')
+    parser.add_argument('--json', type=Path, help='write the results to this file')
+    parser.add_argument('--compare', type=Path, help='results of a previous run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.15)
+    args = parser.parse_args()
+
+    names = [s.name for s in scenarios(args.n, args.latency, args.jitter)]
+    if args.scenario:
+        names = [name for name in names if name in args.scenario]
+
+    ctx = multiprocessing.get_context('spawn')
+    results = []
+    print(
+        f'{"scenario":<24} {"req/s":>9} {"items/s":>10} {"p50 ms":>8} {"p95 ms":>8} '
+        f'{"p99 ms":>8} {"RSS MiB":>8} {"alloc MiB":>9}'
+    )
+    for name in names:
+        with ctx.Pool(1) as pool:
+            result = pool.apply(run_in_process, (name, args))
+        results.append(result)
+        rss = f'{result["peak_rss_mib"]:.1f}' if result['peak_rss_mib'] is not None else '-'
+        print(
+            f'{name:<24} {result["req_per_s"]:>9.1f} {result["items_per_s"]:>10.1f} {result["p50_ms"]:>8.2f} '
+            f'{result["p95_ms"]:>8.2f} {result["p99_ms"]:>8.2f} {rss:>8} {result["alloc_peak_mib"]:>9.2f}'
+        )
+
+    report = {
+        'meta': {
+            'twitchAPI': __version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'httpx': httpx.__version__,
+            'decoder': get_decoder().name,
+            'n': args.n,
+            'rounds': args.rounds,
+            'latency': args.latency,
+            'jitter': args.jitter,
+        },
+        'results': results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.tolerance)
+        for line in regressions:
+            print(f'regression: {line}')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
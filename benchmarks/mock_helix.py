@@ -0,0 +1,290 @@
+"""
+A stand-in Helix server, served through an `httpx.MockTransport`.
+
+Serves synthetic (or recorded) pages for `streams`, `streams/followed`,
+`channels/followed`, `clips`, `videos`, `users` and `games`, with a
+configurable latency, number of items, 429 injection and cursor behaviour,
+so the whole `HelixAPI` pipeline can run offline. With `token_lifetime` set it
+also stands in for `id.twitch.tv`: access tokens expire, `/oauth2/validate`
+and `/oauth2/token` validate and refresh them.
+
+    helix = MockHelix(MockConfig(latency=0.01, items={'streams': 5000}))
+    api = helix.api()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import math
+import random
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+import httpx
+from bench_models import ItemFactory
+from bench_models import clip_item
+from bench_models import stream_item
+
+from twitchAPI.api_helix import HelixAPI
+from twitchAPI.auth import UserAuthenticator
+from twitchAPI.config import HelixConfig
+from twitchAPI.transport import TransportConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Callable
+
+
+def channel_item(i: int, rng: random.Random) -> dict[str, Any]:
+    return {
+        'broadcaster_id': str(100_000 + i),
+        'broadcaster_login': f'user{i}',
+        'broadcaster_name': f'User{i}',
+        'followed_at': f'2024-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:{rng.randrange(60):02d}:00Z',
+    }
+
+
+def user_item(i: int, rng: random.Random) -> dict[str, Any]:
+    return {
+        'broadcaster_type': rng.choice(['', 'affiliate', 'partner']),
+        'created_at': f'2016-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00Z',
+        'description': f'description of user {i}',
+        'display_name': f'User{i}',
+        'id': str(i),
+        'login': f'user{i}',
+        'offline_image_url': '',
+        'profile_image_url': f'https://static-cdn.jtvnw.net/jtv_user_pictures/user{i}-300x300.png',
+        'type': '',
+        'view_count': '0',
+    }
+
+
+def game_item(i: int, rng: random.Random) -> dict[str, Any]:
+    return {
+        'id': str(i),
+        'name': f'Game {i}',
+        'box_art_url': f'https://static-cdn.jtvnw.net/ttv-boxart/{i}-{{width}}x{{height}}.jpg',
+        'igdb_id': str(rng.randrange(100_000)),
+    }
+
+
+def video_item(i: int, rng: random.Random) -> dict[str, Any]:
+    return {
+        'id': str(2_000_000_000 + i),
+        'stream_id': str(40_000_000_000 + i),
+        'user_id': str(100_000 + i % 500),
+        'user_login': f'user{i % 500}',
+        'user_name': f'User{i % 500}',
+        'title': f'video title number {i}',
+        'description': '',
+        'created_at': f'2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z',
+        'published_at': f'2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z',
+        'url': f'https://www.twitch.tv/videos/{2_000_000_000 + i}',
+        'thumbnail_url': '',
+        'viewable': 'public',
+        'view_count': rng.randint(0, 10_000),
+        'language': 'en',
+        'type': 'archive',
+        'duration': f'{rng.randrange(1, 8)}h{rng.randrange(60)}m{rng.randrange(60)}s',
+        'muted_segments': None,
+    }
+
+
+PAGINATED: dict[str, ItemFactory] = {
+    'streams': stream_item,
+    'streams/followed': stream_item,
+    'channels/followed': channel_item,
+    'clips': clip_item,
+    'videos': video_item,
+}
+LOOKUPS: dict[str, ItemFactory] = {
+    'users': user_item,
+    'games': game_item,
+}
+
+
+@dataclass
+class MockConfig:
+    """
+    Behaviour of the stand-in server.
+
+    Attributes:
+        latency (float): Seconds each response takes, before jitter.
+        jitter (float): Up to this many seconds added at random to each response.
+        items (dict[str, int]): Items served by each paginated endpoint, 1000 if not listed.
+        page_cap (int | None): Items after which the cursor is dropped, as Helix does for clips.
+        trailing_cursor (bool): The last page still has a cursor, leading to an empty page.
+        ratelimit_every (int): Every Nth request gets a 429, 0 for none.
+        ratelimit_reset (float): Seconds until `Ratelimit-Reset` on a 429.
+        fixtures (Path | None): Directory of recorded response bodies, `<endpoint>.json`
+        with `/` replaced by `_`; their items are cycled through instead of synthetic ones.
+        seed (int): Seed of the synthetic items and jitter.
+        token_lifetime (float | None): Seconds an access token is valid, None to accept any token.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    items: dict[str, int] = field(default_factory=dict)
+    page_cap: int | None = None
+    trailing_cursor: bool = False
+    ratelimit_every: int = 0
+    ratelimit_reset: float = 0.05
+    fixtures: Path | None = None
+    seed: int = 0
+    token_lifetime: float | None = None
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({'o': offset}).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    return json.loads(base64.urlsafe_b64decode(cursor))['o']
+
+
+class MockHelix:
+    """Serves Helix-shaped pages and counts what it was asked for."""
+
+    def __init__(self, config: MockConfig | None = None) -> None:
+        self.config = config or MockConfig()
+        self._rng = random.Random(self.config.seed)
+        self._recorded = self._load_fixtures()
+        self._items: dict[tuple[str, int], dict[str, Any]] = {}
+        self._bodies: dict[tuple[str, int, int], bytes] = {}
+        self.requests = 0
+        self.ratelimited = 0
+        self.bytes_sent = 0
+        self.refreshes = 0
+        self.unauthorized = 0
+        # access token -> monotonic time it expires at.
+        self._tokens: dict[str, float] = {}
+        if self.config.token_lifetime is not None:
+            self._tokens['token'] = time.monotonic() + self.config.token_lifetime
+
+    def _load_fixtures(self) -> dict[str, list[dict[str, Any]]]:
+        if self.config.fixtures is None:
+            return {}
+        recorded = {}
+        for path in self.config.fixtures.glob('*.json'):
+            data = json.loads(path.read_bytes()).get('data', [])
+            if data:
+                recorded[path.stem.replace('_', '/')] = data
+        return recorded
+
+    def item(self, endpoint: str, i: int) -> dict[str, Any]:
+        recorded = self._recorded.get(endpoint)
+        if recorded:
+            return recorded[i % len(recorded)]
+        key = (endpoint, i)
+        if key not in self._items:
+            factory = PAGINATED.get(endpoint) or LOOKUPS[endpoint]
+            self._items[key] = factory(i, random.Random(i))
+        return self._items[key]
+
+    def _page(self, endpoint: str, offset: int, first: int) -> bytes:
+        # pages are built once and served from memory, so the server costs
+        # the same in every run and the client's work is what gets measured.
+        key = (endpoint, offset, first)
+        if key not in self._bodies:
+            total = self.config.items.get(endpoint, 1000)
+            if self.config.page_cap is not None:
+                total = min(total, self.config.page_cap)
+            end = min(total, offset + first)
+            data = [self.item(endpoint, i) for i in range(offset, end)]
+            more = end < total or (self.config.trailing_cursor and data)
+            pagination = {'cursor': encode_cursor(end)} if more else {}
+            self._bodies[key] = json.dumps({'data': data, 'pagination': pagination}).encode()
+        return self._bodies[key]
+
+    def _lookup(self, endpoint: str, ids: list[str]) -> bytes:
+        data = [{**self.item(endpoint, int(i)), 'id': i} for i in ids if i.isdigit()]
+        return json.dumps({'data': data}).encode()
+
+    def _ratelimit_headers(self, remaining: int) -> dict[str, str]:
+        return {
+            'Ratelimit-Limit': '800',
+            'Ratelimit-Remaining': str(remaining),
+            'Ratelimit-Reset': str(time.time() + self.config.ratelimit_reset),
+        }
+
+    def _token_expires_in(self, request: httpx.Request) -> float | None:
+        """Seconds left on the request's access token, None if it is unknown."""
+        token = request.headers.get('Authorization', '').split(' ', 1)[-1]
+        expires_at = self._tokens.get(token)
+        return None if expires_at is None else expires_at - time.monotonic()
+
+    def _oauth(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == '/oauth2/validate':
+            expires_in = self._token_expires_in(request)
+            if expires_in is None or expires_in <= 0:
+                return httpx.Response(401, json={'status': 401, 'message': 'invalid access token'})
+            body: dict[str, Any] = {'client_id': 'client', 'login': 'user1', 'scopes': [], 'user_id': '1'}
+            return httpx.Response(200, json={**body, 'expires_in': math.ceil(expires_in)})
+        if request.url.path == '/oauth2/token' and request.method == 'POST':
+            form = httpx.QueryParams(request.content.decode())
+            if form.get('grant_type') != 'refresh_token' or not form.get('refresh_token'):
+                return httpx.Response(400, json={'status': 400, 'message': 'Invalid refresh token'})
+            self.refreshes += 1
+            token = f'token-{self.refreshes}'
+            self._tokens[token] = time.monotonic() + (self.config.token_lifetime or 0)
+            body = {
+                'access_token': token,
+                'refresh_token': f'refresh-{self.refreshes}',
+                'expires_in': int(self.config.token_lifetime or 0),
+                'scope': [],
+                'token_type': 'bearer',
+            }
+            return httpx.Response(200, json=body)
+        return httpx.Response(404, json={'error': 'Not Found', 'status': 404})
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith('/oauth2/'):
+            return self._oauth(request)
+        self.requests += 1
+        config = self.config
+        delay = config.latency + (self._rng.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if config.ratelimit_every and self.requests % config.ratelimit_every == 0:
+            self.ratelimited += 1
+            return httpx.Response(429, json={'status': 429}, headers=self._ratelimit_headers(0))
+
+        if config.token_lifetime is not None:
+            expires_in = self._token_expires_in(request)
+            if expires_in is None or expires_in <= 0:
+                self.unauthorized += 1
+                error = {'error': 'Unauthorized', 'status': 401, 'message': 'Invalid OAuth token'}
+                return httpx.Response(401, json=error)
+
+        endpoint = request.url.path.split('/helix/', 1)[-1]
+        params = request.url.params
+        if endpoint in LOOKUPS:
+            body = self._lookup(endpoint, params.get_list('id'))
+        elif endpoint in PAGINATED:
+            after = params.get('after')
+            body = self._page(endpoint, decode_cursor(after) if after else 0, int(params.get('first', 20)))
+        else:
+            return httpx.Response(404, json={'error': 'Not Found', 'status': 404})
+
+        self.bytes_sent += len(body)
+        return httpx.Response(
+            200,
+            content=body,
+            headers={'Content-Type': 'application/json', **self._ratelimit_headers(799)},
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        # `MockTransport` awaits async handlers, its annotation only admits sync ones.
+        return httpx.MockTransport(cast('Callable[[httpx.Request], httpx.Response]', self.handle))
+
+    def api(self, **kwargs: Any) -> HelixAPI:
+        """Returns a `HelixAPI` talking to this server, `kwargs` are passed on to its `HelixConfig`."""
+        auth = UserAuthenticator(access_token='token', client_id='client', user_id='1')
+        return HelixAPI(auth, HelixConfig(transport=TransportConfig(transport=self.transport()), **kwargs))
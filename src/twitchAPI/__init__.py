@@ -1,3 +1,76 @@
 # SPDX-FileCopyrightText: 2025-present haaag <81921095+haaag@users.noreply.github.com>
 #
 # SPDX-License-Identifier: MIT
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from twitchAPI.api_helix import HelixAPI
+    from twitchAPI.auth import UserAuthenticator
+    from twitchAPI.cache import ConditionalCache
+    from twitchAPI.cache import EntityCache
+    from twitchAPI.cache import ResponseCache
+    from twitchAPI.config import HelixConfig
+    from twitchAPI.metrics import Metrics
+    from twitchAPI.pool import CredentialPool
+    from twitchAPI.ratelimit import RateLimiter
+    from twitchAPI.retry import CircuitBreaker
+    from twitchAPI.retry import RetryPolicy
+    from twitchAPI.store import SnapshotStore
+    from twitchAPI.tokens import TokenManager
+    from twitchAPI.transport import TransportConfig
+    from twitchAPI.twitch import Twitch
+
+# public name -> module it lives in, imported on first access.
+_LAZY = {
+    'CircuitBreaker': 'twitchAPI.retry',
+    'ConditionalCache': 'twitchAPI.cache',
+    'CredentialPool': 'twitchAPI.pool',
+    'EntityCache': 'twitchAPI.cache',
+    'HelixAPI': 'twitchAPI.api_helix',
+    'HelixConfig': 'twitchAPI.config',
+    'Metrics': 'twitchAPI.metrics',
+    'RateLimiter': 'twitchAPI.ratelimit',
+    'ResponseCache': 'twitchAPI.cache',
+    'RetryPolicy': 'twitchAPI.retry',
+    'SnapshotStore': 'twitchAPI.store',
+    'TokenManager': 'twitchAPI.tokens',
+    'TransportConfig': 'twitchAPI.transport',
+    'Twitch': 'twitchAPI.twitch',
+    'UserAuthenticator': 'twitchAPI.auth',
+}
+
+__all__ = [
+    'CircuitBreaker',
+    'ConditionalCache',
+    'CredentialPool',
+    'EntityCache',
+    'HelixAPI',
+    'HelixConfig',
+    'Metrics',
+    'RateLimiter',
+    'ResponseCache',
+    'RetryPolicy',
+    'SnapshotStore',
+    'TokenManager',
+    'TransportConfig',
+    'Twitch',
+    'UserAuthenticator',
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the public classes on first access, `import twitchAPI` alone loads nothing."""
+    if name not in _LAZY:
+        err_msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(err_msg)
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import httpx
-import tenacity
+from typing import Any
 
 
 class EnvValidationError(Exception):
@@ -24,16 +23,89 @@ class InvalidConfigFileError(Exception):
     pass
 
 
-CONNECTION_EXCEPTION = (
-    httpx.ConnectError,
-    httpx.HTTPStatusError,
-    httpx.ConnectTimeout,
-)
-EXCEPTIONS = (
-    EnvValidationError,
-    FileNotFoundError,
-    NotImplementedError,
-    tenacity.RetryError,
-    InvalidConfigFileError,
-    ChannelOfflineError,
-)
+class BatchRequestError(Exception):
+    """
+    Raised when one or more batches of a batched lookup failed.
+
+    Attributes:
+        data (list[dict[str, Any]]): The items of the batches that succeeded, in input order.
+        errors (dict[int, BaseException]): The exception of each failed batch, keyed by batch index.
+    """
+
+    def __init__(self, data: list[dict[str, Any]], errors: dict[int, BaseException]) -> None:
+        self.data = data
+        self.errors = errors
+        super().__init__(f'{len(errors)} batch(es) failed: {sorted(errors)}')
+
+
+class DeadlineExceededError(TimeoutError):
+    """
+    Raised when a call ran out of its time budget.
+
+    Attributes:
+        budget (float): The budget of the call, in seconds.
+        data (list[Any]): The items collected before the deadline passed, if any.
+        pagination (dict[str, Any]): The cursor to resume from, if any.
+    """
+
+    def __init__(
+        self,
+        budget: float,
+        data: list[Any] | None = None,
+        pagination: dict[str, Any] | None = None,
+    ) -> None:
+        self.budget = budget
+        self.data = data or []
+        self.pagination = pagination or {}
+        super().__init__(f'deadline of {budget}s exceeded with {len(self.data)} item(s) collected')
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised without sending the request while an endpoint's circuit is open.
+
+    Attributes:
+        endpoint (str): The endpoint whose circuit is open.
+        retry_in (float): Seconds until a request is let through again.
+    """
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f'circuit open for endpoint {endpoint!r}, retry in {retry_in:.1f}s')
+
+
+class TokenRefreshError(Exception):
+    """Raised when the access token is invalid and could not be refreshed."""
+
+
+class NoCredentialError(Exception):
+    """Raised when a user-scoped request has no credential of its user in the pool."""
+
+
+def __getattr__(name: str) -> Any:
+    # built on first use, so importing the exceptions doesn't import httpx and tenacity.
+    if name == 'CONNECTION_EXCEPTION':
+        import httpx
+
+        value: Any = (
+            httpx.ConnectError,
+            httpx.HTTPStatusError,
+            httpx.ConnectTimeout,
+        )
+    elif name == 'EXCEPTIONS':
+        import tenacity
+
+        value = (
+            EnvValidationError,
+            FileNotFoundError,
+            NotImplementedError,
+            tenacity.RetryError,
+            InvalidConfigFileError,
+            ChannelOfflineError,
+        )
+    else:
+        err_msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(err_msg)
+    globals()[name] = value
+    return value
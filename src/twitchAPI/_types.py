@@ -1,17 +1,19 @@
 # types.py
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Mapping
 from typing import MutableMapping
 from typing import Union
 
-from twitchAPI.models.channels import ChannelInfo
-from twitchAPI.models.channels import FollowedChannel
-from twitchAPI.models.channels import FollowedChannelInfo
-from twitchAPI.models.content import FollowedContentClip
-from twitchAPI.models.content import FollowedContentVideo
-from twitchAPI.models.streams import FollowedStream
+if TYPE_CHECKING:
+    from twitchAPI.models.channels import ChannelInfo
+    from twitchAPI.models.channels import FollowedChannel
+    from twitchAPI.models.channels import FollowedChannelInfo
+    from twitchAPI.models.content import FollowedContentClip
+    from twitchAPI.models.content import FollowedContentVideo
+    from twitchAPI.models.streams import FollowedStream
 
 QueryParamTypes = MutableMapping[str, Any]
 
@@ -20,15 +22,16 @@ HeaderTypes = Mapping[str, Any]
 TwitchApiResponse = Mapping[str, Any]
 
 
+# forward references, so the models are only imported by type checkers.
 TwitchChannel = Union[
-    FollowedChannel,
-    FollowedStream,
-    FollowedChannelInfo,
-    ChannelInfo,
+    'FollowedChannel',
+    'FollowedStream',
+    'FollowedChannelInfo',
+    'ChannelInfo',
 ]
 
 TwitchContent = Union[
-    FollowedContentClip,
-    FollowedContentVideo,
+    'FollowedContentClip',
+    'FollowedContentVideo',
     TwitchChannel,
 ]
@@ -1,116 +1,508 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import time
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
 
 import httpx
 from httpx import URL
-from tenacity import before_sleep_log
-from tenacity import retry
-from tenacity import retry_if_not_exception_type
-from tenacity import stop_after_attempt
-from tenacity import wait_fixed
 
 from twitchAPI import constants
 from twitchAPI import utils
+from twitchAPI._exceptions import BatchRequestError
+from twitchAPI._exceptions import DeadlineExceededError
+from twitchAPI.cache import ConditionalCache
+from twitchAPI.config import HelixConfig
+from twitchAPI.deadline import Deadline
+from twitchAPI.decoders import get_decoder
+from twitchAPI.loader import BatchLoader
+from twitchAPI.metrics import Metrics
+from twitchAPI.pool import Credential
+from twitchAPI.ratelimit import RateLimiter
+from twitchAPI.retry import CircuitBreaker
+from twitchAPI.retry import RetryPolicy
+from twitchAPI.singleflight import SingleFlight
+from twitchAPI.sync import FollowedSyncResult
+from twitchAPI.transport import TransportConfig
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from twitchAPI._types import HeaderTypes
     from twitchAPI._types import QueryParamTypes
     from twitchAPI._types import TwitchApiResponse
     from twitchAPI.auth import UserAuthenticator
+    from twitchAPI.sync import FollowedSyncState
 
 
 log = logging.getLogger(__name__)
 
 
-@dataclass
 class HelixAPI:
-    def __init__(self, auth: UserAuthenticator) -> None:
+    def __init__(self, auth: UserAuthenticator, config: HelixConfig | None = None) -> None:
         self.auth = auth
+        if not self.auth.ok:
+            self.auth.validation()
+        self.config = config = config or HelixConfig()
+        self.max_concurrency = config.max_concurrency
+        self.rate_limiter = config.rate_limiter or RateLimiter()
+        self.cache = config.cache
+        self.entities = config.entity_cache
+        self.coalesce_window = config.coalesce_window
+        self._loaders: dict[tuple[str, str], BatchLoader] = {}
+        self.singleflight = SingleFlight()
+        self.conditional = config.conditional or ConditionalCache()
+        self.decoder = config.decoder or get_decoder()
         self.base_url = constants.TWITCH_HELIX_BASE_URL
-        self.client = httpx.AsyncClient(headers=self._get_request_headers())
+        self.transport = config.transport or TransportConfig()
+        self.budgets = {**constants.REQUEST_BUDGETS, **(config.budgets or {})}
+        self.retry_policy = config.retry_policy or RetryPolicy()
+        self.breaker = config.breaker or CircuitBreaker()
+        self.metrics = config.metrics or Metrics()
+        self.tokens = config.tokens
+        self.pool = config.pool
+        if self.pool is not None:
+            # requests are sent with the pool's clients, see `_credential`.
+            self.credential = self.pool.credentials[0]
+        else:
+            client = httpx.AsyncClient(headers=self._get_request_headers(), **self.transport.client_kwargs())
+            self.credential = Credential(self.auth, client, self.rate_limiter, self.tokens)
+        self.client = self.credential.client
         self.channels = HelixChannels(api=self)
         self.content = HelixContent(api=self)
 
-    def __post_init__(self) -> None:
-        if not self.auth.ok:
-            self.auth.validation()
-
     def _get_request_headers(self) -> HeaderTypes:
+        if self.tokens is not None:
+            # set on each request instead, see `TokenManager`.
+            return {'Accept': 'application/vnd.twitchtv.v5+json'}
         return {
             'Accept': 'application/vnd.twitchtv.v5+json',
             'Client-ID': self.auth.client_id,
             'Authorization': f'Bearer {self.auth.access_token}',
         }
 
-    def _set_params(self, params: QueryParamTypes, requested_items: int) -> QueryParamTypes:
-        """Sets the parameters for the request."""
+    def _set_params(self, params: QueryParamTypes, requested_items: int | None) -> QueryParamTypes:
+        """Sets the parameters for the request, `None` requests as many items as allowed."""
+        if requested_items is None:
+            requested_items = constants.MAX_ITEMS_PER_REQUEST
         params['first'] = min(constants.MAX_ITEMS_PER_REQUEST, requested_items)
         log.debug('params: %s', params)
         return params
 
+    async def warmup(self, connections: int = 1) -> None:
+        """
+        Opens `connections` connections to Helix ahead of the first real request.
+
+        The TLS handshakes happen here and the connections stay in the pool
+        for `keepalive_expiry` seconds. Errors are logged, not raised.
+        """
+        url = self.base_url
+        clients = [c.client for c in self.pool.credentials] if self.pool is not None else [self.client]
+
+        async def connect(client: httpx.AsyncClient) -> None:
+            try:
+                await client.head(url)
+            except httpx.HTTPError as err:
+                log.warning('warmup: could not connect to %s: %r', url, err)
+
+        await asyncio.gather(*(connect(client) for client in clients for _ in range(connections)))
+        log.debug("warmup: opened connections='%s'", connections)
+
     async def close(self) -> None:
-        """Properly close the HTTPX async client."""
-        if self.client and not self.client.is_closed:
+        """Properly close the HTTPX async client, or those of the `pool`."""
+        if self.pool is not None:
+            await self.pool.close()
+        elif not self.client.is_closed:
             await self.client.aclose()
 
-    async def send_request(self, url: URL, query_params: QueryParamTypes, timeout: int = 5) -> httpx.Response:
-        """Sends a request to the Twitch Helix API."""
-        r = await self.client.get(url, params=query_params, timeout=timeout)
-        r.raise_for_status()
+    def _endpoint(self, url: URL) -> str:
+        """Returns the endpoint of a Helix URL, e.g. `streams/followed`."""
+        base = self.base_url.path
+        return url.path[len(base) :] if url.path.startswith(base) else url.path
+
+    def _credential(self, endpoint: str, query_params: QueryParamTypes) -> Credential:
+        """Returns the credential to send the request with, picked from the `pool` if there is one."""
+        if self.pool is None:
+            return self.credential
+        return self.pool.pick(endpoint, query_params.get('user_id'))
+
+    async def _send_once(
+        self,
+        credential: Credential,
+        url: URL,
+        query_params: QueryParamTypes,
+        timeout: float | httpx.Timeout | None,
+        headers: HeaderTypes | None,
+    ) -> httpx.Response:
+        """
+        Takes a point from the credential's rate limiter and sends the request
+        with its client, recording it in `metrics`.
+        """
+        endpoint = self._endpoint(url)
+        wait_start = time.perf_counter()
+        # counted from the moment it is picked, so concurrent picks see each other.
+        credential.pending += 1
+        try:
+            if credential.tokens is not None:
+                await credential.tokens.ensure_fresh(credential.client, credential.auth)
+                headers = {**(headers or {}), **credential.tokens.headers(credential.auth)}
+            await credential.rate_limiter.acquire()
+        finally:
+            credential.pending -= 1
+        started_at = time.time()
+        start = time.perf_counter()
+        waited = start - wait_start
+        credential.in_flight += 1
+        try:
+            r = await credential.client.get(
+                url,
+                params=query_params,
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                headers=headers,
+            )
+        except httpx.HTTPError as err:
+            credential.errors += 1
+            self.metrics.record_request(endpoint, None, time.perf_counter() - start, waited, error=err)
+            self.metrics.emit('helix.request', started_at, endpoint=endpoint, error=type(err).__name__)
+            raise
+        finally:
+            credential.in_flight -= 1
+            credential.requests += 1
+            credential.busy_seconds += time.perf_counter() - start
+        self.metrics.record_request(endpoint, r, time.perf_counter() - start, waited)
+        self.metrics.record_ratelimit(r.headers.get('Ratelimit-Limit'), r.headers.get('Ratelimit-Remaining'))
+        self.metrics.emit('helix.request', started_at, endpoint=endpoint, status=r.status_code, bytes=len(r.content))
+        credential.rate_limiter.update(r.headers)
+        return r
+
+    async def send_request(
+        self,
+        url: URL,
+        query_params: QueryParamTypes,
+        timeout: float | httpx.Timeout | None = None,
+        headers: HeaderTypes | None = None,
+    ) -> httpx.Response:
+        """
+        Sends a request to the Twitch Helix API.
+
+        `timeout` overrides the timeouts of the `TransportConfig` for this request.
+
+        Every request takes a point from the rate limiter first. A 429 waits until
+        `Ratelimit-Reset` and is sent again, up to `MAX_RETRY_ATTEMPTS` times.
+        A `304 Not Modified` is returned as is, for conditional requests. With a
+        `TokenManager`, a 401 refreshes the token once and is sent again.
+        With a `CredentialPool`, a 429 on a request that isn't user-scoped is
+        sent again right away with the least loaded credential.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open, nothing is sent.
+        """
+        endpoint = self._endpoint(url)
+        self.breaker.before_request(endpoint)
+        refreshed = False
+        try:
+            for attempt in range(1, constants.MAX_RETRY_ATTEMPTS + 1):
+                credential = self._credential(endpoint, query_params)
+                r = await self._send_once(credential, url, query_params, timeout, headers)
+                tokens = credential.tokens
+                if r.status_code == httpx.codes.UNAUTHORIZED and tokens is not None and not refreshed:
+                    refreshed = True
+                    stale_token = r.request.headers.get('Authorization', '').split(' ', 1)[-1]
+                    await tokens.refresh(credential.client, credential.auth, stale_token)
+                    self.metrics.record_retry(endpoint)
+                    continue
+                if r.status_code == httpx.codes.TOO_MANY_REQUESTS:
+                    credential.ratelimited += 1
+                if r.status_code != httpx.codes.TOO_MANY_REQUESTS or attempt == constants.MAX_RETRY_ATTEMPTS:
+                    break
+                self.metrics.record_retry(endpoint)
+                if self.pool is not None and endpoint not in constants.USER_SCOPED_ENDPOINTS:
+                    credential.rate_limiter.block(r.headers)
+                    continue
+                await credential.rate_limiter.wait_for_reset(r.headers)
+        except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError):
+            self.breaker.record_failure(endpoint)
+            raise
+
+        if r.status_code >= httpx.codes.INTERNAL_SERVER_ERROR:
+            self.breaker.record_failure(endpoint)
+        else:
+            self.breaker.record_success(endpoint)
+        if r.status_code != httpx.codes.NOT_MODIFIED:
+            r.raise_for_status()
         return r
 
     def _has_pagination(self, data: TwitchApiResponse) -> bool:
         return data.get('pagination', {}).get('cursor') is not None
 
-    @retry(
-        stop=stop_after_attempt(constants.MAX_RETRY_ATTEMPTS),
-        wait=wait_fixed(constants.RETRY_DELAY),
-        before_sleep=before_sleep_log(log, logging.WARN),
-        retry=retry_if_not_exception_type(httpx.ConnectError),
-    )
+    async def _get_page(
+        self,
+        url: URL,
+        query_params: QueryParamTypes,
+        model: type | None = None,
+    ) -> TwitchApiResponse:
+        """
+        Fetches and decodes a single page.
+
+        With a `model`, the page items are decoded into instances of it. Pages
+        seen before are requested conditionally, a 304 reuses the stored body
+        without decoding it again.
+        """
+        key = self.conditional.key(url, query_params, model)
+        # held until the response is in, the entry may be evicted meanwhile.
+        validators = self.conditional.get(key)
+        headers = validators.headers() if validators is not None else None
+        response = await self.send_request(url, query_params, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and validators is not None:
+            return self.conditional.revalidated(key, validators)
+
+        if model is None:
+            start = time.perf_counter()
+            data = self.decoder.decode(response.content)
+            decode_seconds, model_seconds = time.perf_counter() - start, 0.0
+        else:
+            data, decode_seconds, model_seconds = self.decoder.decode_page_timed(response.content, model)
+        self.metrics.record_decode(self._endpoint(url), decode_seconds, model_seconds)
+        self.conditional.store(key, response, data, decode_seconds + model_seconds)
+        return data
+
+    async def _fetch_page(
+        self,
+        endpoint_url: URL,
+        query_params: QueryParamTypes,
+        model: type | None = None,
+    ) -> TwitchApiResponse:
+        """Returns a page from the response cache if enabled and fresh, fetching it otherwise."""
+        endpoint = str(endpoint_url)
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, query_params, model)
+            if cached is not None:
+                return dict(cached)
+
+        # only this page is sent again on a retryable failure, see `RetryPolicy`.
+        page = await self.retry_policy.call(
+            self._get_page,
+            self.base_url.join(endpoint_url),
+            query_params,
+            model,
+            on_retry=lambda _: self.metrics.record_retry(endpoint),
+        )
+        if self.cache is not None:
+            self.cache.set(endpoint, query_params, page, model)
+        return dict(page)
+
+    async def paginate(
+        self,
+        endpoint_url: URL,
+        params: QueryParamTypes,
+        max_items: int | None = constants.DEFAULT_REQUESTED_ITEMS,
+        model: type | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[TwitchApiResponse]:
+        """
+        Walks the cursor of a paginated endpoint, yielding each page as soon as it is decoded.
+
+        Each yielded page has its `data` trimmed so that no more than `max_items`
+        items are produced in total, `None` walks until the last page. The
+        caller's `params` are left untouched, an `after` cursor in them is
+        where the walk starts. With a `model`, items are decoded into it.
+
+        Raises:
+            DeadlineExceededError: If `deadline` passed, the page in flight
+            (with its retries and rate limit waits) is cancelled.
+        """
+        cursor = params.get('after')
+        items_collected = 0
+        pages = 0
+        started_at = time.time()
+
+        try:
+            while max_items is None or items_collected < max_items:
+                remaining_items = None if max_items is None else max_items - items_collected
+                # a new dict per page, the caller's params and earlier pages' params are left as they were.
+                query_params = self._set_params(dict(params), remaining_items)
+                if cursor is not None:
+                    query_params['after'] = cursor
+                fetch = self._fetch_page(endpoint_url, query_params, model)
+                page = await (fetch if deadline is None else deadline.run(fetch))
+                pages += 1
+                if remaining_items is not None and len(page['data']) > remaining_items:
+                    page = {**page, 'data': page['data'][:remaining_items]}
+                items_collected += len(page['data'])
+                yield page
+
+                if not page['data'] or not self._has_pagination(page):
+                    return
+                cursor = page['pagination']['cursor']
+        finally:
+            endpoint = str(endpoint_url)
+            self.metrics.record_walk(endpoint, pages)
+            self.metrics.emit('helix.walk', started_at, endpoint=endpoint, pages=pages, items=items_collected)
+
+    async def iter_items(
+        self,
+        endpoint_url: URL,
+        params: QueryParamTypes,
+        max_items: int | None = constants.DEFAULT_REQUESTED_ITEMS,
+        model: type | None = None,
+    ) -> AsyncIterator[Any]:
+        """Same as `paginate`, but yields the items of each page one by one."""
+        async for page in self.paginate(endpoint_url, params, max_items=max_items, model=model):
+            for item in page['data']:
+                yield item
+
     async def request_get(
         self,
         endpoint_url: URL,
         params: QueryParamTypes,
-        max_items: int = constants.DEFAULT_REQUESTED_ITEMS,
-        items_collected: int = 0,
+        max_items: int | None = constants.DEFAULT_REQUESTED_ITEMS,
+        model: type | None = None,
+        budget: float | None = None,
     ) -> TwitchApiResponse:
-        # TODO: this method handles `pagination`, remove the logic?
-        # If pagination is needed, maybe, it should be handled externally.
-        url = self.base_url.join(endpoint_url)
-        query_params_dict = self._set_params(params, max_items)
-        response = await self.send_request(url, query_params_dict, timeout=10)
-        data = response.json()
-        items_collected += len(data['data'])
-
-        if not self._has_pagination(data):
-            return data
-
-        if max_items >= items_collected:
-            next_cursor = data['pagination']['cursor']
-            remaining_items = max_items - items_collected
-
-            params['after'] = next_cursor
-            params['first'] = min(constants.MAX_ITEMS_PER_REQUEST, remaining_items)
-            more_data = await self.request_get(
-                endpoint_url=endpoint_url,
-                params=params,
-                max_items=max_items,
-                items_collected=items_collected,
-            )
-            data['data'].extend(more_data['data'][:remaining_items])
+        """
+        Send a GET request, following the cursor until `max_items` are collected.
+
+        With a `model`, the items in `data` are instances of it. Concurrent calls
+        with the same arguments share a single walk and get back the same
+        response object, treat it as read-only.
+
+        The whole walk, pages, retries and rate limit waits included, has to be
+        done within `budget` seconds (defaults to the endpoint's entry in
+        `budgets`, `math.inf` for none). Once it is spent the walk stops and
+        raises, a caller that can use a partial list takes it from the error.
+
+        Raises:
+            DeadlineExceededError: If the budget was spent; it carries the items
+            collected so far and the `pagination` cursor to resume from.
+        """
+        endpoint = str(endpoint_url)
+        if budget is None:
+            budget = self.budgets.get(endpoint)
+        key = (endpoint, utils.normalize_params(params), max_items, model, budget)
+        return await self.singleflight.do(
+            key,
+            lambda: self._collect(endpoint_url, dict(params), max_items, model, Deadline.after(budget)),
+        )
+
+    async def _collect(
+        self,
+        endpoint_url: URL,
+        params: QueryParamTypes,
+        max_items: int | None,
+        model: type | None,
+        deadline: Deadline | None = None,
+    ) -> TwitchApiResponse:
+        data: list[Any] = []
+        pagination: dict[str, Any] = {}
+        try:
+            async for page in self.paginate(endpoint_url, params, max_items=max_items, model=model, deadline=deadline):
+                data.extend(page['data'])
+                pagination = page.get('pagination', {})
+        except DeadlineExceededError as err:
+            log.warning("endpoint='%s' ran out of its %ss budget, items len='%s'", endpoint_url, err.budget, len(data))
+            raise DeadlineExceededError(err.budget, data, pagination) from err
+        return {'data': data, 'pagination': pagination}
+
+    async def request_batches(
+        self,
+        endpoint_url: URL,
+        param_name: str,
+        ids: list[str],
+        max_concurrency: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Looks up `ids` in batches of `MAX_ITEMS_PER_REQUEST`, sending the batches concurrently.
+
+        At most `max_concurrency` batches are in flight at once (defaults to the
+        limit given to `HelixAPI`). Items are returned in batch order.
+
+        Raises:
+            BatchRequestError: If any batch failed; it carries the items of the
+            batches that succeeded and the error of each one that did not.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def fetch(batch: list[str]) -> list[dict[str, Any]]:
+            async with semaphore:
+                response = await self.request_get(endpoint_url, {param_name: batch})
+                return response.get('data', [])
+
+        batches = utils.group_into_batches(ids, constants.MAX_ITEMS_PER_REQUEST)
+        results = await asyncio.gather(*(fetch(batch) for batch in batches), return_exceptions=True)
+
+        data: list[dict[str, Any]] = []
+        errors: dict[int, BaseException] = {}
+        for idx, result in enumerate(results):
+            if isinstance(result, BaseException):
+                log.warning("batch idx='%s' for endpoint='%s' failed: %r", idx, endpoint_url, result)
+                errors[idx] = result
+                continue
+            data.extend(result)
+
+        if errors:
+            raise BatchRequestError(data, errors)
+        return data
+
+    async def request_entities(
+        self,
+        endpoint_url: URL,
+        param_name: str,
+        ids: list[str],
+        id_field: str = 'id',
+    ) -> list[dict[str, Any]]:
+        """
+        Looks up entities by ID, only fetching the IDs missing from the entity cache.
+
+        The result follows the order of `ids`; IDs Helix did not return are left out.
+
+        Raises:
+            BatchRequestError: If any batch failed; its `data` holds every entity
+            that could be resolved, cached or fetched, in input order.
+        """
+        if self.entities is None:
+            return await self.request_batches(endpoint_url, param_name, ids)
+
+        endpoint = str(endpoint_url)
+        found, missing = self.entities.get_many(endpoint, ids)
+        log.debug("entities: endpoint='%s' cached='%s' missing='%s'", endpoint, len(found), len(missing))
+
+        error: BatchRequestError | None = None
+        fetched: list[dict[str, Any]] = []
+        if missing:
+            try:
+                fetched = await self.request_batches(endpoint_url, param_name, missing)
+            except BatchRequestError as err:
+                error, fetched = err, err.data
+
+        self.entities.set_many(endpoint, fetched, id_field=id_field)
+        found.update((entity[id_field], entity) for entity in fetched)
+        data = [found[entity_id] for entity_id in ids if entity_id in found]
+
+        if error is not None:
+            raise BatchRequestError(data, error.errors) from error
         return data
 
-    @retry(
-        stop=stop_after_attempt(constants.MAX_RETRY_ATTEMPTS),
-        wait=wait_fixed(constants.RETRY_DELAY),
-        before_sleep=before_sleep_log(log, logging.WARN),
-        retry=retry_if_not_exception_type(httpx.ConnectError),
-    )
+    def loader(self, endpoint_url: URL, param_name: str, id_field: str = 'id') -> BatchLoader:
+        """
+        Returns the shared `BatchLoader` for an ID-based endpoint.
+
+        Lookups from concurrent callers within `coalesce_window` seconds (one
+        event-loop tick by default) go out together through `request_entities`.
+        """
+        key = (str(endpoint_url), param_name)
+        if key not in self._loaders:
+
+            async def batch_fn(ids: list[str]) -> list[dict[str, Any]]:
+                return await self.request_entities(endpoint_url, param_name, ids, id_field=id_field)
+
+            self._loaders[key] = BatchLoader(batch_fn, id_field=id_field, window=self.coalesce_window)
+        return self._loaders[key]
+
     async def request_get_no_pagination(
         self,
         endpoint_url: URL,
@@ -120,8 +512,16 @@ class HelixAPI:
         """Send a GET request and return the JSON response."""
         url = self.base_url.join(endpoint_url)
         query_params_dict = self._set_params(params, max_items)
-        response = await self.send_request(url, query_params_dict, timeout=10)
-        return response.json()
+        response = await self.retry_policy.call(
+            self.send_request,
+            url,
+            query_params_dict,
+            on_retry=lambda _: self.metrics.record_retry(str(endpoint_url)),
+        )
+        start = time.perf_counter()
+        data = self.decoder.decode(response.content)
+        self.metrics.record_decode(str(endpoint_url), time.perf_counter() - start)
+        return data
 
 
 class HelixContent:
@@ -132,8 +532,8 @@ class HelixContent:
     #     if not self.api.credentials.ok:
     #         self.api.credentials.validation()
 
-    async def clips(self, user_id: str) -> list[dict[str, Any]]:
-        """Gets one or more video clips that were captured from streams."""
+    async def clips(self, user_id: str, model: type | None = None) -> list[Any]:
+        """Gets one or more video clips that were captured from streams, decoded into `model` if given."""
         # https://dev.twitch.tv/docs/api/reference#get-clips
         endpoint = URL('clips')
         params = {'broadcaster_id': user_id, 'is_featured': True}
@@ -141,19 +541,86 @@ class HelixContent:
             endpoint,
             params,
             max_items=constants.MAX_ITEMS_PER_REQUEST,
+            model=model,
         )
         data = response['data']
         log.info("got user_id='%s' clips len='%s'", user_id, len(data))
         return data
 
-    async def videos(self, user_id: str) -> list[dict[str, Any]]:
+    async def clips_backfill(
+        self,
+        user_id: str,
+        started_at: datetime,
+        ended_at: datetime,
+        windows: int = constants.BACKFILL_WINDOWS,
+        model: type | None = None,
+    ) -> list[Any]:
+        """
+        Gets every clip of a broadcaster created within `[started_at, ended_at)`.
+
+        The range is split into `windows` windows that are fetched concurrently,
+        within the `HelixAPI` concurrency limit. A window whose first page is
+        full and has more after it is split in half right away, down to
+        `BACKFILL_MIN_WINDOW` seconds; a window that small is paged through,
+        up to `BACKFILL_DENSE_WINDOW` clips. Clips are merged and deduplicated by ID,
+        oldest first.
+        """
+        # https://dev.twitch.tv/docs/api/reference#get-clips
+        endpoint = URL('clips')
+        semaphore = asyncio.Semaphore(self._api.max_concurrency)
+        clips: dict[str, Any] = {}
+
+        def clip_id(clip: Any) -> str:
+            return clip['id'] if isinstance(clip, dict) else clip.id
+
+        async def fetch(start: datetime, end: datetime) -> None:
+            params = {
+                'broadcaster_id': user_id,
+                'started_at': utils.format_timestamp(start),
+                'ended_at': utils.format_timestamp(end),
+            }
+            span = end - start
+            splittable = span.total_seconds() >= 2 * constants.BACKFILL_MIN_WINDOW
+            # a window that can still be split only gets one page, paging further would be refetched by its halves.
+            max_items = constants.MAX_ITEMS_PER_REQUEST if splittable else constants.BACKFILL_DENSE_WINDOW
+            async with semaphore:
+                response = await self._api.request_get(endpoint, params, max_items=max_items, model=model)
+            data = response['data']
+            clips.update((clip_id(clip), clip) for clip in data)
+
+            if splittable and len(data) >= max_items and response['pagination'].get('cursor') is not None:
+                log.debug("clips_backfill: window='%s' too dense, splitting", span)
+                middle = start + span / 2
+                await asyncio.gather(fetch(start, middle), fetch(middle, end))
+
+        step = (ended_at - started_at) / max(windows, 1)
+        bounds = [started_at + step * i for i in range(windows)] + [ended_at]
+        await asyncio.gather(*(fetch(bounds[i], bounds[i + 1]) for i in range(windows)))
+
+        def created_at(clip: Any) -> str:
+            return clip['created_at'] if isinstance(clip, dict) else clip.created_at
+
+        data = sorted(clips.values(), key=created_at)
+        log.info("got user_id='%s' backfilled clips len='%s'", user_id, len(data))
+        return data
+
+    async def videos(
+        self,
+        user_id: str,
+        period: str = 'week',
+        video_type: str = 'archive',
+        max_items: int | None = 50,
+        model: type | None = None,
+    ) -> list[Any]:
         """
         Gets information about one or more published videos.
 
         Args:
             user_id (str): The ID of the user.
-            highlight (bool, optional): A flag indicating whether to retrieve
-            only highlights (default is False).
+            period (str, optional): One of `all`, `day`, `month` or `week` (default).
+            video_type (str, optional): One of `all`, `archive` (default), `highlight` or `upload`.
+            max_items (int | None, optional): The maximum number of videos, None for all of them.
+            model (type, optional): The model to decode the videos into.
 
         Returns:
             TwitchChannelVideos: An iterable containing information about the
@@ -164,15 +631,15 @@ class HelixContent:
         endpoint = URL('videos')
         params = {
             'user_id': user_id,
-            'period': 'week',
-            'type': 'archive',
+            'period': period,
+            'type': video_type,
         }
-        response = await self._api.request_get(endpoint, params, max_items=50)
+        response = await self._api.request_get(endpoint, params, max_items=max_items, model=model)
         data = response['data']
         log.info("got user_id='%s' videos len='%s'", user_id, len(data))
         return data
 
-    async def search_categories(self, query: str) -> list[Any]:
+    async def search_categories(self, query: str, model: type | None = None) -> list[Any]:
         """
         Gets the games or categories that match the specified query.
         """
@@ -180,7 +647,7 @@ class HelixContent:
         log.debug(f"searching for categories with query='{query}'")
         endpoint = URL('search/categories')
         params = {'query': query}
-        response = await self._api.request_get(endpoint, params)
+        response = await self._api.request_get(endpoint, params, model=model)
         return response['data']
 
     async def games_info(self, game_ids: list[str]) -> list[dict[str, Any]]:
@@ -188,23 +655,27 @@ class HelixContent:
         Gets information about specified categories or games.
         """
         # https://dev.twitch.tv/docs/api/reference/#get-games
-        data: list[dict[str, Any]] = []
         endpoint = URL('games')
-        for batch in utils.group_into_batches(game_ids, constants.MAX_ITEMS_PER_REQUEST):
-            response = await self._api.request_get(endpoint, {'id': batch})
-            data.extend(response.get('data', []))
+        data = await self._api.loader(endpoint, 'id').load_many(game_ids)
         log.debug("games_info_len='%s'", len(data))
         return data
 
-    async def top_games(self, items_max: int = constants.MAX_ITEMS_PER_REQUEST) -> dict[str, Any]:
+    async def top_games(self, items_max: int = constants.MAX_ITEMS_PER_REQUEST) -> list[dict[str, Any]]:
         """
         Gets information about all broadcasts on Twitch.
         """
         # https://dev.twitch.tv/docs/api/reference/#get-top-games
+        data = [game async for game in self.iter_top_games(items_max)]
+        log.debug("top_games_len='%s'", len(data))
+        return data
+
+    def iter_top_games(self, items_max: int = constants.MAX_ITEMS_PER_REQUEST) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yields the top games one by one, fetching the next page only when needed.
+        """
+        # https://dev.twitch.tv/docs/api/reference/#get-top-games
         endpoint = URL('games/top')
-        response = await self._api.request_get(endpoint, params={}, max_items=items_max)
-        log.debug("top_games_len='%s'", len(response['data']))
-        return response['data']
+        return self._api.iter_items(endpoint, params={}, max_items=items_max)
 
 
 class HelixChannels:
@@ -218,10 +689,13 @@ class HelixChannels:
     def __init__(self, api: HelixAPI) -> None:
         self._api = api
 
-    async def streams(self) -> list[dict[str, Any]]:
+    async def streams(self, model: type | None = None) -> list[Any]:
         """
         Gets a list of live streams of broadcasters that the specified user follows.
 
+        Args:
+            model (type, optional): The model to decode the streams into.
+
         Returns:
             TwitchStreams: A list of live streams.
         """
@@ -230,33 +704,100 @@ class HelixChannels:
         log.debug(f'getting a list of live streams, max={max_followed_streams}')
         endpoint = URL('streams/followed')
         params = {'user_id': self._api.auth.user_id}
-        response = await self._api.request_get(endpoint, params, max_items=max_followed_streams)
+        response = await self._api.request_get(endpoint, params, max_items=max_followed_streams, model=model)
         return response['data']
 
-    async def all(self) -> list[dict[str, Any]]:
+    async def all(
+        self,
+        max_items: int | None = constants.MAX_FOLLOWED_CHANNELS,
+        model: type | None = None,
+    ) -> list[Any]:
         """
         Gets a list of broadcasters that the specified user follows.
+
+        Pass `max_items=None` to walk the whole list.
         """
         # https://dev.twitch.tv/docs/api/reference/#get-followed-channels
-        max_followed_channels = 500
-        log.debug(f'getting list that user follows, max={max_followed_channels}')
+        log.debug(f'getting list that user follows, max={max_items}')
         endpoint = URL('channels/followed')
         params = {'user_id': self._api.auth.user_id}
-        response = await self._api.request_get(endpoint, params, max_items=max_followed_channels)
+        response = await self._api.request_get(endpoint, params, max_items=max_items, model=model)
         return response['data']
 
-    async def ids(self) -> list[int]:
+    async def ids(self, max_items: int | None = constants.MAX_FOLLOWED_CHANNELS) -> list[int]:
         """
         Gets a list of broadcasters's ids that the specified user follows.
+
+        Pass `max_items=None` to walk the whole list.
         """
         # https://dev.twitch.tv/docs/api/reference/#get-followed-channels
-        max_followed_channels = 500
-        log.debug(f'getting list that user follows, max={max_followed_channels}')
+        log.debug(f'getting list that user follows, max={max_items}')
         endpoint = URL('channels/followed')
         params = {'user_id': self._api.auth.user_id}
-        response = await self._api.request_get(endpoint, params, max_items=max_followed_channels)
+        response = await self._api.request_get(endpoint, params, max_items=max_items)
         return [c['broadcaster_id'] for c in response['data']]
 
+    async def sync_followed(
+        self,
+        state: FollowedSyncState,
+        full: bool = False,
+        on_page: Callable[[list[dict[str, Any]]], Awaitable[None]] | None = None,
+    ) -> FollowedSyncResult:
+        """
+        Brings `state` up to date with the broadcasters the user follows.
+
+        Helix lists follows newest first, so an incremental sync stops at the
+        first broadcaster already in `state`, usually after a single request.
+        A full resync walks the whole list without a cap, resuming from
+        `state.cursor` if a previous one was interrupted, and also reports
+        the broadcasters that were unfollowed.
+
+        During a full resync, `on_page` is awaited after each page with the
+        follows it added, once `state` holds them along with the cursor after
+        them. Persisting both there lets an interrupted resync resume without
+        losing the follows it had already found.
+        """
+        # https://dev.twitch.tv/docs/api/reference/#get-followed-channels
+        endpoint = URL('channels/followed')
+        params: dict[str, Any] = {'user_id': self._api.auth.user_id}
+        result = FollowedSyncResult()
+
+        if not full:
+            async for item in self._api.iter_items(endpoint, params, max_items=None):
+                if state.is_known(item):
+                    break
+                result.added.append(item)
+            state.add(result.added)
+            log.debug("sync_followed: added='%s'", len(result.added))
+            return result
+
+        if state.cursor:
+            params['after'] = state.cursor
+        else:
+            state.resync_ids = set()
+            state.resync_added = []
+        async for page in self._api.paginate(endpoint, params, max_items=None):
+            added = []
+            for item in page['data']:
+                broadcaster_id = item['broadcaster_id']
+                if broadcaster_id not in state.known_ids and broadcaster_id not in state.resync_ids:
+                    added.append(item)
+                state.resync_ids.add(broadcaster_id)
+            state.resync_added.extend(added)
+            state.cursor = page.get('pagination', {}).get('cursor')
+            if on_page is not None:
+                await on_page(added)
+
+        result.added = state.resync_added
+        result.removed = sorted(state.known_ids - state.resync_ids)
+        state.known_ids = state.resync_ids
+        state.resync_ids = set()
+        state.resync_added = []
+        state.cursor = None
+        state.add(result.added)
+        log.debug("sync_followed: full added='%s' removed='%s'", len(result.added), len(result.removed))
+        return result
+
     async def info(self, user_id: str) -> list[dict[str, Any]]:
         """
         Fetches information about one channel.
@@ -274,25 +815,17 @@ class HelixChannels:
         """
         # https://dev.twitch.tv/docs/api/reference/#get-users
         log.debug(f'getting information about a {login_ids=}')
-        data: list[dict[str, Any]] = []
         endpoint = URL('users')
-        for batch in utils.group_into_batches(login_ids, constants.MAX_ITEMS_PER_REQUEST):
-            response = await self._api.request_get(endpoint, {'id': batch})
-            data.extend(response.get('data', []))
-        return data
+        return await self._api.loader(endpoint, 'id').load_many(login_ids)
 
     async def info_ids(self, broadcaster_ids: list[str]) -> list[dict[str, Any]]:
         """
         Gets information about more channels.
         """
         # https://dev.twitch.tv/docs/api/reference#get-channel-information
-        data: list[dict[str, Any]] = []
         endpoint = URL('channels')
-
-        for batch in utils.group_into_batches(broadcaster_ids, constants.MAX_ITEMS_PER_REQUEST):
-            response = await self._api.request_get(endpoint, {'broadcaster_id': batch})
-            data.extend(response.get('data', []))
-        return data
+        loader = self._api.loader(endpoint, 'broadcaster_id', id_field='broadcaster_id')
+        return await loader.load_many(broadcaster_ids)
 
     async def search(self, query: str, live_only: bool = True) -> list[dict[str, Any]]:
         """
@@ -310,23 +843,42 @@ class HelixChannels:
         self,
         game_id: int,
         max_items: int = constants.DEFAULT_REQUESTED_ITEMS,
+        model: type | None = None,
     ) -> list[Any]:
         """
         Gets a list of all streams.
         """
         # https://dev.twitch.tv/docs/api/reference/#get-streams
+        return [stream async for stream in self.iter_streams_by_game_id(game_id, max_items, model=model)]
+
+    def iter_streams_by_game_id(
+        self,
+        game_id: int,
+        max_items: int | None = constants.DEFAULT_REQUESTED_ITEMS,
+        model: type | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Yields the streams of a game one by one, fetching the next page only when needed.
+        """
+        # https://dev.twitch.tv/docs/api/reference/#get-streams
         log.debug(f"getting streams from game_id='{game_id}'")
         endpoint = URL('streams')
         params = {'game_id': game_id}
-        response = await self._api.request_get(endpoint, params, max_items=max_items)
-        return response['data']
+        return self._api.iter_items(endpoint, params, max_items=max_items, model=model)
 
-    async def top_streams(self) -> dict[str, Any]:
+    async def top_streams(self, max_items: int = constants.MAX_ITEMS_PER_REQUEST) -> list[dict[str, Any]]:
         """
         Gets a list of all streams.
         """
         # https://dev.twitch.tv/docs/api/reference/#get-streams
+        data = [stream async for stream in self.iter_top_streams(max_items)]
+        log.debug("top_streams_len='%s'", len(data))
+        return data
+
+    def iter_top_streams(self, max_items: int = constants.MAX_ITEMS_PER_REQUEST) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yields the most watched streams one by one, fetching the next page only when needed.
+        """
+        # https://dev.twitch.tv/docs/api/reference/#get-streams
         endpoint = URL('streams')
-        response = await self._api.request_get(endpoint, params={}, max_items=100)
-        log.debug("top_streams_len='%s'", len(response['data']))
-        return response['data']
+        return self._api.iter_items(endpoint, params={}, max_items=max_items)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
-
-from dotenv import load_dotenv
-from pydantic import BaseModel
+from typing import Any
+from typing import Iterable
 
 from twitchAPI._exceptions import EnvValidationError
 
@@ -27,6 +28,8 @@ def _validate_credentials(credentials: dict[str, str]) -> None:
 
 def load_envs(filepath: str | None = None) -> None:
     """Load envs if path"""
+    from dotenv import load_dotenv
+
     if not filepath:
         log.info('env: no env filepath specified')
         log.info('env: loading from .env or exported env vars')
@@ -45,7 +48,8 @@ def load_envs(filepath: str | None = None) -> None:
     load_dotenv(dotenv_path=envfilepath.as_posix())
 
 
-class UserAuthenticator(BaseModel):
+@dataclass
+class UserAuthenticator:
     """
     A class to handle user authentication for accessing Twitch API.
 
@@ -54,23 +58,42 @@ class UserAuthenticator(BaseModel):
         client_id (str | None): The client ID for the Twitch application.
         user_id (str | None): The user ID associated with the Twitch account.
         ok (bool): A flag indicating whether the credentials are valid. Default is False.
+        refresh_token (str | None): The refresh token, needed to refresh an expired access token.
+        client_secret (str | None): The client secret of the Twitch application, needed to refresh.
 
     Methods:
         validation(): Validates the credentials by checking the environment variables.
         load(file: str | None): Loads environment variables from a file and initializes
                                 the class with the loaded credentials.
+        model_dump()/dict(): The fields as a dict, like the pydantic model this used to be.
     """
 
     access_token: str | None
     client_id: str | None
     user_id: str | None
     ok: bool = False
+    refresh_token: str | None = None
+    client_secret: str | None = None
 
     def validation(self) -> None:
         log.debug('validating envs')
-        _validate_credentials(self.dict(exclude={'ok'}))
+        _validate_credentials(self.model_dump(include={'access_token', 'client_id', 'user_id'}))
         self.ok = True
 
+    @classmethod
+    def model_validate(cls, data: dict[str, Any]) -> UserAuthenticator:
+        """Builds one from a dict, keys that are not fields are ignored."""
+        return cls(**{f.name: data[f.name] for f in dataclasses.fields(cls) if f.name in data})
+
+    def model_dump(self, include: Iterable[str] | None = None, exclude: Iterable[str] = ()) -> dict[str, Any]:
+        fields = [f.name for f in dataclasses.fields(self)]
+        if include is not None:
+            fields = [name for name in fields if name in include]
+        return {name: getattr(self, name) for name in fields if name not in exclude}
+
+    # the pydantic v1 name, kept for callers that still use it.
+    dict = model_dump
+
     @classmethod
     def load(cls, file: str | None = None) -> UserAuthenticator:
         load_envs(file)
@@ -78,4 +101,6 @@ class UserAuthenticator(BaseModel):
             access_token=os.environ.get('TWITCH_ACCESS_TOKEN'),
             client_id=os.environ.get('TWITCH_CLIENT_ID'),
             user_id=os.environ.get('TWITCH_USER_ID'),
+            refresh_token=os.environ.get('TWITCH_REFRESH_TOKEN'),
+            client_secret=os.environ.get('TWITCH_CLIENT_SECRET'),
         )
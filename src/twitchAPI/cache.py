@@ -0,0 +1,269 @@
+# cache.py
+from __future__ import annotations
+
+import abc
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Hashable
+from typing import Mapping
+
+from twitchAPI import constants
+from twitchAPI import utils
+
+if TYPE_CHECKING:
+    import httpx
+
+log = logging.getLogger(__name__)
+
+
+class CacheStore(abc.ABC):
+    """
+    Interface for the storage behind `ResponseCache`.
+
+    A store only keeps values until they expire, eviction policy and
+    serialization are up to the backend.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the value for `key`, or None if missing or expired."""
+
+    @abc.abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Stores `value` under `key` for `ttl` seconds."""
+
+    @abc.abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Removes `key` if present."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes every entry."""
+
+    @abc.abstractmethod
+    def __len__(self) -> int: ...
+
+
+class MemoryCacheStore(CacheStore):
+    """In-process store with per-entry expiry and LRU eviction past `max_entries`."""
+
+    def __init__(self, max_entries: int = constants.CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Caches decoded Helix responses keyed by endpoint and normalized query params.
+
+    Only endpoints with a TTL in `ttls` are cached (defaults to `CACHE_TTLS`).
+    """
+
+    def __init__(
+        self,
+        store: CacheStore | None = None,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        self.store = store if store is not None else MemoryCacheStore()
+        self.ttls = dict(constants.CACHE_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, endpoint: str, params: Mapping[str, Any], model: type | None = None) -> Hashable:
+        return (endpoint, utils.normalize_params(params), model)
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, 0)
+
+    def get(self, endpoint: str, params: Mapping[str, Any], model: type | None = None) -> Mapping[str, Any] | None:
+        if not self.ttl(endpoint):
+            return None
+        value = self.store.get(self._key(endpoint, params, model))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        log.debug("cache: hit endpoint='%s'", endpoint)
+        return value
+
+    def set(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        value: Mapping[str, Any],
+        model: type | None = None,
+    ) -> None:
+        ttl = self.ttl(endpoint)
+        if ttl:
+            self.store.set(self._key(endpoint, params, model), value, ttl)
+
+    def invalidate(self, endpoint: str, params: Mapping[str, Any], model: type | None = None) -> None:
+        self.store.delete(self._key(endpoint, params, model))
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.store)}
+
+
+class EntityCache:
+    """
+    Caches Helix entities one by one, keyed by endpoint and entity ID.
+
+    Unlike `ResponseCache`, lookups with different ID sets share entries, so a
+    batched lookup only needs to fetch the IDs that are not cached yet.
+    """
+
+    def __init__(
+        self,
+        store: CacheStore | None = None,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        self.store = store if store is not None else MemoryCacheStore(constants.ENTITY_CACHE_MAX_ENTRIES)
+        self.ttls = dict(constants.ENTITY_CACHE_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, endpoint: str, ids: list[str]) -> tuple[dict[str, dict[str, Any]], list[str]]:
+        """Returns the cached entities by ID and the unique IDs that are missing, in input order."""
+        found: dict[str, dict[str, Any]] = {}
+        missing: dict[str, None] = {}
+        for entity_id in ids:
+            if entity_id in found or entity_id in missing:
+                continue
+            entity = self.store.get((endpoint, entity_id))
+            if entity is None:
+                missing[entity_id] = None
+            else:
+                found[entity_id] = entity
+        self.hits += len(found)
+        self.misses += len(missing)
+        return found, list(missing)
+
+    def set_many(self, endpoint: str, entities: list[dict[str, Any]], id_field: str = 'id') -> None:
+        ttl = self.ttls.get(endpoint, 0)
+        if not ttl:
+            return
+        for entity in entities:
+            self.store.set((endpoint, entity[id_field]), entity, ttl)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.store)}
+
+
+@dataclass
+class Validators:
+    """Validators of a stored response and the body they vouch for."""
+
+    etag: str | None
+    last_modified: str | None
+    body: dict[str, Any]
+    size: int
+    decode_seconds: float
+
+    def headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """
+    Keeps `ETag`/`Last-Modified` validators and decoded bodies for conditional requests.
+
+    Only responses that carry a validator are stored, so endpoints that never
+    send one cost nothing. On a `304 Not Modified` the stored body is reused
+    without decoding JSON again, and the bytes and decode time saved are counted.
+    """
+
+    def __init__(self, max_entries: int = constants.CONDITIONAL_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Validators] = OrderedDict()
+        self.not_modified = 0
+        self.bytes_saved = 0
+        self.decode_seconds_saved = 0.0
+
+    def key(self, url: httpx.URL, params: Mapping[str, Any], model: type | None = None) -> Hashable:
+        return (str(url), utils.normalize_params(params), model)
+
+    def get(self, key: Hashable) -> Validators | None:
+        return self._entries.get(key)
+
+    def headers(self, key: Hashable) -> dict[str, str]:
+        validators = self._entries.get(key)
+        return validators.headers() if validators else {}
+
+    def _put(self, key: Hashable, validators: Validators) -> None:
+        self._entries[key] = validators
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def store(self, key: Hashable, response: httpx.Response, body: dict[str, Any], decode_seconds: float) -> None:
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        self._put(key, Validators(etag, last_modified, body, len(response.content), decode_seconds))
+
+    def revalidated(self, key: Hashable, validators: Validators) -> dict[str, Any]:
+        """
+        Returns the body of `validators` after a 304 and counts what it saved.
+
+        `validators` are the ones the request was sent with, they are stored
+        again in case the entry was evicted while the request was in flight.
+        """
+        self._put(key, validators)
+        self.not_modified += 1
+        self.bytes_saved += validators.size
+        self.decode_seconds_saved += validators.decode_seconds
+        log.debug("conditional: not modified key='%s'", key)
+        return validators.body
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def stats(self) -> dict[str, float]:
+        return {
+            'not_modified': self.not_modified,
+            'bytes_saved': self.bytes_saved,
+            'decode_seconds_saved': self.decode_seconds_saved,
+            'entries': len(self._entries),
+        }
@@ -0,0 +1,59 @@
+# config.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from twitchAPI import constants
+
+if TYPE_CHECKING:
+    from twitchAPI.cache import ConditionalCache
+    from twitchAPI.cache import EntityCache
+    from twitchAPI.cache import ResponseCache
+    from twitchAPI.decoders import Decoder
+    from twitchAPI.metrics import Metrics
+    from twitchAPI.pool import CredentialPool
+    from twitchAPI.ratelimit import RateLimiter
+    from twitchAPI.retry import CircuitBreaker
+    from twitchAPI.retry import RetryPolicy
+    from twitchAPI.tokens import TokenManager
+    from twitchAPI.transport import TransportConfig
+
+
+@dataclass(frozen=True)
+class HelixConfig:
+    """
+    Optional settings and collaborators of a `HelixAPI`, anything left as None gets its default.
+
+    Attributes:
+        max_concurrency (int): The most requests `request_batches` and fan-outs send at once.
+        coalesce_window (float): Seconds lookups from concurrent callers are batched for. Defaults to 0.
+        budgets (dict[str, float] | None): Seconds a `request_get` of each endpoint may take,
+        merged over `REQUEST_BUDGETS`.
+        transport (TransportConfig | None): Connection pool, HTTP/2 and timeout settings.
+        rate_limiter (RateLimiter | None): The token bucket every request takes a point from.
+        cache (ResponseCache | None): Caches whole pages, by endpoint TTL. Defaults to no cache.
+        entity_cache (EntityCache | None): Caches single users, games and channels. Defaults to no cache.
+        conditional (ConditionalCache | None): Keeps ETags for conditional requests.
+        decoder (Decoder | None): Decodes response bodies, the fastest installed one by default.
+        retry_policy (RetryPolicy | None): Which failed pages are sent again, and when.
+        breaker (CircuitBreaker | None): Fails requests to an endpoint fast while it keeps failing.
+        metrics (Metrics | None): Per-endpoint counters of the requests sent.
+        tokens (TokenManager | None): Validates and refreshes the access token. Defaults to a fixed token.
+        pool (CredentialPool | None): Credentials to spread requests over, closed by `HelixAPI.close`.
+    """
+
+    max_concurrency: int = constants.MAX_CONCURRENT_REQUESTS
+    coalesce_window: float = 0.0
+    budgets: dict[str, float] | None = None
+    transport: TransportConfig | None = None
+    rate_limiter: RateLimiter | None = None
+    cache: ResponseCache | None = None
+    entity_cache: EntityCache | None = None
+    conditional: ConditionalCache | None = None
+    decoder: Decoder | None = None
+    retry_policy: RetryPolicy | None = None
+    breaker: CircuitBreaker | None = None
+    metrics: Metrics | None = None
+    tokens: TokenManager | None = None
+    pool: CredentialPool | None = None
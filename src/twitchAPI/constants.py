@@ -1,17 +1,133 @@
 # constants.py
 from __future__ import annotations
 
-import httpx
+from typing import TYPE_CHECKING
+from typing import Any
 
-# Twitch
-TWITCH_STREAM_BASE_URL = httpx.URL('https://www.twitch.tv/')
-TWITCH_CHAT_BASE_URL = httpx.URL('https://www.twitch.tv/popout/')
+if TYPE_CHECKING:
+    import httpx
 
-# Helix
-TWITCH_HELIX_BASE_URL = httpx.URL('https://api.twitch.tv/helix/')
+    TWITCH_STREAM_BASE_URL: httpx.URL
+    TWITCH_CHAT_BASE_URL: httpx.URL
+    TWITCH_HELIX_BASE_URL: httpx.URL
+
+# Twitch and Helix
+# built as `httpx.URL`s on first access, see `__getattr__`.
+URLS = {
+    'TWITCH_STREAM_BASE_URL': 'https://www.twitch.tv/',
+    'TWITCH_CHAT_BASE_URL': 'https://www.twitch.tv/popout/',
+    'TWITCH_HELIX_BASE_URL': 'https://api.twitch.tv/helix/',
+}
 
 # API
 MAX_RETRY_ATTEMPTS = 3
-RETRY_DELAY = 1
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0
+# a 429 is not among them, `HelixAPI.send_request` waits out the rate limit itself.
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
 MAX_ITEMS_PER_REQUEST = 100
 DEFAULT_REQUESTED_ITEMS = 200
+MAX_FOLLOWED_CHANNELS = 500
+MAX_CONCURRENT_REQUESTS = 8
+
+# OAuth
+# https://dev.twitch.tv/docs/authentication/validate-tokens/
+# https://dev.twitch.tv/docs/authentication/refresh-tokens/
+OAUTH_VALIDATE_URL = 'https://id.twitch.tv/oauth2/validate'
+# an endpoint, not a secret.
+OAUTH_TOKEN_URL = 'https://id.twitch.tv/oauth2/token'  # noqa: S105
+# seconds before expiry a token is refreshed, and between validations (Twitch asks for hourly).
+TOKEN_REFRESH_MARGIN = 5 * 60
+TOKEN_VALIDATE_INTERVAL = 60 * 60
+
+# Rate limit
+# https://dev.twitch.tv/docs/api/guide/#twitch-rate-limits
+RATELIMIT_DEFAULT_POINTS = 800
+RATELIMIT_REFILL_PERIOD = 60.0
+
+# Cache
+# seconds a response of each endpoint is kept, endpoints not listed aren't cached.
+CACHE_MAX_ENTRIES = 1024
+CACHE_TTLS = {
+    'games': 6 * 60 * 60,
+    'games/top': 5 * 60,
+    'users': 60 * 60,
+    'channels': 5 * 60,
+    'search/categories': 10 * 60,
+    'search/channels': 60,
+    'streams': 15,
+    'streams/followed': 15,
+    'channels/followed': 60,
+    'clips': 5 * 60,
+    'videos': 5 * 60,
+}
+
+# Entity cache
+# seconds a single user, game or channel is kept, keyed by its ID.
+ENTITY_CACHE_MAX_ENTRIES = 10_000
+ENTITY_CACHE_TTLS = {
+    'users': 60 * 60,
+    'games': 6 * 60 * 60,
+    'channels': 5 * 60,
+}
+CONDITIONAL_MAX_ENTRIES = 256
+
+# Poller
+POLL_MIN_INTERVAL = 15.0
+POLL_MAX_INTERVAL = 120.0
+
+# Followed sync
+# seconds between the full resyncs of `Twitch.refresh_in_background`, only they find unfollows.
+FOLLOWED_RESYNC_INTERVAL = 6 * 60 * 60
+
+# Backfill
+# a window with more than a page of clips is split, down to `BACKFILL_MIN_WINDOW` seconds; one that
+# small is paged up to `BACKFILL_DENSE_WINDOW` clips, Helix stops paginating a range around 1000.
+BACKFILL_WINDOWS = 8
+BACKFILL_DENSE_WINDOW = 1000
+BACKFILL_MIN_WINDOW = 60 * 60
+
+# Store
+# ids bound per `IN (...)` query, older SQLite builds allow at most 999 variables.
+STORE_MAX_VARIABLES = 500
+
+# Transport
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 10.0
+WRITE_TIMEOUT = 10.0
+POOL_TIMEOUT = 5.0
+
+# Deadlines
+# total seconds a `request_get` of each endpoint may take, pages and retries included.
+# endpoints not listed have no budget unless the caller passes one.
+REQUEST_BUDGETS = {
+    'streams/followed': 30.0,
+    'channels/followed': 60.0,
+    'users': 15.0,
+    'games': 15.0,
+    'search/categories': 15.0,
+    'search/channels': 15.0,
+}
+
+# Circuit breaker
+# consecutive failed requests that open an endpoint's circuit, and seconds it stays open.
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30.0
+
+# Credential pool
+# endpoints that read the data of the user a token belongs to, by its `user_id` param.
+USER_SCOPED_ENDPOINTS = frozenset({'streams/followed', 'channels/followed'})
+
+
+def __getattr__(name: str) -> Any:
+    # keeps `httpx` out of the import of everything that only needs a number from here.
+    if name not in URLS:
+        err_msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(err_msg)
+    import httpx
+
+    url = globals()[name] = httpx.URL(URLS[name])
+    return url
@@ -0,0 +1,59 @@
+# deadline.py
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from typing import Awaitable
+from typing import TypeVar
+
+from twitchAPI._exceptions import DeadlineExceededError
+
+T = TypeVar('T')
+
+
+class Deadline:
+    """
+    The point in time by which a call has to be done.
+
+    Created once per call from a budget in seconds, then handed down to every
+    page, retry and wait of that call so each one only gets the time left.
+    """
+
+    __slots__ = ('budget', 'expires_at')
+
+    def __init__(self, budget: float) -> None:
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    @classmethod
+    def after(cls, budget: float | None) -> Deadline | None:
+        """Returns a deadline `budget` seconds from now, None for no budget (`None` or `math.inf`)."""
+        if budget is None or math.isinf(budget):
+            return None
+        return cls(budget)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    async def run(self, aw: Awaitable[T]) -> T:
+        """
+        Awaits `aw`, cancelling it once the deadline passes.
+
+        Raises:
+            DeadlineExceededError: If the deadline passed before `aw` was done.
+        """
+        if self.expired:
+            raise DeadlineExceededError(self.budget)
+        try:
+            return await asyncio.wait_for(aw, timeout=self.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(self.budget) from None
+
+    def __repr__(self) -> str:
+        return f'Deadline(budget={self.budget}, remaining={self.remaining():.3f})'
@@ -0,0 +1,131 @@
+# decoders.py
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+
+log = logging.getLogger(__name__)
+
+
+class Decoder:
+    """
+    Decodes Helix response bodies using the standard library `json` module.
+
+    `decode_page` builds `model` instances in a second pass over the decoded
+    items, this is the fallback used when no faster backend is installed.
+    """
+
+    name = 'json'
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def decode(self, content: bytes) -> dict[str, Any]:
+        """Decodes a response body into plain dicts."""
+        return self.loads(content)
+
+    def decode_page(self, content: bytes, model: type) -> dict[str, Any]:
+        """Decodes a paginated response body, with its `data` items as `model` instances."""
+        return self.decode_page_timed(content, model)[0]
+
+    def decode_page_timed(self, content: bytes, model: type) -> tuple[dict[str, Any], float, float]:
+        """Same as `decode_page`, also returning the seconds spent decoding and building models."""
+        start = time.perf_counter()
+        page = self.loads(content)
+        decoded = time.perf_counter()
+        page['data'] = [model(**item) for item in page.get('data', [])]
+        return page, decoded - start, time.perf_counter() - decoded
+
+
+class OrjsonDecoder(Decoder):
+    """Same as `Decoder`, parsing with `orjson`."""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, content: bytes) -> Any:
+        return self._loads(content)
+
+
+class MsgspecDecoder(Decoder):
+    """
+    Decodes with `msgspec`, straight into `model` instances in a single pass.
+
+    A typed decoder is built once per model. Models `msgspec` cannot handle,
+    and pages that don't match their model's types, fall back to building
+    instances in a second pass. A single pass is timed as model construction.
+    """
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._typed: dict[type, Any] = {}
+
+    def loads(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+    def _typed_decoder(self, model: type) -> Any:
+        if model not in self._typed:
+            try:
+                page_type = self._msgspec.defstruct(
+                    f'{model.__name__}Page',
+                    [('data', List[model], []), ('pagination', Dict[str, Any], {})],  # type: ignore[valid-type]
+                )
+                self._typed[model] = self._msgspec.json.Decoder(page_type)
+            except (TypeError, NameError) as err:
+                log.debug("decoder: no typed decoding for model='%s': %s", model.__name__, err)
+                self._typed[model] = None
+        return self._typed[model]
+
+    def decode_page_timed(self, content: bytes, model: type) -> tuple[dict[str, Any], float, float]:
+        decoder = self._typed_decoder(model)
+        if decoder is None:
+            return super().decode_page_timed(content, model)
+        start = time.perf_counter()
+        try:
+            page = decoder.decode(content)
+        except self._msgspec.ValidationError as err:
+            log.debug("decoder: page does not match model='%s': %s", model.__name__, err)
+            return super().decode_page_timed(content, model)
+        return {'data': page.data, 'pagination': page.pagination}, 0.0, time.perf_counter() - start
+
+
+DECODERS: dict[str, type[Decoder]] = {
+    'msgspec': MsgspecDecoder,
+    'orjson': OrjsonDecoder,
+    'json': Decoder,
+}
+
+
+def get_decoder(name: str = 'auto') -> Decoder:
+    """
+    Returns a decoder by backend name, `auto` picks the fastest one installed.
+
+    Raises:
+        ImportError: If the requested backend is not installed.
+        ValueError: If the backend name is unknown.
+    """
+    if name != 'auto':
+        if name not in DECODERS:
+            err_msg = f'unknown decoder {name!r}, expected one of {sorted(DECODERS)}'
+            raise ValueError(err_msg)
+        return DECODERS[name]()
+
+    for decoder_cls in DECODERS.values():
+        try:
+            return decoder_cls()
+        except ImportError:
+            continue
+    return Decoder()
@@ -0,0 +1,106 @@
+# loader.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import List
+
+from twitchAPI._exceptions import BatchRequestError
+
+log = logging.getLogger(__name__)
+
+BatchFn = Callable[[List[str]], Awaitable[List[Any]]]
+
+
+class BatchLoader:
+    """
+    Coalesces ID lookups from concurrent callers into batched requests.
+
+    Keys requested during the same event-loop tick, or within `window` seconds
+    of the first one, are deduplicated and handed to `batch_fn` in one call.
+    Each caller then gets back its own entity, or None if Helix did not return it.
+    """
+
+    def __init__(self, batch_fn: BatchFn, id_field: str = 'id', window: float = 0.0) -> None:
+        self.batch_fn = batch_fn
+        self.id_field = id_field
+        self.window = window
+        self._pending: dict[str, list[asyncio.Future[dict[str, Any] | None]]] = {}
+        self._scheduled = False
+        # running batches, referenced here so they aren't garbage collected mid-flight.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _schedule(self) -> None:
+        if self._scheduled:
+            return
+        loop = asyncio.get_running_loop()
+        if self.window > 0:
+            loop.call_later(self.window, self._dispatch)
+        else:
+            loop.call_soon(self._dispatch)
+        self._scheduled = True
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: dict[str, list[asyncio.Future[dict[str, Any] | None]]]) -> None:
+        keys = list(pending)
+        log.debug("loader: dispatching keys='%s'", len(keys))
+        error: BaseException | None = None
+        try:
+            try:
+                entities = await self.batch_fn(keys)
+            except BatchRequestError as err:
+                error, entities = err, err.data
+            except Exception as err:  # noqa: BLE001
+                error, entities = err, []
+
+            by_id = {entity[self.id_field]: entity for entity in entities}
+            for key, futures in pending.items():
+                for future in futures:
+                    if future.done():
+                        continue
+                    if key in by_id or error is None:
+                        future.set_result(by_id.get(key))
+                    else:
+                        future.set_exception(error)
+        finally:
+            # cancelled, or failed while resolving: callers must not wait forever.
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+
+    def load(self, key: str) -> asyncio.Future[dict[str, Any] | None]:
+        """Queues `key` for the next batch and returns a future for its entity."""
+        future: asyncio.Future[dict[str, Any] | None] = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(future)
+        self._schedule()
+        return future
+
+    async def load_many(self, keys: list[str]) -> list[dict[str, Any]]:
+        """
+        Loads `keys`, returning the entities found in input order.
+
+        Raises:
+            BatchRequestError: If part of the keys could not be loaded; its `data`
+            holds the entities that were.
+        """
+        results = await asyncio.gather(*(self.load(key) for key in keys), return_exceptions=True)
+        data = [r for r in results if r is not None and not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if not errors:
+            return data
+
+        err = errors[0]
+        if isinstance(err, BatchRequestError):
+            raise BatchRequestError(data, err.errors) from err
+        raise err
@@ -0,0 +1,233 @@
+# metrics.py
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+if TYPE_CHECKING:
+    import httpx
+
+log = logging.getLogger(__name__)
+
+PROMETHEUS_PREFIX = 'twitchapi'
+
+
+@dataclass
+class Span:
+    """
+    A timed operation, shaped like an OpenTelemetry span.
+
+    Attributes:
+        name (str): `helix.request` for each HTTP request, `helix.walk` for each paginated walk.
+        start (float): `time.time()` when it started.
+        end (float): `time.time()` when it ended.
+        attributes (dict[str, Any]): Endpoint, status, bytes, pages...
+    """
+
+    name: str
+    start: float
+    end: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class EndpointStats:
+    """Counters of one Helix endpoint."""
+
+    requests: int = 0
+    statuses: Counter[int] = field(default_factory=Counter)
+    errors: Counter[str] = field(default_factory=Counter)
+    retries: int = 0
+    bytes_in: int = 0
+    network_seconds: float = 0.0
+    ratelimit_wait_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    model_seconds: float = 0.0
+    pages: int = 0
+    walks: int = 0
+    max_depth: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'statuses': dict(self.statuses),
+            'errors': dict(self.errors),
+            'retries': self.retries,
+            'bytes_in': self.bytes_in,
+            'network_seconds': self.network_seconds,
+            'ratelimit_wait_seconds': self.ratelimit_wait_seconds,
+            'decode_seconds': self.decode_seconds,
+            'model_seconds': self.model_seconds,
+            'pages': self.pages,
+            'walks': self.walks,
+            'max_depth': self.max_depth,
+        }
+
+
+class Metrics:
+    """
+    Per-endpoint counters of the requests sent through a `HelixAPI`.
+
+    Tells apart the time spent waiting on the rate limiter, on the network,
+    decoding JSON and building models, and keeps the rate limit headroom
+    reported by Helix. `snapshot()` returns them as plain dicts,
+    `to_prometheus()` in the Prometheus text format.
+
+    `on_span` is called with a `Span` after each HTTP request and each
+    paginated walk, e.g. to forward them to a tracer. Errors it raises are
+    logged, not propagated.
+    """
+
+    def __init__(self, on_span: Callable[[Span], None] | None = None) -> None:
+        self.on_span = on_span
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.ratelimit_limit: int | None = None
+        self.ratelimit_remaining: int | None = None
+
+    def endpoint(self, endpoint: str) -> EndpointStats:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def emit(self, name: str, start: float, **attributes: Any) -> None:
+        """Sends a span that started at `start` (`time.time()`) and ends now to `on_span`."""
+        if self.on_span is None:
+            return
+        try:
+            self.on_span(Span(name, start, time.time(), attributes))
+        except Exception:
+            log.exception("metrics: on_span failed for span='%s'", name)
+
+    def record_request(
+        self,
+        endpoint: str,
+        response: httpx.Response | None,
+        network_seconds: float,
+        ratelimit_wait_seconds: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """Counts one request sent to `endpoint`, `response` is None if it failed with `error`."""
+        stats = self.endpoint(endpoint)
+        stats.requests += 1
+        stats.network_seconds += network_seconds
+        stats.ratelimit_wait_seconds += ratelimit_wait_seconds
+        if response is not None:
+            stats.bytes_in += len(response.content)
+            stats.statuses[response.status_code] += 1
+        if error is not None:
+            stats.errors[type(error).__name__] += 1
+
+    def record_ratelimit(self, limit: str | None, remaining: str | None) -> None:
+        if limit is not None and remaining is not None:
+            self.ratelimit_limit = int(limit)
+            self.ratelimit_remaining = int(remaining)
+
+    def record_retry(self, endpoint: str) -> None:
+        self.endpoint(endpoint).retries += 1
+
+    def record_decode(self, endpoint: str, decode_seconds: float, model_seconds: float = 0.0) -> None:
+        stats = self.endpoint(endpoint)
+        stats.decode_seconds += decode_seconds
+        stats.model_seconds += model_seconds
+
+    def record_walk(self, endpoint: str, pages: int) -> None:
+        stats = self.endpoint(endpoint)
+        stats.walks += 1
+        stats.pages += pages
+        stats.max_depth = max(stats.max_depth, pages)
+
+    @property
+    def ratelimit_headroom(self) -> float | None:
+        """Share of the rate limit bucket left at the last response, from 0 to 1."""
+        if not self.ratelimit_limit or self.ratelimit_remaining is None:
+            return None
+        return self.ratelimit_remaining / self.ratelimit_limit
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'endpoints': {name: stats.to_dict() for name, stats in self.endpoints.items()},
+            'ratelimit': {
+                'limit': self.ratelimit_limit,
+                'remaining': self.ratelimit_remaining,
+                'headroom': self.ratelimit_headroom,
+            },
+        }
+
+    def reset(self) -> None:
+        self.endpoints.clear()
+
+    def to_prometheus(self) -> str:
+        """Returns the counters in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: list[tuple[dict[str, Any], float]]) -> None:
+            full_name = f'{PROMETHEUS_PREFIX}_{name}'
+            lines.append(f'# HELP {full_name} {help_text}')
+            lines.append(f'# TYPE {full_name} {kind}')
+            for labels, value in samples:
+                label_str = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f'{full_name}{{{label_str}}} {value}' if label_str else f'{full_name} {value}')
+
+        items = sorted(self.endpoints.items())
+        metric(
+            'requests_total',
+            'counter',
+            'Responses received from Helix, by status.',
+            [({'endpoint': e, 'status': code}, n) for e, s in items for code, n in sorted(s.statuses.items())],
+        )
+        metric(
+            'request_errors_total',
+            'counter',
+            'Requests that got no response, by error.',
+            [({'endpoint': e, 'error': err}, n) for e, s in items for err, n in sorted(s.errors.items())],
+        )
+        metric('retries_total', 'counter', 'Requests sent again.', [({'endpoint': e}, s.retries) for e, s in items])
+        metric(
+            'response_bytes_total',
+            'counter',
+            'Response body bytes received.',
+            [({'endpoint': e}, s.bytes_in) for e, s in items],
+        )
+        metric(
+            'seconds_total',
+            'counter',
+            'Seconds spent per phase: ratelimit wait, network, JSON decode and model construction.',
+            [
+                ({'endpoint': e, 'phase': phase}, round(value, 6))
+                for e, s in items
+                for phase, value in (
+                    ('ratelimit_wait', s.ratelimit_wait_seconds),
+                    ('network', s.network_seconds),
+                    ('decode', s.decode_seconds),
+                    ('model', s.model_seconds),
+                )
+            ],
+        )
+        metric('pages_total', 'counter', 'Pages walked.', [({'endpoint': e}, s.pages) for e, s in items])
+        metric('walks_total', 'counter', 'Paginated walks.', [({'endpoint': e}, s.walks) for e, s in items])
+        metric(
+            'pagination_depth_max',
+            'gauge',
+            'Most pages walked in a single walk.',
+            [({'endpoint': e}, s.max_depth) for e, s in items],
+        )
+        if self.ratelimit_limit is not None:
+            metric('ratelimit_limit', 'gauge', 'Size of the rate limit bucket.', [({}, self.ratelimit_limit)])
+            metric(
+                'ratelimit_remaining',
+                'gauge',
+                'Points left in the rate limit bucket.',
+                [({}, self.ratelimit_remaining or 0)],
+            )
+        return '\n'.join(lines) + '\n'
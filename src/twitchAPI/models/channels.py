@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+
+from twitchAPI.models.fields import derived
+from twitchAPI.models.fields import init_derived
+from twitchAPI.utils import parse_timestamp
 
 
 @dataclass(frozen=True)
@@ -76,6 +82,7 @@ class ChannelInfo:
         broadcaster_login (str): The login name of the broadcaster.
         followed_at (str): The timestamp when the user started following the channel (ISO 8601 format).
         live (bool): Indicates if the channel is currently live. Defaults to False.
+        followed_at_ts (int): `followed_at` in epoch seconds, parsed once, to sort on.
 
     https://dev.twitch.tv/docs/api/reference/#get-followed-channels
     """
@@ -85,11 +92,19 @@ class ChannelInfo:
     broadcaster_login: str
     followed_at: str
     live: bool = False
+    followed_at_ts: int = derived('followed_at', parse_timestamp)
+
+    def __post_init__(self) -> None:
+        init_derived(self)
 
     @property
     def name(self) -> str:
         return self.broadcaster_name
 
+    @property
+    def followed_at_dt(self) -> datetime:
+        return datetime.fromtimestamp(self.followed_at_ts, tz=timezone.utc)
+
 
 @dataclass
 class ChannelUser:
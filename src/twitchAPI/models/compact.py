@@ -0,0 +1,166 @@
+# twitch.models.compact.py
+
+from __future__ import annotations
+
+import dataclasses
+from array import array
+from typing import Any
+from typing import ClassVar
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
+
+from twitchAPI.models.content import FollowedContentClip
+from twitchAPI.models.fields import derived_fields
+from twitchAPI.models.streams import FollowedStream
+
+_PLAIN, _INTERNED, _LIST = range(3)
+
+
+class RowView:
+    """
+    A row of a column table, fields are read from the columns on access.
+
+    Properties of the model, e.g. `FollowedStream.name`, work too: they are
+    evaluated against the row view.
+    """
+
+    __slots__ = ('_index', '_table')
+
+    def __init__(self, table: ColumnTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        # private names are never columns; an instance without its slots set
+        # (e.g. while `copy` builds one) would otherwise recurse on `_table`.
+        if not name.startswith('_'):
+            table = self._table
+            if name in table._columns:
+                return table.value(name, self._index)
+            attr = getattr(table.model, name, None)
+            if isinstance(attr, property) and attr.fget is not None:
+                return attr.fget(self)
+        err_msg = f'{type(self).__name__!r} object has no attribute {name!r}'
+        raise AttributeError(err_msg)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._table.model.__name__}, index={self._index})'
+
+    def to_model(self) -> Any:
+        return self._table.row(self._index)
+
+
+class ColumnTable(Iterable[RowView]):
+    """
+    Stores many items of one model as one compact column per field.
+
+    Integer, float and bool fields live in `array`/`bytearray` columns. String
+    fields in `interned_fields` and list fields (stored as tuples) share one
+    object per distinct value, so the repeated `game_name`, `language` or
+    `tags` of thousands of rows cost a pointer each. Derived fields of the
+    model (parsed timestamps and durations) are stored as `int` columns.
+    """
+
+    model: ClassVar[type]
+    int_fields: ClassVar[tuple[str, ...]] = ()
+    float_fields: ClassVar[tuple[str, ...]] = ()
+    bool_fields: ClassVar[tuple[str, ...]] = ()
+    interned_fields: ClassVar[tuple[str, ...]] = ()
+    list_fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, items: Iterable[Mapping[str, Any]] = ()) -> None:
+        self.fields = tuple(f.name for f in dataclasses.fields(self.model) if f.init)
+        self._derived = derived_fields(self.model)
+        self._columns: dict[str, Any] = {name: array('q') for name, _, _ in self._derived}
+        for name in self.fields:
+            if name in self.int_fields:
+                self._columns[name] = array('q')
+            elif name in self.float_fields:
+                self._columns[name] = array('d')
+            elif name in self.bool_fields:
+                self._columns[name] = bytearray()
+            else:
+                self._columns[name] = []
+        defaults = {f.name: f.default for f in dataclasses.fields(self.model) if f.default is not dataclasses.MISSING}
+        self._plan = [(name, self._columns[name].append, self._kind(name), defaults.get(name)) for name in self.fields]
+        self._required = {name for name in self.fields if name not in defaults}
+        self._pool: dict[Any, Any] = {}
+        self._len = 0
+        self.extend(items)
+
+    def _kind(self, name: str) -> int:
+        if name in self.list_fields:
+            return _LIST
+        if name in self.interned_fields:
+            return _INTERNED
+        return _PLAIN
+
+    def append(self, item: Mapping[str, Any]) -> None:
+        pool = self._pool
+        for name, push, kind, default in self._plan:
+            value = item[name] if name in self._required else item.get(name, default)
+            if kind == _INTERNED:
+                value = pool.setdefault(value, value)
+            elif kind == _LIST and value is not None:
+                value = tuple(pool.setdefault(v, v) for v in value)
+                value = pool.setdefault(value, value)
+            push(value)
+        columns = self._columns
+        for name, source, parse in self._derived:
+            columns[name].append(parse(item[source]))
+        self._len += 1
+
+    def extend(self, items: Iterable[Mapping[str, Any]]) -> None:
+        for item in items:
+            self.append(item)
+
+    def column(self, name: str) -> Any:
+        """Returns the whole column of a field, e.g. to sort or aggregate over it."""
+        return self._columns[name]
+
+    def value(self, name: str, index: int) -> Any:
+        value = self._columns[name][index]
+        if name in self.bool_fields:
+            return bool(value)
+        return value
+
+    def row(self, index: int) -> Any:
+        """Builds the full model of a row."""
+        values = {name: self.value(name, index) for name in self.fields}
+        for name in self.list_fields:
+            if values[name] is not None:
+                values[name] = list(values[name])
+        return self.model(**values)
+
+    def __getitem__(self, index: int) -> RowView:
+        if not -self._len <= index < self._len:
+            err_msg = f'{type(self).__name__} index out of range'
+            raise IndexError(err_msg)
+        return RowView(self, index % self._len)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, i) for i in range(self._len))
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class StreamTable(ColumnTable):
+    """Column table of `FollowedStream`."""
+
+    model = FollowedStream
+    int_fields = ('viewer_count',)
+    bool_fields = ('is_mature', 'live')
+    interned_fields = ('game_id', 'game_name', 'language', 'type')
+    list_fields = ('tag_ids', 'tags')
+
+
+class ClipTable(ColumnTable):
+    """Column table of `FollowedContentClip`."""
+
+    model = FollowedContentClip
+    int_fields = ('view_count',)
+    float_fields = ('duration',)
+    bool_fields = ('is_featured',)
+    interned_fields = ('broadcaster_id', 'broadcaster_name', 'creator_id', 'creator_name', 'game_id', 'language')
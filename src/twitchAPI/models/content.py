@@ -3,7 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
 from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from twitchAPI.models.fields import derived
+from twitchAPI.models.fields import init_derived
+from twitchAPI.utils import parse_duration
+from twitchAPI.utils import parse_timestamp
+
+T = TypeVar('T')
 
 
 @dataclass(frozen=True)
@@ -29,6 +40,7 @@ class FollowedContentClip:
         view_count (int): The number of views the clip has received.
         vod_offset (Optional[int]): The offset in seconds where the clip starts in the VOD, if available.
         is_featured (bool): A flag indicating whether the clip is featured. Defaults to False.
+        created_at_ts (int): `created_at` in epoch seconds, parsed once, to sort on.
 
     https://dev.twitch.tv/docs/api/reference#get-clips
     """
@@ -50,6 +62,14 @@ class FollowedContentClip:
     view_count: int
     vod_offset: int | None
     is_featured: bool = False
+    created_at_ts: int = derived('created_at', parse_timestamp)
+
+    def __post_init__(self) -> None:
+        init_derived(self)
+
+    @property
+    def created_at_dt(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ts, tz=timezone.utc)
 
 
 @dataclass(frozen=True)
@@ -75,6 +95,8 @@ class FollowedContentVideo:
         duration (str): The duration of the video in ISO 8601 duration format.
         description (str): The description of the video.
         created_at (str): The timestamp when the video was created (ISO 8601 format).
+        duration_seconds (int): `duration` in seconds, parsed once, to sort on.
+        created_at_ts (int): `created_at` in epoch seconds, parsed once, to sort on.
 
     https://dev.twitch.tv/docs/api/reference#get-videos
     """
@@ -96,3 +118,33 @@ class FollowedContentVideo:
     duration: str
     description: str
     created_at: str
+    duration_seconds: int = derived('duration', parse_duration)
+    created_at_ts: int = derived('created_at', parse_timestamp)
+
+    def __post_init__(self) -> None:
+        init_derived(self)
+
+    @property
+    def created_at_dt(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ts, tz=timezone.utc)
+
+
+@dataclass(frozen=True)
+class UserContent(Generic[T]):
+    """
+    The content fetched for one user by a multi-user call such as `Twitch.clips_for`.
+
+    Attributes:
+        user_id (str): The unique identifier of the user.
+        items (list[T]): The clips or videos fetched, empty if the fetch failed.
+        error (BaseException | None): Why the fetch failed, `asyncio.TimeoutError`
+        if the per-user deadline passed. Defaults to None.
+    """
+
+    user_id: str
+    items: list[T]
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
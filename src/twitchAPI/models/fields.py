@@ -0,0 +1,43 @@
+# twitch.models.fields.py
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+from typing import Callable
+
+_DERIVED: dict[type, tuple[tuple[str, str, Callable[[Any], Any]], ...]] = {}
+
+
+def derived(source: str, parse: Callable[[Any], Any], default: Any = 0) -> Any:
+    """
+    Declares a field computed once from `source` when the model is built.
+
+    Derived fields are not `__init__` arguments and don't take part in `repr`
+    or comparisons; `init_derived` fills them in from `__post_init__`. The
+    placeholder `default` lets typed decoders build the model without the
+    field in the payload, they run `__post_init__` afterwards.
+    """
+    return dataclasses.field(
+        default=default,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={'source': source, 'parse': parse},
+    )
+
+
+def derived_fields(cls: type) -> tuple[tuple[str, str, Callable[[Any], Any]], ...]:
+    """Returns `(name, source, parse)` for each derived field of a model."""
+    if cls not in _DERIVED:
+        _DERIVED[cls] = tuple(
+            (f.name, f.metadata['source'], f.metadata['parse'])
+            for f in dataclasses.fields(cls)
+            if 'source' in f.metadata
+        )
+    return _DERIVED[cls]
+
+
+def init_derived(obj: Any) -> None:
+    for name, source, parse in derived_fields(type(obj)):
+        object.__setattr__(obj, name, parse(getattr(obj, source)))
@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+
+from twitchAPI.models.fields import derived
+from twitchAPI.models.fields import init_derived
+from twitchAPI.utils import parse_timestamp
 
 
 @dataclass
@@ -27,6 +33,7 @@ class FollowedStream:
         user_name: The broadcaster's user display name.
         viewer_count: The current number of viewers watching the stream.
         live: A boolean indicating if the stream is currently live (defaults to True).
+        started_at_ts: `started_at` in epoch seconds, parsed once, to sort on.
 
     https://dev.twitch.tv/docs/api/reference#get-followed-streams
     """
@@ -47,7 +54,15 @@ class FollowedStream:
     user_name: str
     viewer_count: int
     live: bool = True
+    started_at_ts: int = derived('started_at', parse_timestamp)
+
+    def __post_init__(self) -> None:
+        init_derived(self)
 
     @property
     def name(self) -> str:
         return self.user_name
+
+    @property
+    def started_at_dt(self) -> datetime:
+        return datetime.fromtimestamp(self.started_at_ts, tz=timezone.utc)
@@ -0,0 +1,103 @@
+# twitch.models.views.py
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Mapping
+
+from twitchAPI.models.category import Game
+from twitchAPI.models.content import FollowedContentClip
+from twitchAPI.models.content import FollowedContentVideo
+from twitchAPI.models.streams import FollowedStream
+
+
+class ViewField:
+    """Reads one field from the wrapped item on access, coercing it if asked."""
+
+    __slots__ = ('coerce', 'default', 'name')
+
+    def __init__(self, name: str, default: Any = None, coerce: Callable[[Any], Any] | None = None) -> None:
+        self.name = name
+        self.default = default
+        self.coerce = coerce
+
+    def __get__(self, view: LazyView | None, owner: type) -> Any:
+        if view is None:
+            return self
+        value = view._raw.get(self.name, self.default)
+        if self.coerce is not None and value is not None:
+            return self.coerce(value)
+        return value
+
+
+class LazyView:
+    """
+    A read-only view over a decoded response item.
+
+    Fields are read from the wrapped dict when accessed, nothing is copied
+    until `materialize()` builds the full model.
+    """
+
+    __slots__ = ('_raw',)
+
+    model: ClassVar[type]
+    coercions: ClassVar[Mapping[str, Callable[[Any], Any]]] = {}
+
+    def __init__(self, raw: Mapping[str, Any]) -> None:
+        self._raw = raw
+
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        return self._raw
+
+    def materialize(self) -> Any:
+        """Builds the full model from the wrapped item, coerced the same way as on access."""
+        values = dict(self._raw)
+        for name, coerce in self.coercions.items():
+            if values.get(name) is not None:
+                values[name] = coerce(values[name])
+        return self.model(**values)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({dict(self._raw)!r})'
+
+
+def view_of(
+    model: type,
+    name: str,
+    coerce: Mapping[str, Callable[[Any], Any]] | None = None,
+) -> type[LazyView]:
+    """
+    Creates a `LazyView` class exposing the fields and properties of `model`.
+
+    `coerce` maps field names to a callable applied to the raw value on access.
+    Derived fields are parsed from their source field on each access.
+    """
+    coerce = dict(coerce or {})
+    namespace: dict[str, Any] = {
+        '__slots__': (),
+        'model': model,
+        'coercions': coerce,
+        '__doc__': f'Lazy view of `{model.__name__}`.',
+    }
+    for field in dataclasses.fields(model):
+        if 'source' in field.metadata:
+            namespace[field.name] = ViewField(field.metadata['source'], coerce=field.metadata['parse'])
+            continue
+        default = None if field.default is dataclasses.MISSING else field.default
+        namespace[field.name] = ViewField(field.name, default, coerce.get(field.name))
+    for attr, value in vars(model).items():
+        if isinstance(value, property):
+            namespace[attr] = value
+    view_cls = type(name, (LazyView,), namespace)
+    view_cls.__module__ = __name__
+    return view_cls
+
+
+StreamView = view_of(FollowedStream, 'StreamView', {'viewer_count': int})
+ClipView = view_of(FollowedContentClip, 'ClipView', {'view_count': int, 'duration': float})
+VideoView = view_of(FollowedContentVideo, 'VideoView', {'view_count': int})
+GameView = view_of(Game, 'GameView')
@@ -0,0 +1,151 @@
+# poller.py
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import AsyncIterator
+from typing import Literal
+
+from twitchAPI import constants
+from twitchAPI._exceptions import DeadlineExceededError
+from twitchAPI.models.streams import FollowedStream
+
+if TYPE_CHECKING:
+    from twitchAPI.api_helix import HelixAPI
+
+log = logging.getLogger(__name__)
+
+StreamEventKind = Literal[
+    'went_live',
+    'went_offline',
+    'title_changed',
+    'game_changed',
+    'viewers_changed',
+]
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """
+    A change in the followed streams between two polls.
+
+    Attributes:
+        kind (StreamEventKind): What changed.
+        stream (FollowedStream): The stream, already updated to its new state.
+        previous (Any): The value before the change (title, game name or viewer
+        count), None for `went_live` and `went_offline`.
+    """
+
+    kind: StreamEventKind
+    stream: FollowedStream
+    previous: Any = None
+
+
+class StreamPoller:
+    """
+    Polls the followed streams and emits what changed since the previous poll.
+
+    The last snapshot is kept by `user_id` and updated in place, streams that
+    did not change are neither rebuilt nor reported. The interval halves after
+    a poll with changes and grows back towards `max_interval` while idle or
+    while polls fail.
+    """
+
+    def __init__(
+        self,
+        api: HelixAPI,
+        min_interval: float = constants.POLL_MIN_INTERVAL,
+        max_interval: float = constants.POLL_MAX_INTERVAL,
+        viewers_threshold: int = 0,
+    ) -> None:
+        self.api = api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.viewers_threshold = viewers_threshold
+        self.interval = min_interval
+        self.snapshot: dict[str, FollowedStream] = {}
+        self._stopped: asyncio.Event | None = None
+
+    @property
+    def online(self) -> int:
+        return len(self.snapshot)
+
+    def diff(self, data: list[dict[str, Any]]) -> list[StreamEvent]:
+        """Applies a fresh list of streams to the snapshot and returns the changes."""
+        events: list[StreamEvent] = []
+        seen: set[str] = set()
+
+        for item in data:
+            user_id = item['user_id']
+            seen.add(user_id)
+            stream = self.snapshot.get(user_id)
+            # a stream restarted between two polls is a new stream, with a new id and start.
+            if stream is None or stream.id != item['id'] or stream.started_at != item['started_at']:
+                stream = FollowedStream(**item)
+                self.snapshot[user_id] = stream
+                events.append(StreamEvent('went_live', stream))
+                continue
+
+            if stream.title != item['title']:
+                events.append(StreamEvent('title_changed', stream, stream.title))
+                stream.title = item['title']
+            if stream.game_id != item['game_id']:
+                events.append(StreamEvent('game_changed', stream, stream.game_name))
+                stream.game_id = item['game_id']
+                stream.game_name = item['game_name']
+            if abs(stream.viewer_count - item['viewer_count']) > self.viewers_threshold:
+                events.append(StreamEvent('viewers_changed', stream, stream.viewer_count))
+                stream.viewer_count = item['viewer_count']
+
+        for user_id in [uid for uid in self.snapshot if uid not in seen]:
+            stream = self.snapshot.pop(user_id)
+            stream.live = False
+            events.append(StreamEvent('went_offline', stream))
+
+        return events
+
+    def _back_off(self) -> None:
+        self.interval = min(self.max_interval, self.interval * 1.5)
+
+    async def poll(self) -> list[StreamEvent]:
+        """
+        Fetches the followed streams once and returns the changes.
+
+        A failed poll returns no changes and keeps the snapshot as it is, a
+        partial or missing list would report the streams it lacks as offline.
+        """
+        try:
+            data = await self.api.channels.streams()
+        except DeadlineExceededError as err:
+            log.warning('poller: streams ran out of the %ss budget, skipping this poll', err.budget)
+            self._back_off()
+            return []
+        except Exception as err:  # noqa: BLE001
+            log.warning('poller: streams failed with %r, skipping this poll', err)
+            self._back_off()
+            return []
+        events = self.diff(data)
+        if events:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self._back_off()
+        log.debug("poller: events='%s' online='%s' next_in='%.1fs'", len(events), self.online, self.interval)
+        return events
+
+    async def events(self) -> AsyncIterator[StreamEvent]:
+        """Polls until `stop()` is called, yielding every change as it is found; a failed poll doesn't end it."""
+        self._stopped = asyncio.Event()
+        while not self._stopped.is_set():
+            for event in await self.poll():
+                yield event
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.interval)
+
+    def stop(self) -> None:
+        """Stops `events()` after the poll in progress, if any."""
+        if self._stopped is not None:
+            self._stopped.set()
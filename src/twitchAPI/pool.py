@@ -0,0 +1,137 @@
+# pool.py
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+
+import httpx
+
+from twitchAPI import constants
+from twitchAPI._exceptions import EnvValidationError
+from twitchAPI._exceptions import NoCredentialError
+from twitchAPI.ratelimit import RateLimiter
+from twitchAPI.tokens import TokenManager
+from twitchAPI.transport import TransportConfig
+
+if TYPE_CHECKING:
+    from twitchAPI.auth import UserAuthenticator
+
+log = logging.getLogger(__name__)
+
+
+class Credential:
+    """
+    A client ID and token with its own rate limit bucket and connection pool.
+
+    `load()` is the share of its bucket in use, counting requests that picked
+    it and are still waiting for a point. `busy_seconds` adds up the time its
+    requests spent on the network, overlapping ones included.
+    """
+
+    def __init__(
+        self,
+        auth: UserAuthenticator,
+        client: httpx.AsyncClient,
+        rate_limiter: RateLimiter | None = None,
+        tokens: TokenManager | None = None,
+    ) -> None:
+        self.auth = auth
+        self.client = client
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.tokens = tokens
+        self.pending = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.ratelimited = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def name(self) -> str:
+        return f'{self.auth.client_id}:{self.auth.user_id}'
+
+    def load(self) -> float:
+        limiter = self.rate_limiter
+        return (limiter.limit - limiter.available() + self.pending) / limiter.limit
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'user_id': self.auth.user_id,
+            'requests': self.requests,
+            'ratelimited': self.ratelimited,
+            'errors': self.errors,
+            'in_flight': self.in_flight,
+            'load': round(self.load(), 4),
+            'ratelimit_limit': self.rate_limiter.limit,
+            'ratelimit_available': round(self.rate_limiter.available(), 1),
+            'busy_seconds': round(self.busy_seconds, 4),
+        }
+
+
+class CredentialPool:
+    """
+    Several credentials a `HelixAPI` spreads its requests over.
+
+    Helix rate limits apply per client ID and token, so each credential gets
+    its own `RateLimiter` and `httpx.AsyncClient`. Requests to the endpoints
+    in `USER_SCOPED_ENDPOINTS` go to the credential of their `user_id` param,
+    every other request to the least loaded credential. A 429 on a shared
+    request moves the retry to another credential instead of waiting.
+
+    Example:
+        pool = CredentialPool([UserAuthenticator.load(), other_auth])
+        api = HelixAPI(pool.credentials[0].auth, HelixConfig(pool=pool))
+    """
+
+    def __init__(
+        self,
+        auths: Iterable[UserAuthenticator],
+        transport: TransportConfig | None = None,
+        refresh_tokens: bool = False,
+    ) -> None:
+        self.transport = transport or TransportConfig()
+        self.credentials: list[Credential] = []
+        self._by_user: dict[str, Credential] = {}
+        for auth in auths:
+            if not auth.ok:
+                auth.validation()
+            if not auth.client_id or not auth.user_id:
+                err_msg = f'credential user_id={auth.user_id!r} needs a client ID and a user ID'
+                raise EnvValidationError(err_msg)
+            tokens = TokenManager() if refresh_tokens else None
+            headers = {'Accept': 'application/vnd.twitchtv.v5+json'}
+            if tokens is None:
+                headers.update({'Client-ID': auth.client_id, 'Authorization': f'Bearer {auth.access_token}'})
+            client = httpx.AsyncClient(headers=headers, **self.transport.client_kwargs())
+            credential = Credential(auth, client, tokens=tokens)
+            self.credentials.append(credential)
+            self._by_user.setdefault(auth.user_id, credential)
+        if not self.credentials:
+            err_msg = 'a credential pool needs at least one credential'
+            raise ValueError(err_msg)
+
+    def pick(self, endpoint: str, user_id: str | None = None) -> Credential:
+        """
+        Returns the credential to send a request to `endpoint` with.
+
+        Raises:
+            NoCredentialError: If `endpoint` is user-scoped and no credential belongs to `user_id`.
+        """
+        if endpoint in constants.USER_SCOPED_ENDPOINTS:
+            credential = self._by_user.get(user_id or '')
+            if credential is None:
+                err_msg = f'no credential for user_id={user_id!r} to request {endpoint!r}'
+                raise NoCredentialError(err_msg)
+            return credential
+        return min(self.credentials, key=lambda c: (c.load(), c.in_flight))
+
+    def utilisation(self) -> dict[str, dict[str, Any]]:
+        """Returns the counters of each credential, keyed by `client_id:user_id`."""
+        return {credential.name: credential.stats() for credential in self.credentials}
+
+    async def close(self) -> None:
+        for credential in self.credentials:
+            if not credential.client.is_closed:
+                await credential.client.aclose()
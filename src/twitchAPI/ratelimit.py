@@ -0,0 +1,114 @@
+# ratelimit.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from twitchAPI import constants
+
+if TYPE_CHECKING:
+    import httpx
+
+log = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every request sent through a `HelixAPI`.
+
+    The bucket starts with Twitch's documented defaults and then learns its real
+    size and refill period from the `Ratelimit-*` headers of each response.
+    Requests that find the bucket empty wait until a point has refilled.
+
+    https://dev.twitch.tv/docs/api/guide/#twitch-rate-limits
+    """
+
+    def __init__(
+        self,
+        limit: int = constants.RATELIMIT_DEFAULT_POINTS,
+        refill_period: float = constants.RATELIMIT_REFILL_PERIOD,
+    ) -> None:
+        self.limit = limit
+        self.refill_period = refill_period
+        self.tokens = float(limit)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def refill_rate(self) -> float:
+        """Points regained per second."""
+        return self.limit / self.refill_period
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self.tokens = min(float(self.limit), self.tokens + elapsed * self.refill_rate)
+        self._updated_at = now
+
+    def available(self) -> float:
+        """Points left in the bucket right now, 0 while held back by a 429."""
+        if time.monotonic() < self._blocked_until:
+            return 0.0
+        self._refill()
+        return max(self.tokens, 0.0)
+
+    async def acquire(self) -> None:
+        """Takes one point from the bucket, waiting for it to refill if needed."""
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            delay = (1 - self.tokens) / self.refill_rate
+            log.debug('ratelimit: bucket empty, waiting %.3fs', delay)
+            await asyncio.sleep(delay)
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Syncs the bucket with the `Ratelimit-*` headers of a response."""
+        limit = headers.get('Ratelimit-Limit')
+        remaining = headers.get('Ratelimit-Remaining')
+        reset = headers.get('Ratelimit-Reset')
+        if limit is None or remaining is None or reset is None:
+            return
+
+        self.limit = int(limit)
+        deficit = self.limit - int(remaining)
+        reset_in = float(reset) - time.time()
+        if deficit > 0 and reset_in > 0:
+            # `Ratelimit-Reset` is when the bucket is full again.
+            self.refill_period = reset_in * self.limit / deficit
+
+        self._refill()
+        # points handed out to requests still in flight are not in `remaining` yet.
+        self.tokens = min(self.tokens, float(remaining))
+
+    def reset_delay(self, headers: httpx.Headers) -> float:
+        """Seconds until `Ratelimit-Reset`, bounded by one refill period."""
+        reset = headers.get('Ratelimit-Reset')
+        if reset is None:
+            return 1 / self.refill_rate
+        return min(max(float(reset) - time.time(), 0.0), self.refill_period)
+
+    def block(self, headers: httpx.Headers) -> float:
+        """Empties the bucket and holds back `acquire` until `Ratelimit-Reset`, returns the delay."""
+        delay = self.reset_delay(headers)
+        self._refill()
+        self.tokens = 0.0
+        self._blocked_until = time.monotonic() + delay
+        return delay
+
+    async def wait_for_reset(self, headers: httpx.Headers) -> None:
+        """
+        Empties the bucket and sleeps until `Ratelimit-Reset`.
+
+        Every other request waiting in `acquire` is held back until then as well.
+        """
+        delay = self.block(headers)
+        log.warning('ratelimit: got 429, waiting %.3fs until reset', delay)
+        await asyncio.sleep(delay)
@@ -0,0 +1,193 @@
+# retry.py
+from __future__ import annotations
+
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import TypeVar
+
+import httpx
+
+from twitchAPI import constants
+from twitchAPI._exceptions import CircuitOpenError
+
+if TYPE_CHECKING:
+    from tenacity import AsyncRetrying
+    from tenacity import RetryCallState
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_CLOSED, _OPEN, _HALF_OPEN = 'closed', 'open', 'half-open'
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Seconds asked for by the `Retry-After` header of a response, if any."""
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are sent again, and how long to wait before.
+
+    Only transient failures are retried: a status in `statuses` (the 5xx a
+    degraded Helix answers with), timeouts and network errors. A 400, 401 or
+    404 fails right away, a 429 has already been waited out and sent again by
+    `HelixAPI.send_request`. Waits use decorrelated jitter, each one
+    random between `base_delay` and three times the previous one, capped at
+    `max_delay`, so many clients failing together don't retry in lockstep.
+    A `Retry-After` header is always honoured.
+
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = constants.MAX_RETRY_ATTEMPTS,
+        base_delay: float = constants.RETRY_BASE_DELAY,
+        max_delay: float = constants.RETRY_MAX_DELAY,
+        statuses: frozenset[int] = constants.RETRY_STATUSES,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = statuses
+
+    def is_retryable(self, err: BaseException) -> bool:
+        if isinstance(err, httpx.HTTPStatusError):
+            return err.response.status_code in self.statuses
+        return isinstance(err, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError))
+
+    def wait(self, retry_state: RetryCallState) -> float:
+        """Seconds to wait before the next attempt."""
+        # `upcoming_sleep` still holds the previous wait at this point.
+        previous = max(retry_state.upcoming_sleep, self.base_delay)
+        delay = min(self.max_delay, random.uniform(self.base_delay, previous * 3))  # noqa: S311
+        err = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(err, httpx.HTTPStatusError):
+            asked = retry_after(err.response)
+            if asked is not None:
+                delay = max(delay, asked)
+        return delay
+
+    def retrying(self, on_retry: Callable[[RetryCallState], None] | None = None) -> AsyncRetrying:
+        """Returns a tenacity `AsyncRetrying` for this policy, calling `on_retry` before each wait."""
+        # tenacity is only imported once a request is about to be sent.
+        from tenacity import AsyncRetrying
+        from tenacity import before_sleep_log
+        from tenacity import retry_if_exception
+        from tenacity import stop_after_attempt
+
+        log_retry = before_sleep_log(log, logging.WARN)
+
+        def before_sleep(retry_state: RetryCallState) -> None:
+            log_retry(retry_state)
+            if on_retry is not None:
+                on_retry(retry_state)
+
+        return AsyncRetrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=self.wait,
+            retry=retry_if_exception(self.is_retryable),
+            before_sleep=before_sleep,
+        )
+
+    async def call(
+        self,
+        fn: Callable[..., Awaitable[T]],
+        *args: Any,
+        on_retry: Callable[[RetryCallState], None] | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Awaits `fn(*args, **kwargs)`, retrying it under this policy.
+
+        Raises:
+            tenacity.RetryError: If every attempt failed with a retryable error.
+        """
+        return await self.retrying(on_retry)(fn, *args, **kwargs)
+
+
+class CircuitBreaker:
+    """
+    Fails requests to an endpoint fast while it keeps failing.
+
+    After `failure_threshold` consecutive failures (5xx, timeouts or network
+    errors) the endpoint's circuit opens and its requests raise
+    `CircuitOpenError` without being sent. After `reset_timeout` seconds a
+    single request is let through as a probe: if it succeeds the circuit
+    closes, otherwise it stays open for another `reset_timeout`.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = constants.BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = constants.BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probing: dict[str, float] = {}
+
+    def state(self, endpoint: str) -> str:
+        opened_at = self._opened_at.get(endpoint)
+        if opened_at is None:
+            return _CLOSED
+        if time.monotonic() - opened_at < self.reset_timeout:
+            return _OPEN
+        return _HALF_OPEN
+
+    def before_request(self, endpoint: str) -> None:
+        """
+        Lets a request to `endpoint` through, or fails it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight.
+        """
+        state = self.state(endpoint)
+        if state == _CLOSED:
+            return
+        now = time.monotonic()
+        # a probe that never reported back (e.g. cancelled) is replaced after `reset_timeout`.
+        if state == _HALF_OPEN and now - self._probing.get(endpoint, -self.reset_timeout) >= self.reset_timeout:
+            log.info("breaker: probing endpoint='%s'", endpoint)
+            self._probing[endpoint] = now
+            return
+        retry_in = max(self._opened_at[endpoint] + self.reset_timeout - now, 0.0)
+        raise CircuitOpenError(endpoint, retry_in)
+
+    def record_success(self, endpoint: str) -> None:
+        if endpoint in self._opened_at:
+            log.info("breaker: endpoint='%s' recovered, closing circuit", endpoint)
+        self._failures.pop(endpoint, None)
+        self._opened_at.pop(endpoint, None)
+        self._probing.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str) -> None:
+        failures = self._failures.get(endpoint, 0) + 1
+        self._failures[endpoint] = failures
+        if endpoint in self._probing or failures >= self.failure_threshold:
+            if self.state(endpoint) != _OPEN:
+                log.warning("breaker: endpoint='%s' failed %s times, opening circuit", endpoint, failures)
+            self._opened_at[endpoint] = time.monotonic()
+            self._probing.pop(endpoint, None)
+
+    def stats(self) -> dict[str, str]:
+        return {endpoint: self.state(endpoint) for endpoint in set(self._failures) | set(self._opened_at)}
@@ -0,0 +1,45 @@
+# singleflight.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+from typing import TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent callers asking for the same key.
+
+    The first caller runs the call; everyone arriving while it is still running
+    awaits the same result (or exception) instead of starting their own.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            log.debug("singleflight: joined in-flight call key='%s'", key)
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = asyncio.ensure_future(fn())
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # shielded so a cancelled caller doesn't cancel the call for the others.
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, int]:
+        return {'calls': self.calls, 'coalesced': self.coalesced, 'in_flight': len(self._in_flight)}
@@ -0,0 +1,273 @@
+# store.py
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+
+from twitchAPI import constants
+from twitchAPI.models.category import Game
+from twitchAPI.models.channels import ChannelInfo
+from twitchAPI.models.channels import ChannelUser
+from twitchAPI.models.content import FollowedContentClip
+from twitchAPI.models.content import FollowedContentVideo
+from twitchAPI.models.streams import FollowedStream
+from twitchAPI.utils import parse_duration
+from twitchAPI.utils import parse_timestamp
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS streams (
+    user_id TEXT PRIMARY KEY,
+    game_id TEXT,
+    viewer_count INTEGER,
+    started_at INTEGER,
+    data TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS streams_game_id ON streams (game_id, viewer_count);
+CREATE INDEX IF NOT EXISTS streams_started_at ON streams (started_at);
+
+CREATE TABLE IF NOT EXISTS channels (
+    broadcaster_id TEXT PRIMARY KEY,
+    followed_at INTEGER,
+    data TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS channels_followed_at ON channels (followed_at);
+
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    login TEXT,
+    data TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_login ON users (login);
+
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    data TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clips (
+    id TEXT PRIMARY KEY,
+    user_id TEXT,
+    game_id TEXT,
+    created_at INTEGER,
+    view_count INTEGER,
+    data TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS clips_user_id ON clips (user_id, created_at);
+CREATE INDEX IF NOT EXISTS clips_game_id ON clips (game_id, created_at);
+CREATE INDEX IF NOT EXISTS clips_created_at ON clips (created_at);
+
+CREATE TABLE IF NOT EXISTS videos (
+    id TEXT PRIMARY KEY,
+    user_id TEXT,
+    created_at INTEGER,
+    duration INTEGER,
+    data TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS videos_user_id ON videos (user_id, created_at);
+CREATE INDEX IF NOT EXISTS videos_created_at ON videos (created_at);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _as_dict(item: Any) -> dict[str, Any]:
+    """Returns the raw fields of a model, or the item itself if already a dict."""
+    if dataclasses.is_dataclass(item):
+        return {f.name: getattr(item, f.name) for f in dataclasses.fields(item) if f.init}
+    return item
+
+
+class SnapshotStore:
+    """
+    Local SQLite snapshot of the data fetched from Helix.
+
+    Each item is kept as its raw JSON next to the indexed columns the queries
+    filter and sort on. Writes go in bulk, one transaction per call. The
+    connection can be shared with a worker thread, calls are serialized.
+
+    Example:
+        store = SnapshotStore('twitch.db')
+        store.save_streams(streams)
+        store.live_streams(game_id='509658')
+    """
+
+    def __init__(self, path: str | Path = ':memory:') -> None:
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            if self.path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, sql: str, rows: Iterable[tuple[Any, ...]], clear: str | None = None) -> int:
+        with self._lock, self._conn:
+            if clear is not None:
+                self._conn.execute(clear)
+            cursor = self._conn.executemany(sql, rows)
+        return cursor.rowcount
+
+    def _read(self, sql: str, params: tuple[Any, ...] = ()) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def _read_ids(self, table: str, ids: list[str]) -> list[dict[str, Any]]:
+        """Reads the rows of `table` by id, in chunks that stay under SQLite's variable limit."""
+        data: list[dict[str, Any]] = []
+        for start in range(0, len(ids), constants.STORE_MAX_VARIABLES):
+            chunk = tuple(ids[start : start + constants.STORE_MAX_VARIABLES])
+            placeholders = ', '.join('?' * len(chunk))
+            data.extend(self._read(f'SELECT data FROM {table} WHERE id IN ({placeholders})', chunk))  # noqa: S608
+        return data
+
+    def save_streams(self, streams: Iterable[Any], replace: bool = True) -> int:
+        """Stores live streams, by default replacing the previous snapshot."""
+        now = int(time.time())
+        rows = (
+            (s['user_id'], s['game_id'], s['viewer_count'], parse_timestamp(s['started_at']), json.dumps(s), now)
+            for s in map(_as_dict, streams)
+        )
+        return self._write(
+            'INSERT OR REPLACE INTO streams VALUES (?, ?, ?, ?, ?, ?)',
+            rows,
+            clear='DELETE FROM streams' if replace else None,
+        )
+
+    def save_channels(self, channels: Iterable[Any], replace: bool = False) -> int:
+        """Stores followed channels, `replace=True` for a full list."""
+        now = int(time.time())
+        rows = (
+            (c['broadcaster_id'], parse_timestamp(c['followed_at']), json.dumps(c), now)
+            for c in map(_as_dict, channels)
+        )
+        return self._write(
+            'INSERT OR REPLACE INTO channels VALUES (?, ?, ?, ?)',
+            rows,
+            clear='DELETE FROM channels' if replace else None,
+        )
+
+    def save_users(self, users: Iterable[Any]) -> int:
+        now = int(time.time())
+        rows = ((u['id'], u['login'], json.dumps(u), now) for u in map(_as_dict, users))
+        return self._write('INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?)', rows)
+
+    def save_games(self, games: Iterable[Any]) -> int:
+        now = int(time.time())
+        rows = ((g['id'], g['name'], json.dumps(g), now) for g in map(_as_dict, games))
+        return self._write('INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?)', rows)
+
+    def save_clips(self, clips: Iterable[Any]) -> int:
+        now = int(time.time())
+        rows = (
+            (
+                c['id'],
+                c['broadcaster_id'],
+                c['game_id'],
+                parse_timestamp(c['created_at']),
+                c['view_count'],
+                json.dumps(c),
+                now,
+            )
+            for c in map(_as_dict, clips)
+        )
+        return self._write('INSERT OR REPLACE INTO clips VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def save_videos(self, videos: Iterable[Any]) -> int:
+        now = int(time.time())
+        rows = (
+            (
+                v['id'],
+                v['user_id'],
+                parse_timestamp(v['created_at']),
+                parse_duration(v['duration']),
+                json.dumps(v),
+                now,
+            )
+            for v in map(_as_dict, videos)
+        )
+        return self._write('INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?, ?, ?)', rows)
+
+    def live_streams(self, game_id: str | None = None, limit: int = -1) -> list[FollowedStream]:
+        """Returns the stored live streams, optionally of one game, sorted by viewers."""
+        if game_id is None:
+            data = self._read('SELECT data FROM streams ORDER BY viewer_count DESC LIMIT ?', (limit,))
+        else:
+            data = self._read(
+                'SELECT data FROM streams WHERE game_id = ? ORDER BY viewer_count DESC LIMIT ?',
+                (game_id, limit),
+            )
+        return [FollowedStream(**s) for s in data]
+
+    def channels(self, followed_since: int = 0) -> list[ChannelInfo]:
+        """Returns the stored followed channels, newest follow first."""
+        data = self._read(
+            'SELECT data FROM channels WHERE followed_at >= ? ORDER BY followed_at DESC',
+            (followed_since,),
+        )
+        return [ChannelInfo(**c) for c in data]
+
+    def remove_channels(self, broadcaster_ids: list[str]) -> int:
+        return self._write('DELETE FROM channels WHERE broadcaster_id = ?', ((i,) for i in broadcaster_ids))
+
+    def users(self, ids: list[str]) -> list[ChannelUser]:
+        return [ChannelUser(**u) for u in self._read_ids('users', ids)]
+
+    def games(self, ids: list[str]) -> list[Game]:
+        return [Game(**g) for g in self._read_ids('games', ids)]
+
+    def clips_since(self, since: int, user_id: str | None = None) -> list[FollowedContentClip]:
+        """Returns the stored clips created at or after `since` (epoch seconds), newest first."""
+        if user_id is None:
+            data = self._read('SELECT data FROM clips WHERE created_at >= ? ORDER BY created_at DESC', (since,))
+        else:
+            data = self._read(
+                'SELECT data FROM clips WHERE user_id = ? AND created_at >= ? ORDER BY created_at DESC',
+                (user_id, since),
+            )
+        return [FollowedContentClip(**c) for c in data]
+
+    def videos_since(self, since: int, user_id: str | None = None) -> list[FollowedContentVideo]:
+        """Returns the stored videos created at or after `since` (epoch seconds), newest first."""
+        if user_id is None:
+            data = self._read('SELECT data FROM videos WHERE created_at >= ? ORDER BY created_at DESC', (since,))
+        else:
+            data = self._read(
+                'SELECT data FROM videos WHERE user_id = ? AND created_at >= ? ORDER BY created_at DESC',
+                (user_id, since),
+            )
+        return [FollowedContentVideo(**v) for v in data]
+
+    def get_meta(self, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_meta(self, key: str, value: Any) -> None:
+        self._write('INSERT OR REPLACE INTO meta VALUES (?, ?)', [(key, json.dumps(value))])
@@ -0,0 +1,76 @@
+# sync.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+
+@dataclass
+class FollowedSyncState:
+    """
+    What is known about the user's follows between two syncs.
+
+    It round-trips through `to_dict`/`from_dict` so it can be persisted as JSON.
+
+    Attributes:
+        last_followed_at (str | None): The newest `followed_at` seen (ISO 8601 format).
+        known_ids (set[str]): The broadcaster IDs the user follows.
+        cursor (str | None): Where an interrupted full resync left off.
+        resync_ids (set[str]): The broadcaster IDs seen so far by that resync.
+        resync_added (list[dict[str, Any]]): The new follows found so far by that resync.
+        resynced_at (float | None): When the last full resync finished (epoch seconds).
+    """
+
+    last_followed_at: str | None = None
+    known_ids: set[str] = field(default_factory=set)
+    cursor: str | None = None
+    resync_ids: set[str] = field(default_factory=set)
+    resync_added: list[dict[str, Any]] = field(default_factory=list)
+    resynced_at: float | None = None
+
+    def is_known(self, item: dict[str, Any]) -> bool:
+        if item['broadcaster_id'] in self.known_ids:
+            return True
+        return self.last_followed_at is not None and item['followed_at'] <= self.last_followed_at
+
+    def add(self, items: list[dict[str, Any]]) -> None:
+        for item in items:
+            self.known_ids.add(item['broadcaster_id'])
+            if self.last_followed_at is None or item['followed_at'] > self.last_followed_at:
+                self.last_followed_at = item['followed_at']
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'last_followed_at': self.last_followed_at,
+            'known_ids': sorted(self.known_ids),
+            'cursor': self.cursor,
+            'resync_ids': sorted(self.resync_ids),
+            'resync_added': self.resync_added,
+            'resynced_at': self.resynced_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FollowedSyncState:
+        return cls(
+            last_followed_at=data.get('last_followed_at'),
+            known_ids=set(data.get('known_ids', [])),
+            cursor=data.get('cursor'),
+            resync_ids=set(data.get('resync_ids', [])),
+            resync_added=list(data.get('resync_added', [])),
+            resynced_at=data.get('resynced_at'),
+        )
+
+
+@dataclass
+class FollowedSyncResult:
+    """
+    Changes found by a follows sync.
+
+    Attributes:
+        added (list[dict[str, Any]]): The new follows, newest first.
+        removed (list[str]): The unfollowed broadcaster IDs, only filled by a full resync.
+    """
+
+    added: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
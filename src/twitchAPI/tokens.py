@@ -0,0 +1,135 @@
+# tokens.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+from typing import Callable
+
+import httpx
+
+from twitchAPI import constants
+from twitchAPI._exceptions import TokenRefreshError
+
+if TYPE_CHECKING:
+    from twitchAPI.auth import UserAuthenticator
+
+log = logging.getLogger(__name__)
+
+
+class TokenManager:
+    """
+    Keeps the access token of a `HelixAPI` valid while it runs.
+
+    The token is validated against `validate_url` before the first request
+    and every `validate_interval` seconds after, and refreshed through
+    `token_url` once it is within `refresh_margin` seconds of expiring.
+    Requests read the `Authorization` header from here when they are sent,
+    so a refreshed token is picked up without rebuilding the client.
+
+    A request answered with a 401 calls `refresh` with the token it was sent
+    with. Concurrent callers wait on a single refresh: the first one does it,
+    the others find the token already replaced and just resend.
+
+    Example:
+        api = HelixAPI(UserAuthenticator.load(), HelixConfig(tokens=TokenManager(on_refresh=save_tokens)))
+    """
+
+    def __init__(
+        self,
+        validate_url: str = constants.OAUTH_VALIDATE_URL,
+        token_url: str = constants.OAUTH_TOKEN_URL,
+        refresh_margin: float = constants.TOKEN_REFRESH_MARGIN,
+        validate_interval: float = constants.TOKEN_VALIDATE_INTERVAL,
+        on_refresh: Callable[[UserAuthenticator], None] | None = None,
+    ) -> None:
+        self.validate_url = validate_url
+        self.token_url = token_url
+        self.refresh_margin = refresh_margin
+        self.validate_interval = validate_interval
+        self.on_refresh = on_refresh
+        self.expires_at: float | None = None
+        self.validated_at: float | None = None
+        self.refreshes = 0
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # made in the running loop: before Python 3.10 a lock binds to the loop current when it is built.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def headers(self, auth: UserAuthenticator) -> dict[str, str]:
+        return {'Client-ID': auth.client_id or '', 'Authorization': f'Bearer {auth.access_token}'}
+
+    def expires_in(self) -> float | None:
+        """Seconds until the token expires, None if unknown or it doesn't."""
+        return None if self.expires_at is None else self.expires_at - time.monotonic()
+
+    async def ensure_fresh(self, client: httpx.AsyncClient, auth: UserAuthenticator) -> None:
+        """Validates the token if it is due, and refreshes it if it is about to expire."""
+        now = time.monotonic()
+        if self.validated_at is None or now - self.validated_at >= self.validate_interval:
+            async with self._get_lock():
+                if self.validated_at is None or time.monotonic() - self.validated_at >= self.validate_interval:
+                    await self._validate(client, auth)
+        expires_in = self.expires_in()
+        if expires_in is not None and expires_in <= self.refresh_margin:
+            await self.refresh(client, auth, auth.access_token)
+
+    async def _validate(self, client: httpx.AsyncClient, auth: UserAuthenticator) -> None:
+        response = await client.get(self.validate_url, headers={'Authorization': f'OAuth {auth.access_token}'})
+        self.validated_at = time.monotonic()
+        if response.status_code == httpx.codes.UNAUTHORIZED:
+            log.warning('tokens: access token is no longer valid')
+            self.expires_at = time.monotonic()
+            return
+        response.raise_for_status()
+        data = response.json()
+        expires_in = data.get('expires_in') or 0
+        # tokens that never expire report 0.
+        self.expires_at = time.monotonic() + expires_in if expires_in > 0 else None
+        log.debug("tokens: validated login='%s' expires_in='%s'", data.get('login'), expires_in)
+
+    async def refresh(self, client: httpx.AsyncClient, auth: UserAuthenticator, stale_token: str | None) -> None:
+        """
+        Refreshes the token, unless `stale_token` was already replaced.
+
+        Raises:
+            TokenRefreshError: If there is no refresh token, or Twitch rejected it.
+        """
+        async with self._get_lock():
+            if auth.access_token != stale_token:
+                return
+            if not auth.refresh_token or not auth.client_secret:
+                err_msg = 'access token expired and no refresh token and client secret to refresh it'
+                raise TokenRefreshError(err_msg)
+
+            log.info('tokens: refreshing access token')
+            response = await client.post(
+                self.token_url,
+                data={
+                    'grant_type': 'refresh_token',
+                    'refresh_token': auth.refresh_token,
+                    'client_id': auth.client_id,
+                    'client_secret': auth.client_secret,
+                },
+            )
+            if response.is_error:
+                err_msg = f'refresh failed with status {response.status_code}: {response.text}'
+                raise TokenRefreshError(err_msg)
+
+            data = response.json()
+            auth.access_token = data['access_token']
+            auth.refresh_token = data.get('refresh_token', auth.refresh_token)
+            expires_in = data.get('expires_in') or 0
+            self.expires_at = time.monotonic() + expires_in if expires_in > 0 else None
+            self.validated_at = time.monotonic()
+            self.refreshes += 1
+
+        if self.on_refresh is not None:
+            self.on_refresh(auth)
@@ -0,0 +1,62 @@
+# transport.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from twitchAPI import constants
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    Connection pool, keep-alive, HTTP/2 and timeout settings of the `HelixAPI` client.
+
+    Attributes:
+        max_connections (int): The maximum number of open connections.
+        max_keepalive_connections (int): The maximum number of idle connections kept open.
+        keepalive_expiry (float): Seconds an idle connection is kept open.
+        http2 (bool): Multiplex requests over HTTP/2, needs `httpx[http2]`. Defaults to False.
+        connect_timeout (float): Seconds to wait for a connection to be established.
+        read_timeout (float): Seconds to wait for a chunk of the response.
+        write_timeout (float): Seconds to wait for a chunk of the request to be sent.
+        pool_timeout (float): Seconds to wait for a connection from the pool.
+        transport (httpx.AsyncBaseTransport | None): A custom transport, e.g. an
+        `httpx.MockTransport` to run against a local stand-in server. Defaults to None.
+    """
+
+    max_connections: int = constants.MAX_CONNECTIONS
+    max_keepalive_connections: int = constants.MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = constants.KEEPALIVE_EXPIRY
+    http2: bool = False
+    connect_timeout: float = constants.CONNECT_TIMEOUT
+    read_timeout: float = constants.READ_TIMEOUT
+    write_timeout: float = constants.WRITE_TIMEOUT
+    pool_timeout: float = constants.POOL_TIMEOUT
+    transport: httpx.AsyncBaseTransport | None = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for `httpx.AsyncClient`."""
+        return {
+            'limits': self.limits(),
+            'timeout': self.timeout(),
+            'http2': self.http2,
+            'transport': self.transport,
+        }
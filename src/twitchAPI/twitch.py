@@ -2,64 +2,317 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import heapq
 import logging
+import time
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
 from typing import Iterable
 
+from twitchAPI import constants
 from twitchAPI.models.category import Game
 from twitchAPI.models.channels import Channel
 from twitchAPI.models.channels import ChannelInfo
 from twitchAPI.models.content import FollowedContentClip
 from twitchAPI.models.content import FollowedContentVideo
+from twitchAPI.models.content import UserContent
 from twitchAPI.models.streams import FollowedStream
 
+# views, column tables, the poller and the sync state are imported by the
+# methods that use them, they are not needed to load this module.
 if TYPE_CHECKING:
     from twitchAPI.api_helix import HelixAPI
+    from twitchAPI.models.compact import ClipTable
+    from twitchAPI.models.compact import StreamTable
+    from twitchAPI.models.views import LazyView
+    from twitchAPI.poller import StreamPoller
+    from twitchAPI.store import SnapshotStore
 
 logger = logging.getLogger(__name__)
 
 
+FOLLOWED_SYNC_KEY = 'followed_sync'
+
+
 class Twitch:
-    def __init__(self, api: HelixAPI) -> None:
+    def __init__(self, api: HelixAPI, store: SnapshotStore | None = None) -> None:
         self.api = api
+        self.store = store
         self._online: int = 0
 
+    async def _in_thread(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
     @property
     def online(self) -> int:
         return self._online
 
     async def channels(self) -> list[ChannelInfo]:
-        """Fetches information about all channels that the user follows."""
-        data = await self.api.channels.all()
-        return [ChannelInfo(**c) for c in data]
+        """
+        Fetches information about the channels that the user follows.
+
+        The list is capped at `MAX_FOLLOWED_CHANNELS`, so it is upserted into the
+        snapshot store; `refresh_channels` is what removes unfollowed channels.
+        """
+        data = await self.api.channels.all(model=ChannelInfo)
+        if self.store is not None:
+            await self._in_thread(self.store.save_channels, data)
+        return list(data)
 
     async def streams(self) -> list[FollowedStream]:
         """Fetches information about all streams that the user follows."""
-        data = await self.api.channels.streams()
-        if len(data) > 0:
-            self._online = len(data)
-        return [FollowedStream(**c) for c in data]
+        data = await self.api.channels.streams(model=FollowedStream)
+        self._online = len(data)
+        if self.store is not None:
+            await self._in_thread(self.store.save_streams, data)
+        return list(data)
 
-    async def clips(self, user_id: str) -> Iterable[FollowedContentClip]:
-        """Fetches all clips from the given user_id."""
-        data = await self.api.content.clips(user_id=user_id)
-        return (FollowedContentClip(**clip) for clip in data)
+    def cached_channels(self) -> list[ChannelInfo]:
+        """Returns the followed channels from the snapshot store, without any request."""
+        return self.store.channels() if self.store is not None else []
+
+    def cached_streams(self) -> list[FollowedStream]:
+        """Returns the followed streams from the snapshot store, without any request."""
+        return self.store.live_streams() if self.store is not None else []
+
+    async def refresh_channels(self, full: bool = False, resync_interval: float | None = None) -> None:
+        """
+        Brings the stored followed channels up to date.
+
+        The first refresh does a full sync; later ones only fetch the follows
+        newer than the last one seen, see `HelixChannels.sync_followed`. Only a
+        full sync finds unfollowed channels, pass `full=True` to force one or
+        `resync_interval` to run one when the last is older than that many
+        seconds. A full sync stores each page's follows along with its cursor,
+        and an interrupted one is resumed by the next refresh.
+        """
+        from twitchAPI.sync import FollowedSyncState
+
+        if self.store is None:
+            return
+        store = self.store
+        state = FollowedSyncState.from_dict(await self._in_thread(store.get_meta, FOLLOWED_SYNC_KEY) or {})
+
+        async def checkpoint(added: list[dict[str, Any]]) -> None:
+            await self._in_thread(store.save_channels, added)
+            await self._in_thread(store.set_meta, FOLLOWED_SYNC_KEY, state.to_dict())
+
+        stale = resync_interval is not None and time.time() - (state.resynced_at or 0) >= resync_interval
+        full = full or stale or not state.known_ids or state.cursor is not None
+        result = await self.api.channels.sync_followed(state, full=full, on_page=checkpoint)
+        if full:
+            state.resynced_at = time.time()
+        else:
+            await self._in_thread(store.save_channels, result.added)
+        if result.removed:
+            await self._in_thread(self.store.remove_channels, result.removed)
+        await self._in_thread(self.store.set_meta, FOLLOWED_SYNC_KEY, state.to_dict())
+
+    def refresh_in_background(
+        self,
+        interval: float = 60.0,
+        resync_interval: float = constants.FOLLOWED_RESYNC_INTERVAL,
+    ) -> asyncio.Task[None]:
+        """
+        Starts refreshing the stored channels and streams every `interval` seconds.
+
+        The channels are fully resynced every `resync_interval` seconds, which
+        drops the unfollowed ones. Meant to run after a warm start from
+        `cached_channels`/`cached_streams`; cancel the returned task to stop it.
+        """
+
+        async def refresh() -> None:
+            while True:
+                try:
+                    await self.refresh_channels(resync_interval=resync_interval)
+                    await self.streams()
+                except Exception:
+                    logger.exception('background refresh failed')
+                await asyncio.sleep(interval)
+
+        return asyncio.ensure_future(refresh())
+
+    def stream_poller(self, **kwargs: Any) -> StreamPoller:
+        """
+        Returns a poller that emits changes in the followed streams.
+
+        Keyword arguments are passed on to `StreamPoller`.
+        """
+        from twitchAPI.poller import StreamPoller
+
+        return StreamPoller(self.api, **kwargs)
+
+    async def clips(self, user_id: str, lazy: bool = False) -> Iterable[FollowedContentClip] | Iterable[LazyView]:
+        """
+        Fetches all clips from the given user_id.
+
+        With `lazy=True` yields `ClipView`s that read the response on access.
+        """
+        if lazy:
+            from twitchAPI.models.views import ClipView
+
+            data = await self.api.content.clips(user_id=user_id)
+            return (ClipView(clip) for clip in data)
+        return iter(await self.api.content.clips(user_id=user_id, model=FollowedContentClip))
+
+    async def videos(self, user_id: str, lazy: bool = False) -> Iterable[FollowedContentVideo] | Iterable[LazyView]:
+        """
+        Fetches all videos from the given user_id.
+
+        With `lazy=True` yields `VideoView`s that read the response on access.
+        """
+        if lazy:
+            from twitchAPI.models.views import VideoView
 
-    async def videos(self, user_id: str) -> Iterable[FollowedContentVideo]:
-        """Fetches all videos from the given user_id."""
-        data = await self.api.content.videos(user_id=user_id)
-        return (FollowedContentVideo(**video) for video in data)
+            data = await self.api.content.videos(user_id=user_id)
+            return (VideoView(video) for video in data)
+        return iter(await self.api.content.videos(user_id=user_id, model=FollowedContentVideo))
 
-    async def games_by_query(self, query: str) -> Iterable[Game]:
-        """Fetches all games that match the given query."""
-        data = await self.api.content.search_categories(query)
-        return (Game(**item) for item in data)
+    async def _fan_out(
+        self,
+        fetch: Callable[[str], Awaitable[list[Any]]],
+        user_ids: list[str],
+        max_concurrency: int | None,
+        deadline: float | None,
+    ) -> AsyncIterator[UserContent[Any]]:
+        semaphore = asyncio.Semaphore(max_concurrency or self.api.max_concurrency)
 
-    async def streams_by_game_id(self, game_id: int) -> Iterable[FollowedStream]:
-        """Fetches all streams that match the given game_id."""
+        async def run(user_id: str) -> UserContent[Any]:
+            async with semaphore:
+                try:
+                    items = await asyncio.wait_for(fetch(user_id), timeout=deadline)
+                except Exception as err:  # noqa: BLE001
+                    logger.warning("fetch for user_id='%s' failed: %r", user_id, err)
+                    return UserContent(user_id, [], err)
+            return UserContent(user_id, items)
+
+        tasks = [asyncio.ensure_future(run(user_id)) for user_id in user_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def clips_for(
+        self,
+        user_ids: list[str],
+        max_concurrency: int | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[UserContent[FollowedContentClip]]:
+        """
+        Fetches the clips of many users, yielding each user's clips as soon as they arrive.
+
+        At most `max_concurrency` users are fetched at once (defaults to the
+        `HelixAPI` limit). A user taking longer than `deadline` seconds, or
+        failing, is yielded with no items and the error.
+        """
+
+        async def fetch(user_id: str) -> list[Any]:
+            return await self.api.content.clips(user_id=user_id, model=FollowedContentClip)
+
+        return self._fan_out(fetch, user_ids, max_concurrency, deadline)
+
+    def videos_for(
+        self,
+        user_ids: list[str],
+        max_concurrency: int | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[UserContent[FollowedContentVideo]]:
+        """Same as `clips_for`, for videos."""
+
+        async def fetch(user_id: str) -> list[Any]:
+            return await self.api.content.videos(user_id=user_id, model=FollowedContentVideo)
+
+        return self._fan_out(fetch, user_ids, max_concurrency, deadline)
+
+    async def clips_feed(
+        self,
+        user_ids: list[str],
+        max_concurrency: int | None = None,
+        deadline: float | None = None,
+    ) -> list[FollowedContentClip]:
+        """
+        Fetches the clips of many users as a single list, newest first.
+
+        Each user's clips are sorted on their own and then k-way merged, users
+        that failed or missed the deadline are left out.
+        """
+        runs = [
+            sorted(result.items, key=lambda c: c.created_at_ts, reverse=True)
+            async for result in self.clips_for(user_ids, max_concurrency, deadline)
+        ]
+        return list(heapq.merge(*runs, key=lambda c: c.created_at_ts, reverse=True))
+
+    async def videos_feed(
+        self,
+        user_ids: list[str],
+        max_concurrency: int | None = None,
+        deadline: float | None = None,
+    ) -> list[FollowedContentVideo]:
+        """Same as `clips_feed`, for videos."""
+        runs = [
+            sorted(result.items, key=lambda v: v.created_at_ts, reverse=True)
+            async for result in self.videos_for(user_ids, max_concurrency, deadline)
+        ]
+        return list(heapq.merge(*runs, key=lambda v: v.created_at_ts, reverse=True))
+
+    async def games_by_query(self, query: str, lazy: bool = False) -> Iterable[Game] | Iterable[LazyView]:
+        """
+        Fetches all games that match the given query.
+
+        With `lazy=True` yields `GameView`s that read the response on access.
+        """
+        if lazy:
+            from twitchAPI.models.views import GameView
+
+            data = await self.api.content.search_categories(query)
+            return (GameView(item) for item in data)
+        return iter(await self.api.content.search_categories(query, model=Game))
+
+    async def streams_by_game_id(
+        self,
+        game_id: int,
+        lazy: bool = False,
+    ) -> Iterable[FollowedStream] | Iterable[LazyView]:
+        """
+        Fetches all streams that match the given game_id.
+
+        With `lazy=True` yields `StreamView`s that read the response on access.
+        """
         logger.debug('getting streams by game_id: %s', game_id)
-        data = await self.api.channels.streams_by_game_id(game_id)
-        return (FollowedStream(**stream) for stream in data)
+        if lazy:
+            from twitchAPI.models.views import StreamView
+
+            data = await self.api.channels.streams_by_game_id(game_id)
+            return (StreamView(stream) for stream in data)
+        return iter(await self.api.channels.streams_by_game_id(game_id, model=FollowedStream))
+
+    async def streams_table_by_game_id(self, game_id: int, max_items: int | None = None) -> StreamTable:
+        """
+        Fetches the streams that match the given game_id into a compact `StreamTable`.
+
+        Pages are appended to the table as they arrive, meant for large sweeps.
+        """
+        from twitchAPI.models.compact import StreamTable
+
+        table = StreamTable()
+        async for stream in self.api.channels.iter_streams_by_game_id(game_id, max_items=max_items):
+            table.append(stream)
+        return table
+
+    async def clips_table(self, user_id: str) -> ClipTable:
+        """Fetches all clips from the given user_id into a compact `ClipTable`."""
+        from twitchAPI.models.compact import ClipTable
+
+        data = await self.api.content.clips(user_id=user_id)
+        return ClipTable(data)
 
     async def channels_by_query(self, query: str, live_only: bool = True) -> Iterable[Channel]:
         data = await self.api.channels.search(query, live_only=live_only)
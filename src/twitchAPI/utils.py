@@ -1,6 +1,12 @@
 # utils.py
 from __future__ import annotations
 
+import calendar
+import re
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Hashable
 from typing import Iterator
 from typing import Mapping
 from typing import TypeVar
@@ -19,3 +25,72 @@ def group_into_batches(ids: list[str], batch_size: int) -> Iterator[list[str]]:
 
 def merge_maps(maptwo: Mapping[str, T], mapone: Mapping[str, U]) -> Mapping[str, T | U]:
     return {**mapone, **{k: v for k, v in maptwo.items() if k not in mapone}}
+
+
+def _normalize_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def normalize_params(params: Mapping[str, Any]) -> tuple[Hashable, ...]:
+    """
+    Returns a hashable, order-independent form of the query params.
+
+    Values are rendered the way `httpx` sends them, so `{'first': 20}` and
+    `{'first': '20'}` produce the same key.
+    """
+    normalized: list[Hashable] = []
+    for key in sorted(params):
+        value = params[key]
+        if isinstance(value, (list, tuple)):
+            normalized.append((key, tuple(_normalize_value(v) for v in value)))
+        elif value is not None:
+            normalized.append((key, _normalize_value(value)))
+    return tuple(normalized)
+
+
+_DURATION_RE = re.compile(r'(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?')
+
+
+def parse_timestamp(value: str | None) -> int:
+    """
+    Parses a Helix RFC 3339 UTC timestamp into epoch seconds, 0 if empty.
+
+    >>> parse_timestamp('2021-03-10T15:04:21Z')
+    1615388661
+    """
+    if not value:
+        return 0
+    return calendar.timegm(
+        (int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), int(value[14:16]), int(value[17:19]))
+    )
+
+
+def format_timestamp(value: datetime) -> str:
+    """
+    Formats a datetime as a Helix RFC 3339 UTC timestamp, naive values are taken as UTC.
+
+    >>> format_timestamp(datetime(2021, 3, 10, 15, 4, 21, tzinfo=timezone.utc))
+    '2021-03-10T15:04:21Z'
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def parse_duration(value: str | None) -> int:
+    """
+    Parses a Helix video duration such as `1h2m3s` into seconds, 0 if empty.
+
+    >>> parse_duration('1h2m3s')
+    3723
+    """
+    if not value:
+        return 0
+    match = _DURATION_RE.fullmatch(value)
+    if match is None:
+        err_msg = f'invalid duration: {value!r}'
+        raise ValueError(err_msg)
+    hours, minutes, seconds = (int(g) if g else 0 for g in match.groups())
+    return hours * 3600 + minutes * 60 + seconds
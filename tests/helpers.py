@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import cast
+
+import httpx
+
+from twitchAPI.api_helix import HelixAPI
+from twitchAPI.auth import UserAuthenticator
+from twitchAPI.config import HelixConfig
+from twitchAPI.transport import TransportConfig
+
+Handler = Callable[[httpx.Request], httpx.Response]
+AsyncHandler = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+def make_auth(**kwargs: Any) -> UserAuthenticator:
+    return UserAuthenticator(**{'access_token': 'token', 'client_id': 'client', 'user_id': '1', **kwargs})
+
+
+def make_api(handler: Handler | AsyncHandler, auth: UserAuthenticator | None = None, **kwargs: Any) -> HelixAPI:
+    """Returns a `HelixAPI` whose requests are answered by `handler`, which may be async."""
+    # `MockTransport` awaits async handlers, its annotation only admits sync ones.
+    transport = TransportConfig(transport=httpx.MockTransport(cast(Handler, handler)))
+    return HelixAPI(auth or make_auth(), HelixConfig(transport=transport, **kwargs))
+
+
+def paged_handler(
+    total: int,
+    requests: list[httpx.Request] | None = None,
+    item: Callable[[int], dict[str, Any]] = lambda i: {'id': str(i)},
+) -> Handler:
+    """Serves `total` items, the cursor is the offset of the next page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        params = request.url.params
+        start = int(params.get('after', 0))
+        end = min(total, start + int(params.get('first', 20)))
+        pagination = {'cursor': str(end)} if end < total else {}
+        return httpx.Response(200, json={'data': [item(i) for i in range(start, end)], 'pagination': pagination})
+
+    return handler
+
+
+def follow(i: int) -> dict[str, Any]:
+    """A followed channel, newest first like Helix."""
+    return {
+        'broadcaster_id': str(i),
+        'broadcaster_login': f'user{i}',
+        'broadcaster_name': f'User{i}',
+        'followed_at': f'2024-01-01T00:{59 - i // 60:02d}:{59 - i % 60:02d}Z',
+    }
+
+
+def stream_item(i: int) -> dict[str, Any]:
+    return {
+        'id': str(40_000_000_000 + i),
+        'game_id': str(i % 3),
+        'game_name': f'Game {i % 3}',
+        'is_mature': i % 2 == 0,
+        'language': 'en',
+        'started_at': f'2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z',
+        'tag_ids': [],
+        'tags': ['English', f'tag{i % 5}'],
+        'thumbnail_url': f'https://static-cdn.jtvnw.net/previews-ttv/live_user_user{i}-{{width}}x{{height}}.jpg',
+        'title': f'stream title number {i}',
+        'type': 'live',
+        'user_id': str(100_000 + i),
+        'user_login': f'user{i}',
+        'user_name': f'User{i}',
+        'viewer_count': 1000 - i,
+    }
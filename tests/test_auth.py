@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers import make_auth
+from twitchAPI._exceptions import EnvValidationError
+from twitchAPI.auth import UserAuthenticator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_validation_checks_the_required_credentials_only() -> None:
+    auth = make_auth()
+    auth.validation()
+    assert auth.ok is True
+
+    with pytest.raises(EnvValidationError, match='user_id'):
+        make_auth(user_id=None).validation()
+
+
+def test_dumps_like_the_pydantic_model() -> None:
+    auth = make_auth(refresh_token='refresh')
+    assert auth.model_dump() == auth.dict() == {
+        'access_token': 'token',
+        'client_id': 'client',
+        'user_id': '1',
+        'ok': False,
+        'refresh_token': 'refresh',
+        'client_secret': None,
+    }
+    assert auth.model_dump(include={'user_id', 'ok'}) == {'user_id': '1', 'ok': False}
+    assert 'access_token' not in auth.model_dump(exclude={'access_token'})
+    assert UserAuthenticator.model_validate({**auth.model_dump(), 'extra': 1}) == auth
+
+
+def test_load_reads_the_environment(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    for name, value in {
+        'TWITCH_ACCESS_TOKEN': 'token',
+        'TWITCH_CLIENT_ID': 'client',
+        'TWITCH_USER_ID': '1',
+        'TWITCH_REFRESH_TOKEN': 'refresh',
+    }.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv('TWITCH_CLIENT_SECRET', raising=False)
+    monkeypatch.chdir(str(tmp_path))
+
+    auth = UserAuthenticator.load()
+    assert (auth.access_token, auth.client_id, auth.user_id, auth.refresh_token) == ('token', 'client', '1', 'refresh')
+    assert auth.client_secret is None
+
+
+def test_pydantic_is_never_imported() -> None:
+    code = 'import sys, twitchAPI; twitchAPI.UserAuthenticator; assert "pydantic" not in sys.modules'
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, '-c', code], check=True, env=env)  # noqa: S603
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import httpx
+
+from tests.helpers import Handler
+from tests.helpers import make_api
+from twitchAPI.api_helix import HelixContent
+from twitchAPI.utils import format_timestamp
+from twitchAPI.utils import parse_timestamp
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def clips_handler(created: list[datetime], requests: list[httpx.Request]) -> Handler:
+    """Serves one clip per entry of `created`, filtered by the requested range and paged by offset."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        params = request.url.params
+        since, until = parse_timestamp(params['started_at']), parse_timestamp(params['ended_at'])
+        clips = [
+            {'id': str(i), 'created_at': format_timestamp(at)}
+            for i, at in enumerate(created)
+            if since <= int(at.timestamp()) < until
+        ]
+        start = int(params.get('after', 0))
+        end = min(len(clips), start + int(params['first']))
+        pagination = {'cursor': str(end)} if end < len(clips) else {}
+        return httpx.Response(200, json={'data': clips[start:end], 'pagination': pagination})
+
+    return handler
+
+
+def backfill(created: list[datetime], hours: int, windows: int) -> tuple[list[str], list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+    content = HelixContent(make_api(clips_handler(created, requests)))
+    clips = asyncio.run(content.clips_backfill('1', START, START + timedelta(hours=hours), windows=windows))
+    return [clip['id'] for clip in clips], requests
+
+
+def test_sparse_windows_take_one_request_each() -> None:
+    created = [START + timedelta(minutes=7 * i) for i in range(50)]
+    ids, requests = backfill(created, hours=8, windows=4)
+
+    assert ids == [str(i) for i in range(50)]
+    assert len(requests) == 4
+
+
+def test_dense_window_is_split_after_its_first_full_page() -> None:
+    created = [START + timedelta(seconds=20 * i) for i in range(360)]
+    ids, requests = backfill(created, hours=2, windows=1)
+
+    assert ids == [str(i) for i in range(360)]
+    # the 2h window is split after one page, each 1h half is paged through (180 clips, 2 pages).
+    assert [r.url.params.get('after') for r in requests].count(None) == 3
+    assert len(requests) == 5
+
+
+def test_window_too_small_to_split_is_paged_through() -> None:
+    created = [START + timedelta(seconds=10 * i) for i in range(250)]
+    ids, requests = backfill(created, hours=1, windows=1)
+
+    assert ids == [str(i) for i in range(250)]
+    assert [r.url.params.get('after') for r in requests] == [None, '100', '200']
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests.helpers import AsyncHandler
+from tests.helpers import make_api
+from twitchAPI._exceptions import BatchRequestError
+
+
+class UsersServer:
+    """Answers user lookups by ID, later batches faster than earlier ones, failing those with a `bad` ID."""
+
+    def __init__(self, bad: str | None = None) -> None:
+        self.bad = bad
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        ids = request.url.params.get_list('id')
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05 / (1 + int(ids[0]) // 100))
+        finally:
+            self.in_flight -= 1
+        if self.bad in ids:
+            return httpx.Response(400, json={'status': 400})
+        return httpx.Response(200, json={'data': [{'id': i, 'login': f'user{i}'} for i in ids], 'pagination': {}})
+
+
+def lookup(handler: AsyncHandler, ids: list[str], max_concurrency: int | None = None) -> list[dict[str, str]]:
+    api = make_api(handler, max_concurrency=4)
+    return asyncio.run(api.request_batches(httpx.URL('users'), 'id', ids, max_concurrency=max_concurrency))
+
+
+def test_batches_keep_the_input_order() -> None:
+    server = UsersServer()
+    ids = [str(i) for i in range(350)]
+
+    data = lookup(server.handler, ids)
+    assert [user['id'] for user in data] == ids
+    assert server.requests == 4
+
+
+def test_batches_in_flight_are_bounded() -> None:
+    server = UsersServer()
+    lookup(server.handler, [str(i) for i in range(1000)])
+    assert server.max_in_flight == 4
+
+    server = UsersServer()
+    lookup(server.handler, [str(i) for i in range(1000)], max_concurrency=2)
+    assert server.max_in_flight == 2
+
+
+def test_failed_batch_keeps_the_items_of_the_others() -> None:
+    server = UsersServer(bad='150')
+    ids = [str(i) for i in range(300)]
+
+    with pytest.raises(BatchRequestError) as err:
+        lookup(server.handler, ids)
+    assert [user['id'] for user in err.value.data] == ids[:100] + ids[200:]
+    assert list(err.value.errors) == [1]
+    assert isinstance(err.value.errors[1], httpx.HTTPStatusError)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from tests.helpers import make_api
+from tests.helpers import paged_handler
+from twitchAPI.cache import MemoryCacheStore
+from twitchAPI.cache import ResponseCache
+
+
+def test_cached_pages_are_not_requested_again() -> None:
+    requests: list[httpx.Request] = []
+    cache = ResponseCache(ttls={'streams': 60})
+    api = make_api(paged_handler(150, requests), cache=cache)
+
+    async def twice() -> tuple[int, int]:
+        first = await api.request_get(httpx.URL('streams'), {}, max_items=None)
+        second = await api.request_get(httpx.URL('streams'), {}, max_items=None)
+        return len(first['data']), len(second['data'])
+
+    assert asyncio.run(twice()) == (150, 150)
+    assert len(requests) == 2
+    assert cache.stats() == {'hits': 2, 'misses': 2, 'entries': 2}
+
+
+def test_endpoints_without_ttl_are_not_cached() -> None:
+    requests: list[httpx.Request] = []
+    api = make_api(paged_handler(10, requests), cache=ResponseCache(ttls={'streams': 60}))
+
+    async def twice() -> None:
+        await api.request_get(httpx.URL('clips'), {}, max_items=None)
+        await api.request_get(httpx.URL('clips'), {}, max_items=None)
+
+    asyncio.run(twice())
+    assert len(requests) == 2
+
+
+def test_memory_store_evicts_least_recently_used() -> None:
+    store = MemoryCacheStore(max_entries=2)
+    store.set('a', 1, ttl=60)
+    store.set('b', 2, ttl=60)
+    assert store.get('a') == 1
+    store.set('c', 3, ttl=60)
+    assert store.get('b') is None
+    assert store.get('a') == 1
+    assert store.get('c') == 3
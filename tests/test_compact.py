@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from tests.helpers import stream_item
+from twitchAPI.models.compact import StreamTable
+from twitchAPI.models.streams import FollowedStream
+
+
+def test_row_view_reads_columns_and_model_properties() -> None:
+    table = StreamTable(stream_item(i) for i in range(3))
+    view = table[1]
+    model = FollowedStream(**stream_item(1))
+    assert view.user_name == 'User1'
+    assert view.viewer_count == 999
+    assert view.is_mature is False
+    assert view.started_at_ts == model.started_at_ts
+    assert view.name == model.name
+    assert view.started_at_dt == model.started_at_dt
+    assert view.to_model() == model
+
+
+def test_row_view_unknown_attribute_raises_attribute_error() -> None:
+    view = StreamTable([stream_item(0)])[0]
+    assert not hasattr(view, 'missing')
+    assert getattr(view, 'missing', None) is None
+    with pytest.raises(AttributeError, match='missing'):
+        _ = view.missing
+
+
+def test_row_view_can_be_copied() -> None:
+    view = StreamTable([stream_item(0)])[0]
+    copied = copy.copy(view)
+    assert copied.user_name == view.user_name
+    assert copy.deepcopy(view).user_login == 'user0'
+
+
+def test_strings_and_tags_are_shared_between_rows() -> None:
+    table = StreamTable(stream_item(i) for i in range(10))
+    assert table[0].game_name is table[3].game_name
+    assert table[0].tags is table[5].tags
+    assert list(table.column('viewer_count')) == [1000 - i for i in range(10)]
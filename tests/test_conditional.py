@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+import httpx
+
+from tests.helpers import Handler
+from tests.helpers import make_api
+from twitchAPI.cache import ConditionalCache
+
+
+def etag_handler(requests: list[httpx.Request], on_conditional: Callable[[], None] | None = None) -> Handler:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            if on_conditional is not None:
+                on_conditional()
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+        return httpx.Response(200, json={'data': [{'id': '1'}], 'pagination': {}}, headers={'ETag': '"v1"'})
+
+    return handler
+
+
+def test_not_modified_reuses_the_stored_body() -> None:
+    requests: list[httpx.Request] = []
+    conditional = ConditionalCache()
+    api = make_api(etag_handler(requests), conditional=conditional)
+
+    async def twice() -> tuple[object, object]:
+        first = await api.request_get(httpx.URL('games/top'), {}, max_items=None)
+        second = await api.request_get(httpx.URL('games/top'), {}, max_items=None)
+        return first['data'], second['data']
+
+    assert asyncio.run(twice()) == ([{'id': '1'}], [{'id': '1'}])
+    assert 'If-None-Match' not in requests[0].headers
+    assert requests[1].headers['If-None-Match'] == '"v1"'
+    assert conditional.stats()['not_modified'] == 1
+
+
+def test_not_modified_after_eviction_uses_the_validators_it_was_sent_with() -> None:
+    requests: list[httpx.Request] = []
+    conditional = ConditionalCache()
+    api = make_api(etag_handler(requests, on_conditional=conditional._entries.clear), conditional=conditional)
+
+    async def twice() -> object:
+        await api.request_get(httpx.URL('games/top'), {}, max_items=None)
+        return (await api.request_get(httpx.URL('games/top'), {}, max_items=None))['data']
+
+    assert asyncio.run(twice()) == [{'id': '1'}]
+    assert conditional.stats()['entries'] == 1
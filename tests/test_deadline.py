@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from typing import Callable
+
+import httpx
+import pytest
+
+from tests.helpers import AsyncHandler
+from tests.helpers import follow
+from tests.helpers import make_api
+from tests.helpers import paged_handler
+from tests.helpers import stream_item
+from twitchAPI._exceptions import DeadlineExceededError
+from twitchAPI.poller import StreamPoller
+from twitchAPI.store import SnapshotStore
+from twitchAPI.twitch import Twitch
+
+
+def slow_after_first_page(total: int, item: Callable[[int], dict[str, Any]], slow: list[bool]) -> AsyncHandler:
+    """Serves `total` items, pages after the first take longer than any test budget while `slow` is set."""
+    serve = paged_handler(total, item=item)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if slow and 'after' in request.url.params:
+            await asyncio.sleep(1)
+        return serve(request)
+
+    return handler
+
+
+def test_spent_budget_raises_with_the_items_collected_so_far() -> None:
+    api = make_api(slow_after_first_page(250, follow, [True]), budgets={'channels/followed': 0.05})
+
+    with pytest.raises(DeadlineExceededError) as err:
+        asyncio.run(api.request_get(httpx.URL('channels/followed'), {'user_id': '1'}, max_items=None))
+    assert len(err.value.data) == 100
+    assert err.value.pagination == {'cursor': '100'}
+
+
+def test_callers_sharing_a_walk_all_get_the_error() -> None:
+    api = make_api(slow_after_first_page(250, follow, [True]), budgets={'channels/followed': 0.05})
+
+    async def both() -> list[object]:
+        get = api.request_get(httpx.URL('channels/followed'), {'user_id': '1'}, max_items=None)
+        again = api.request_get(httpx.URL('channels/followed'), {'user_id': '1'}, max_items=None)
+        return list(await asyncio.gather(get, again, return_exceptions=True))
+
+    results = asyncio.run(both())
+    assert all(isinstance(result, DeadlineExceededError) for result in results)
+    assert api.singleflight.stats()['coalesced'] == 1
+
+
+def test_timed_out_channels_leave_the_stored_channels_alone() -> None:
+    slow: list[bool] = []
+    store = SnapshotStore()
+    api = make_api(slow_after_first_page(250, follow, slow), budgets={'channels/followed': 0.05})
+    twitch = Twitch(api, store=store)
+    asyncio.run(twitch.channels())
+    assert len(store.channels()) == 250
+
+    slow.append(True)
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(twitch.channels())
+    assert len(store.channels()) == 250
+
+
+def test_timed_out_poll_reports_nothing_offline() -> None:
+    slow: list[bool] = []
+    api = make_api(slow_after_first_page(150, stream_item, slow), budgets={'streams/followed': 0.05})
+    poller = StreamPoller(api)
+    assert len(asyncio.run(poller.poll())) == 150
+
+    slow.append(True)
+    assert asyncio.run(poller.poll()) == []
+    assert poller.online == 150
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from tests.helpers import stream_item
+from twitchAPI.decoders import DECODERS
+from twitchAPI.decoders import get_decoder
+from twitchAPI.models.category import Game
+from twitchAPI.models.streams import FollowedStream
+
+GAMES: dict[str, Any] = {
+    'data': [{'id': str(i), 'name': f'Game {i}', 'box_art_url': f'https://example.com/{i}.jpg'} for i in range(3)],
+    'pagination': {'cursor': 'abc'},
+}
+
+
+@pytest.mark.parametrize('name', sorted(DECODERS))
+def test_decoders_agree(name: str) -> None:
+    if name != 'json':
+        pytest.importorskip(name)
+    decoder = get_decoder(name)
+    content = json.dumps(GAMES).encode()
+
+    assert decoder.loads(content) == GAMES
+    assert decoder.decode(content) == GAMES
+    page = decoder.decode_page(content, Game)
+    assert page['data'] == [Game(**item) for item in GAMES['data']]
+    assert page['pagination'] == {'cursor': 'abc'}
+
+
+def test_msgspec_decodes_typed_pages_in_one_pass() -> None:
+    pytest.importorskip('msgspec')
+    decoder = get_decoder('msgspec')
+
+    page, decode_seconds, model_seconds = decoder.decode_page_timed(json.dumps(GAMES).encode(), Game)
+    assert decode_seconds == 0.0
+    assert model_seconds > 0.0
+    assert page['data'][0] == Game(id='0', name='Game 0', box_art_url='https://example.com/0.jpg')
+
+
+def test_msgspec_falls_back_on_mismatched_pages() -> None:
+    pytest.importorskip('msgspec')
+    decoder = get_decoder('msgspec')
+    item: dict[str, Any] = {'id': 1, 'name': 'Game', 'box_art_url': ''}
+    content = json.dumps({'data': [item], 'pagination': {}}).encode()
+
+    page, decode_seconds, _ = decoder.decode_page_timed(content, Game)
+    assert decode_seconds > 0.0
+    assert page['data'] == [Game(**item)]
+
+
+def test_unknown_decoder() -> None:
+    with pytest.raises(ValueError, match='unknown decoder'):
+        get_decoder('yaml')
+
+
+def test_msgspec_decodes_models_with_derived_fields_in_one_pass() -> None:
+    pytest.importorskip('msgspec')
+    decoder = get_decoder('msgspec')
+    content = json.dumps({'data': [stream_item(i) for i in range(3)], 'pagination': {}}).encode()
+
+    page, decode_seconds, model_seconds = decoder.decode_page_timed(content, FollowedStream)
+    assert decode_seconds == 0.0
+    assert model_seconds > 0.0
+    assert page['data'] == [FollowedStream(**stream_item(i)) for i in range(3)]
+    assert [s.started_at_ts for s in page['data']] == [FollowedStream(**stream_item(i)).started_at_ts for i in range(3)]
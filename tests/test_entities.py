@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests.helpers import Handler
+from tests.helpers import make_api
+from twitchAPI._exceptions import BatchRequestError
+from twitchAPI.cache import EntityCache
+
+
+def users_handler(requested: list[list[str]], bad: str | None = None) -> Handler:
+    """Answers user lookups by ID in reverse order, recording the IDs of each request; fails those with `bad`."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = request.url.params.get_list('id')
+        requested.append(ids)
+        if bad in ids:
+            return httpx.Response(400, json={'status': 400})
+        return httpx.Response(200, json={'data': [{'id': i} for i in reversed(ids)], 'pagination': {}})
+
+    return handler
+
+
+def test_only_the_missing_ids_are_requested() -> None:
+    requested: list[list[str]] = []
+    entities = EntityCache()
+    api = make_api(users_handler(requested), entity_cache=entities)
+
+    first = asyncio.run(api.request_entities(httpx.URL('users'), 'id', ['1', '2', '3']))
+    assert [user['id'] for user in first] == ['1', '2', '3']
+
+    second = asyncio.run(api.request_entities(httpx.URL('users'), 'id', ['4', '2', '5', '1', '4']))
+    assert requested == [['1', '2', '3'], ['4', '5']]
+    assert [user['id'] for user in second] == ['4', '2', '5', '1', '4']
+    assert entities.stats() == {'hits': 2, 'misses': 5, 'entries': 5}
+
+
+def test_fully_cached_ids_send_nothing() -> None:
+    requested: list[list[str]] = []
+    api = make_api(users_handler(requested), entity_cache=EntityCache())
+    asyncio.run(api.request_entities(httpx.URL('users'), 'id', ['1', '2']))
+
+    data = asyncio.run(api.request_entities(httpx.URL('users'), 'id', ['2', '1']))
+    assert [user['id'] for user in data] == ['2', '1']
+    assert len(requested) == 1
+
+
+def test_failed_batch_keeps_the_cached_and_fetched_entities() -> None:
+    requested: list[list[str]] = []
+    api = make_api(users_handler(requested, bad='150'), entity_cache=EntityCache())
+    asyncio.run(api.request_entities(httpx.URL('users'), 'id', ['7']))
+
+    ids = [str(i) for i in range(100, 300)] + ['7']
+    with pytest.raises(BatchRequestError) as err:
+        asyncio.run(api.request_entities(httpx.URL('users'), 'id', ids))
+    assert [user['id'] for user in err.value.data] == [str(i) for i in range(200, 300)] + ['7']
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING
+from typing import Any
+
+import httpx
+from bench_models import clip_item
+from mock_helix import video_item
+
+from tests.helpers import AsyncHandler
+from tests.helpers import make_api
+from twitchAPI.twitch import Twitch
+
+if TYPE_CHECKING:
+    from twitchAPI.models.content import UserContent
+
+
+def content_handler(delays: dict[str, float], created: dict[str, list[str]]) -> AsyncHandler:
+    """Serves the clips and videos of each user after its delay, one per `created` timestamp."""
+    rng = random.Random(0)  # noqa: S311
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        user_id = params.get('broadcaster_id') or params['user_id']
+        await asyncio.sleep(delays[user_id])
+        item, owner = (clip_item, 'broadcaster_id') if request.url.path.endswith('/clips') else (video_item, 'user_id')
+        data = [
+            {**item(i, rng), owner: user_id, 'id': f'{user_id}-{i}', 'created_at': at}
+            for i, at in enumerate(created.get(user_id, []))
+        ]
+        return httpx.Response(200, json={'data': data, 'pagination': {}})
+
+    return handler
+
+
+def collect(results: Any) -> list[UserContent[Any]]:
+    async def run() -> list[UserContent[Any]]:
+        return [result async for result in results]
+
+    return asyncio.run(run())
+
+
+def test_users_are_yielded_as_they_complete() -> None:
+    delays = {'slow': 0.06, 'fast': 0.0, 'medium': 0.03}
+    twitch = Twitch(make_api(content_handler(delays, {'fast': ['2025-01-01T00:00:00Z']})))
+
+    results = collect(twitch.clips_for(['slow', 'fast', 'medium']))
+    assert [result.user_id for result in results] == ['fast', 'medium', 'slow']
+    assert [clip.id for clip in results[0].items] == ['fast-0']
+    assert all(result.ok for result in results)
+
+    videos = collect(twitch.videos_for(['slow', 'fast', 'medium']))
+    assert [result.user_id for result in videos] == ['fast', 'medium', 'slow']
+    assert [video.user_id for video in videos[0].items] == ['fast']
+
+
+def test_user_past_the_deadline_is_yielded_with_the_error() -> None:
+    twitch = Twitch(make_api(content_handler({'stuck': 1.0, 'fast': 0.0}, {'stuck': ['2025-01-01T00:00:00Z']})))
+
+    results = collect(twitch.clips_for(['stuck', 'fast'], deadline=0.05))
+    assert [result.user_id for result in results] == ['fast', 'stuck']
+    stuck = results[1]
+    assert not stuck.ok
+    assert isinstance(stuck.error, asyncio.TimeoutError)
+    assert stuck.items == []
+
+
+def test_feed_merges_every_user_newest_first() -> None:
+    created = {
+        'a': ['2025-01-03T00:00:00Z', '2025-01-01T00:00:00Z', '2025-01-05T00:00:00Z'],
+        'b': ['2025-01-02T00:00:00Z', '2025-01-06T00:00:00Z'],
+        'c': ['2025-01-04T00:00:00Z'],
+        'stuck': ['2025-01-07T00:00:00Z'],
+    }
+    delays = {'a': 0.02, 'b': 0.0, 'c': 0.01, 'stuck': 1.0}
+    twitch = Twitch(make_api(content_handler(delays, created)))
+
+    feed = asyncio.run(twitch.clips_feed(['a', 'b', 'c', 'stuck'], max_concurrency=2, deadline=0.1))
+    assert [clip.created_at[:10] for clip in feed] == [f'2025-01-0{day}' for day in range(6, 0, -1)]
+    assert [clip.id for clip in feed] == ['b-1', 'a-2', 'c-0', 'a-0', 'b-0', 'a-1']
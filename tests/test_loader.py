@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from twitchAPI.loader import BatchLoader
+
+
+def test_concurrent_loads_share_one_batch() -> None:
+    calls: list[list[str]] = []
+
+    async def batch_fn(ids: list[str]) -> list[dict[str, Any]]:
+        calls.append(ids)
+        return [{'id': i} for i in ids if i != 'missing']
+
+    async def main() -> list[Any]:
+        loader = BatchLoader(batch_fn)
+        return list(await asyncio.gather(loader.load('1'), loader.load('2'), loader.load('1'), loader.load('missing')))
+
+    assert asyncio.run(main()) == [{'id': '1'}, {'id': '2'}, {'id': '1'}, None]
+    assert calls == [['1', '2', 'missing']]
+
+
+def test_batch_task_is_referenced_until_done() -> None:
+    async def main() -> None:
+        event = asyncio.Event()
+
+        async def batch_fn(ids: list[str]) -> list[dict[str, Any]]:
+            await event.wait()
+            return [{'id': i} for i in ids]
+
+        loader = BatchLoader(batch_fn)
+        future = loader.load('1')
+        await asyncio.sleep(0)
+        assert len(loader._tasks) == 1
+        event.set()
+        assert await future == {'id': '1'}
+        await asyncio.sleep(0)
+        assert not loader._tasks
+
+    asyncio.run(main())
+
+
+def test_cancelled_batch_cancels_its_waiters() -> None:
+    async def main() -> None:
+        started = asyncio.Event()
+
+        async def batch_fn(_ids: list[str]) -> list[dict[str, Any]]:
+            started.set()
+            await asyncio.sleep(3600)
+            return []
+
+        loader = BatchLoader(batch_fn)
+        future = loader.load('1')
+        await started.wait()
+        for task in loader._tasks:
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, timeout=1)
+
+    asyncio.run(main())
+
+
+def test_failed_batch_fails_its_waiters() -> None:
+    async def batch_fn(_ids: list[str]) -> list[dict[str, Any]]:
+        err_msg = 'boom'
+        raise RuntimeError(err_msg)
+
+    async def main() -> None:
+        loader = BatchLoader(batch_fn)
+        with pytest.raises(RuntimeError, match='boom'):
+            await loader.load('1')
+
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from tenacity import RetryError
+
+from tests.helpers import make_api
+from tests.helpers import paged_handler
+from twitchAPI.metrics import Metrics
+from twitchAPI.metrics import Span
+from twitchAPI.retry import RetryPolicy
+
+
+def test_requests_and_walks_are_counted_per_endpoint() -> None:
+    spans: list[Span] = []
+    metrics = Metrics(on_span=spans.append)
+    api = make_api(paged_handler(250), metrics=metrics)
+
+    asyncio.run(api.request_get(httpx.URL('streams'), {}, max_items=None))
+    stats = metrics.snapshot()['endpoints']['streams']
+    assert stats['requests'] == 3
+    assert stats['statuses'] == {200: 3}
+    assert stats['bytes_in'] > 0
+    assert stats['walks'] == 1
+    assert stats['max_depth'] == 3
+    assert [span.name for span in spans] == ['helix.request'] * 3 + ['helix.walk']
+    assert 'twitchapi_requests_total{endpoint="streams",status="200"} 3' in metrics.to_prometheus()
+
+
+def test_failed_requests_are_counted_by_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        err_msg = 'refused'
+        raise httpx.ConnectError(err_msg, request=request)
+
+    metrics = Metrics()
+    api = make_api(handler, metrics=metrics, retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+    with pytest.raises(RetryError):
+        asyncio.run(api.request_get(httpx.URL('streams'), {}, max_items=None))
+    stats = metrics.endpoints['streams']
+    assert stats.requests == 3
+    assert stats.retries == 2
+    assert stats.errors == {'ConnectError': 3}
+    assert stats.bytes_in == 0
+    assert not stats.statuses
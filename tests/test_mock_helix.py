@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from mock_helix import MockConfig
+from mock_helix import MockHelix
+
+from twitchAPI.models.streams import FollowedStream
+from twitchAPI.retry import RetryPolicy
+from twitchAPI.tokens import TokenManager
+
+
+def test_serves_every_page_of_an_endpoint() -> None:
+    helix = MockHelix(MockConfig(items={'streams/followed': 250}))
+    api = helix.api()
+
+    streams = asyncio.run(api.channels.streams(model=FollowedStream))
+    assert len(streams) == 250
+    assert all(isinstance(stream, FollowedStream) for stream in streams)
+    assert helix.requests == 3
+
+
+def test_injected_429s_are_waited_out() -> None:
+    helix = MockHelix(MockConfig(items={'streams': 300}, ratelimit_every=2, ratelimit_reset=0))
+    api = helix.api(retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+
+    response = asyncio.run(api.request_get(httpx.URL('streams'), {}, max_items=None))
+    assert len(response['data']) == 300
+    assert helix.ratelimited >= 1
+
+
+def test_expired_tokens_are_refreshed() -> None:
+    helix = MockHelix(MockConfig(token_lifetime=60))
+    api = helix.api(tokens=TokenManager())
+    api.auth.refresh_token = 'refresh'
+    api.auth.client_secret = 'secret'
+
+    asyncio.run(api.request_get(httpx.URL('users'), {'id': ['1', '2']}))
+    assert helix.refreshes >= 1
+    assert api.auth.access_token == f'token-{helix.refreshes}'
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from tests.helpers import make_api
+from tests.helpers import paged_handler
+
+
+def test_paginate_yields_pages_up_to_max_items() -> None:
+    requests: list[httpx.Request] = []
+    api = make_api(paged_handler(250, requests))
+
+    async def walk() -> list[int]:
+        return [len(page['data']) async for page in api.paginate(httpx.URL('streams'), {}, max_items=150)]
+
+    assert asyncio.run(walk()) == [100, 50]
+    assert [r.url.params.get('first') for r in requests] == ['100', '50']
+    assert requests[1].url.params.get('after') == '100'
+
+
+def test_paginate_leaves_params_untouched() -> None:
+    requests: list[httpx.Request] = []
+    api = make_api(paged_handler(250, requests))
+    params = {'user_id': '1', 'after': '200'}
+
+    async def walk() -> list[int]:
+        return [len(page['data']) async for page in api.paginate(httpx.URL('streams'), params, max_items=None)]
+
+    assert asyncio.run(walk()) == [50]
+    assert params == {'user_id': '1', 'after': '200'}
+
+
+def test_request_get_walks_every_page() -> None:
+    api = make_api(paged_handler(250))
+    response = asyncio.run(api.request_get(httpx.URL('streams'), {}, max_items=None))
+    assert [item['id'] for item in response['data']] == [str(i) for i in range(250)]
+    assert response['pagination'] == {}
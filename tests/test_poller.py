@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+
+from tests.helpers import Handler
+from tests.helpers import make_api
+from tests.helpers import stream_item
+from twitchAPI.poller import StreamEvent
+from twitchAPI.poller import StreamPoller
+from twitchAPI.retry import RetryPolicy
+
+
+def streams_handler(pages: list[Any]) -> Handler:
+    """Answers each poll with the next of `pages`: a list of streams, a status or an exception to raise."""
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        page = pages.pop(0) if len(pages) > 1 else pages[0]
+        if isinstance(page, Exception):
+            raise page
+        if isinstance(page, int):
+            return httpx.Response(page)
+        return httpx.Response(200, json={'data': page, 'pagination': {}})
+
+    return handler
+
+
+def kinds(events: list[StreamEvent]) -> list[tuple[str, str]]:
+    return [(event.kind, event.stream.user_id) for event in events]
+
+
+def test_diff_reports_each_kind_of_change() -> None:
+    poller = StreamPoller(make_api(streams_handler([[]])), viewers_threshold=10)
+    first, second, third = stream_item(0), stream_item(1), stream_item(2)
+    assert kinds(poller.diff([first, second, third])) == [
+        ('went_live', first['user_id']),
+        ('went_live', second['user_id']),
+        ('went_live', third['user_id']),
+    ]
+
+    events = poller.diff(
+        [
+            {**first, 'title': 'new title', 'viewer_count': first['viewer_count'] + 5},
+            {**second, 'game_id': '9', 'game_name': 'Game 9', 'viewer_count': second['viewer_count'] + 50},
+        ],
+    )
+    assert kinds(events) == [
+        ('title_changed', first['user_id']),
+        ('game_changed', second['user_id']),
+        ('viewers_changed', second['user_id']),
+        ('went_offline', third['user_id']),
+    ]
+    assert [event.previous for event in events] == ['stream title number 0', 'Game 1', second['viewer_count'], None]
+    assert poller.snapshot[second['user_id']].game_name == 'Game 9'
+    assert not events[-1].stream.live
+    assert poller.online == 2
+
+
+def test_diff_reports_a_restarted_stream_as_live() -> None:
+    poller = StreamPoller(make_api(streams_handler([[]])))
+    stream = stream_item(0)
+    poller.diff([stream])
+
+    restarted = {**stream, 'id': '1', 'started_at': '2025-02-01T00:00:00Z'}
+    assert kinds(poller.diff([restarted])) == [('went_live', stream['user_id'])]
+    assert poller.snapshot[stream['user_id']].started_at == restarted['started_at']
+    assert poller.diff([restarted]) == []
+
+
+def test_interval_halves_on_changes_and_grows_while_idle() -> None:
+    stream = stream_item(0)
+    api = make_api(streams_handler([[stream], [stream], [stream], [stream], []]))
+    poller = StreamPoller(api, min_interval=10, max_interval=20)
+    poller.interval = 16
+
+    asyncio.run(poller.poll())
+    assert poller.interval == 10
+    asyncio.run(poller.poll())
+    assert poller.interval == 15
+    asyncio.run(poller.poll())
+    asyncio.run(poller.poll())
+    assert poller.interval == 20
+    asyncio.run(poller.poll())
+    assert poller.interval == 10
+
+
+def test_failed_polls_keep_the_snapshot_and_back_off() -> None:
+    stream = stream_item(0)
+    connect_error = httpx.ConnectError('unreachable')
+    api = make_api(streams_handler([[stream], 503, connect_error, [stream]]), retry_policy=RetryPolicy(max_attempts=1))
+    poller = StreamPoller(api, min_interval=10, max_interval=100)
+    asyncio.run(poller.poll())
+
+    assert asyncio.run(poller.poll()) == []
+    assert poller.interval == 15
+    assert asyncio.run(poller.poll()) == []
+    assert poller.interval == 22.5
+    assert poller.online == 1
+    assert asyncio.run(poller.poll()) == []
+
+
+def test_events_outlive_failures_until_stopped() -> None:
+    stream = stream_item(0)
+    api = make_api(streams_handler([503, 503, [stream], []]), retry_policy=RetryPolicy(max_attempts=1))
+    poller = StreamPoller(api, min_interval=0.01, max_interval=0.01)
+
+    async def run() -> list[StreamEvent]:
+        seen = []
+        async for event in poller.events():
+            seen.append(event)
+            if event.kind == 'went_offline':
+                poller.stop()
+        return seen
+
+    events = asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert kinds(events) == [('went_live', stream['user_id']), ('went_offline', stream['user_id'])]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+from typing import cast
+
+import httpx
+import pytest
+
+from tests.helpers import Handler
+from tests.helpers import make_api
+from tests.helpers import make_auth
+from twitchAPI._exceptions import EnvValidationError
+from twitchAPI._exceptions import NoCredentialError
+from twitchAPI.pool import CredentialPool
+from twitchAPI.transport import TransportConfig
+
+if TYPE_CHECKING:
+    from twitchAPI.api_helix import HelixAPI
+
+
+def pooled_api(requests: list[httpx.Request], limited: str | None = None) -> HelixAPI:
+    """A `HelixAPI` over the credentials of users 1 and 2, requests sent with `limited`'s token get a 429."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers['Authorization'] == f'Bearer token{limited}':
+            return httpx.Response(429, headers={'Ratelimit-Reset': str(int(time.time()) + 60)})
+        return httpx.Response(200, json={'data': [], 'pagination': {}})
+
+    auths = [make_auth(access_token=f'token{i}', user_id=str(i)) for i in (1, 2)]
+    pool = CredentialPool(auths, transport=TransportConfig(transport=httpx.MockTransport(handler)))
+    return make_api(handler, auth=auths[0], pool=pool)
+
+
+def test_user_scoped_requests_use_the_credential_of_their_user() -> None:
+    requests: list[httpx.Request] = []
+    api = pooled_api(requests)
+
+    asyncio.run(api.request_get(httpx.URL('streams/followed'), {'user_id': '2'}))
+    assert [r.headers['Authorization'] for r in requests] == ['Bearer token2']
+
+    with pytest.raises(NoCredentialError):
+        asyncio.run(api.request_get(httpx.URL('streams/followed'), {'user_id': '3'}))
+
+
+def test_shared_requests_are_spread_over_the_credentials() -> None:
+    requests: list[httpx.Request] = []
+    api = pooled_api(requests)
+
+    async def many() -> None:
+        await asyncio.gather(*(api.request_get(httpx.URL('games'), {'id': str(i)}) for i in range(10)))
+
+    asyncio.run(many())
+    used = [r.headers['Authorization'] for r in requests]
+    assert used.count('Bearer token1') == used.count('Bearer token2') == 5
+    assert api.pool is not None
+    assert {stats['requests'] for stats in api.pool.utilisation().values()} == {5}
+
+
+def test_429_on_a_shared_request_moves_to_another_credential() -> None:
+    requests: list[httpx.Request] = []
+    api = pooled_api(requests, limited='1')
+
+    asyncio.run(api.request_get(httpx.URL('games'), {'id': '1'}))
+    assert [r.headers['Authorization'] for r in requests] == ['Bearer token1', 'Bearer token2']
+
+
+def test_credentials_need_a_client_id_and_user_id() -> None:
+    with pytest.raises(EnvValidationError):
+        CredentialPool([make_auth(user_id=None, ok=True)])
+    with pytest.raises(ValueError, match='at least one'):
+        CredentialPool([])
+
+
+def test_pool_refreshing_tokens_is_built_outside_the_event_loop() -> None:
+    refreshes: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == '/oauth2/validate':
+            return httpx.Response(200, json={'login': 'user1', 'expires_in': 3600})
+        if request.url.path == '/oauth2/token':
+            refreshes.append(request)
+            return httpx.Response(200, json={'access_token': 'fresh', 'expires_in': 3600})
+        await asyncio.sleep(0.01)
+        if request.headers['Authorization'] != 'Bearer fresh':
+            return httpx.Response(401, json={'status': 401})
+        return httpx.Response(200, json={'data': [], 'pagination': {}})
+
+    auth = make_auth(refresh_token='refresh', client_secret='secret')
+    transport = TransportConfig(transport=httpx.MockTransport(cast(Handler, handler)))
+    pool = CredentialPool([auth], transport=transport, refresh_tokens=True)
+    api = make_api(handler, auth=auth, pool=pool)
+
+    async def many() -> None:
+        await asyncio.gather(*(api.request_get(httpx.URL('games'), {'id': str(i)}) for i in range(3)))
+
+    asyncio.run(many())
+    assert len(refreshes) == 1
+
+
+def test_close_closes_the_pooled_clients() -> None:
+    api = pooled_api([])
+    assert api.pool is not None
+    clients = [credential.client for credential in api.pool.credentials]
+    assert api.client in clients
+
+    asyncio.run(api.close())
+    assert all(client.is_closed for client in clients)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from tests.helpers import make_api
+from twitchAPI.ratelimit import RateLimiter
+
+
+def ratelimit_headers(limit: int, remaining: int, reset_in: float) -> httpx.Headers:
+    return httpx.Headers(
+        {
+            'Ratelimit-Limit': str(limit),
+            'Ratelimit-Remaining': str(remaining),
+            'Ratelimit-Reset': str(time.time() + reset_in),
+        },
+    )
+
+
+def test_update_learns_the_limit_and_refill_period() -> None:
+    limiter = RateLimiter()
+    limiter.update(ratelimit_headers(limit=1000, remaining=500, reset_in=30))
+
+    assert limiter.limit == 1000
+    assert limiter.refill_period == pytest.approx(60, rel=0.01)
+    assert limiter.available() == pytest.approx(500, abs=1)
+
+
+def test_update_ignores_responses_without_headers() -> None:
+    limiter = RateLimiter(limit=10, refill_period=1)
+    limiter.update(httpx.Headers({'Ratelimit-Limit': '800'}))
+    assert (limiter.limit, limiter.refill_period) == (10, 1)
+
+
+def test_empty_bucket_queues_requests_until_it_refills() -> None:
+    limiter = RateLimiter(limit=2, refill_period=0.2)
+
+    async def take(count: int) -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(count)))
+        return time.monotonic() - start
+
+    assert asyncio.run(take(2)) < 0.05
+    # a point refills every 0.1s.
+    assert asyncio.run(take(2)) >= 0.15
+
+
+def test_429_holds_back_every_request_until_reset() -> None:
+    sent: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        if len(sent) == 1:
+            return httpx.Response(429, headers={'Ratelimit-Reset': str(time.time() + 0.2)})
+        return httpx.Response(200, json={'data': [{'id': request.url.params['id']}], 'pagination': {}})
+
+    api = make_api(handler)
+
+    async def both() -> None:
+        first = asyncio.ensure_future(api.request_get(httpx.URL('games'), {'id': '1'}))
+        await asyncio.sleep(0.05)
+        assert api.rate_limiter.available() == 0
+        await asyncio.gather(first, api.request_get(httpx.URL('games'), {'id': '2'}))
+
+    asyncio.run(both())
+    assert len(sent) == 3
+    assert min(sent[1:]) - sent[0] >= 0.15
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from tenacity import RetryError
+
+from tests.helpers import make_api
+from twitchAPI import constants
+from twitchAPI._exceptions import CircuitOpenError
+from twitchAPI.retry import CircuitBreaker
+from twitchAPI.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from twitchAPI.api_helix import HelixAPI
+
+
+def test_persistent_429_is_sent_max_attempts_times() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(429, headers={'Ratelimit-Reset': str(int(time.time()))})
+
+    api = make_api(handler, retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+    with pytest.raises(httpx.HTTPStatusError) as err:
+        asyncio.run(api.request_get(httpx.URL('games/top'), {}, max_items=None))
+    assert err.value.response.status_code == httpx.codes.TOO_MANY_REQUESTS
+    assert len(requests) == constants.MAX_RETRY_ATTEMPTS
+
+
+def test_server_errors_are_retried_by_the_policy() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) < constants.MAX_RETRY_ATTEMPTS:
+            return httpx.Response(503)
+        return httpx.Response(200, json={'data': [{'id': '1'}], 'pagination': {}})
+
+    api = make_api(handler, retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+    response = asyncio.run(api.request_get(httpx.URL('games/top'), {}, max_items=None))
+    assert response['data'] == [{'id': '1'}]
+    assert len(requests) == constants.MAX_RETRY_ATTEMPTS
+
+
+class FlakyServer:
+    """Answers with `status` and counts the requests that reached it."""
+
+    def __init__(self, status: int = 503) -> None:
+        self.status = status
+        self.requests = 0
+
+    def handler(self, _request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.status != httpx.codes.OK:
+            return httpx.Response(self.status)
+        return httpx.Response(200, json={'data': [], 'pagination': {}})
+
+
+def breaker_api(server: FlakyServer) -> HelixAPI:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+    return make_api(server.handler, breaker=breaker, retry_policy=RetryPolicy(max_attempts=1))
+
+
+def get_games(api: HelixAPI) -> None:
+    asyncio.run(api.request_get(httpx.URL('games/top'), {}, max_items=None))
+
+
+def test_circuit_opens_after_the_threshold_without_sending() -> None:
+    server = FlakyServer()
+    api = breaker_api(server)
+    for _ in range(3):
+        with pytest.raises(RetryError):
+            get_games(api)
+    assert api.breaker.stats() == {'games/top': 'open'}
+
+    with pytest.raises(CircuitOpenError) as err:
+        get_games(api)
+    assert err.value.endpoint == 'games/top'
+    assert 0 < err.value.retry_in <= 0.05
+    assert server.requests == 3
+
+
+def test_client_errors_do_not_open_the_circuit() -> None:
+    server = FlakyServer(status=404)
+    api = breaker_api(server)
+    for _ in range(5):
+        with pytest.raises(httpx.HTTPStatusError):
+            get_games(api)
+    assert api.breaker.state('games/top') == 'closed'
+    assert server.requests == 5
+
+
+def test_successful_probe_closes_the_circuit() -> None:
+    server = FlakyServer()
+    api = breaker_api(server)
+    for _ in range(3):
+        with pytest.raises(RetryError):
+            get_games(api)
+
+    time.sleep(0.06)
+    assert api.breaker.state('games/top') == 'half-open'
+    server.status = 200
+    get_games(api)
+    assert api.breaker.state('games/top') == 'closed'
+    get_games(api)
+    assert server.requests == 5
+
+
+def test_failed_probe_reopens_the_circuit() -> None:
+    server = FlakyServer()
+    api = breaker_api(server)
+    for _ in range(3):
+        with pytest.raises(RetryError):
+            get_games(api)
+
+    time.sleep(0.06)
+    with pytest.raises(RetryError):
+        get_games(api)
+    assert api.breaker.state('games/top') == 'open'
+    with pytest.raises(CircuitOpenError):
+        get_games(api)
+    assert server.requests == 4
+
+
+def test_half_open_circuit_lets_a_single_probe_through() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure('games')
+    time.sleep(0.06)
+
+    breaker.before_request('games')
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request('games')
+    breaker.record_success('games')
+    breaker.before_request('games')
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from tests.helpers import AsyncHandler
+from tests.helpers import make_api
+from tests.helpers import paged_handler
+from twitchAPI.singleflight import SingleFlight
+
+
+def slow_pages(total: int, requests: list[httpx.Request]) -> AsyncHandler:
+    """Serves `total` items, each page slow enough for concurrent callers to overlap."""
+    serve = paged_handler(total, requests)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return serve(request)
+
+    return handler
+
+
+def test_identical_walks_share_one_walk() -> None:
+    requests: list[httpx.Request] = []
+    api = make_api(slow_pages(250, requests))
+
+    async def many() -> list[Any]:
+        calls = (api.request_get(httpx.URL('games/top'), {}, max_items=None) for _ in range(5))
+        return list(await asyncio.gather(*calls))
+
+    responses = asyncio.run(many())
+    assert len(requests) == 3
+    assert all(response is responses[0] for response in responses)
+    assert len(responses[0]['data']) == 250
+    assert api.singleflight.stats() == {'calls': 1, 'coalesced': 4, 'in_flight': 0}
+
+
+def test_different_params_or_max_items_are_not_merged() -> None:
+    requests: list[httpx.Request] = []
+    api = make_api(slow_pages(250, requests))
+
+    async def many() -> None:
+        await asyncio.gather(
+            api.request_get(httpx.URL('games/top'), {'language': 'en'}, max_items=100),
+            api.request_get(httpx.URL('games/top'), {'language': 'de'}, max_items=100),
+            api.request_get(httpx.URL('games/top'), {'language': 'en'}, max_items=None),
+            api.request_get(httpx.URL('games/top'), {'language': 'en'}, max_items=100),
+        )
+
+    asyncio.run(many())
+    assert api.singleflight.stats()['calls'] == 3
+    assert api.singleflight.stats()['coalesced'] == 1
+    assert len(requests) == 1 + 1 + 3
+
+
+def test_a_cancelled_caller_leaves_the_call_to_the_others() -> None:
+    flight = SingleFlight()
+
+    async def call() -> str:
+        await asyncio.sleep(0.02)
+        return 'done'
+
+    async def run() -> str:
+        first = asyncio.ensure_future(flight.do('key', call))
+        second = asyncio.ensure_future(flight.do('key', call))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == 'done'
+    assert flight.stats() == {'calls': 1, 'coalesced': 1, 'in_flight': 0}
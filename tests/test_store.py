@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+from tests.helpers import stream_item
+from twitchAPI import constants
+from twitchAPI.models.category import Game
+from twitchAPI.store import SnapshotStore
+
+
+def user(i: int) -> dict[str, Any]:
+    return {
+        'broadcaster_type': '',
+        'created_at': '2020-01-01T00:00:00Z',
+        'description': '',
+        'display_name': f'User{i}',
+        'id': str(i),
+        'login': f'user{i}',
+        'offline_image_url': '',
+        'profile_image_url': '',
+        'type': '',
+        'view_count': '0',
+    }
+
+
+def test_lookups_by_id_are_chunked_under_the_variable_limit() -> None:
+    store = SnapshotStore()
+    total = constants.STORE_MAX_VARIABLES * 3 + 7
+    store.save_users(user(i) for i in range(total))
+    store.save_games({'id': str(i), 'name': f'Game {i}', 'box_art_url': ''} for i in range(total))
+
+    ids = [str(i) for i in range(total)] + ['missing']
+    assert {u.id for u in store.users(ids)} == {str(i) for i in range(total)}
+    assert len(store.games(ids)) == total
+    assert store.games(['1']) == [Game(id='1', name='Game 1', box_art_url='')]
+    assert store.users([]) == []
+
+
+def test_streams_replace_the_previous_snapshot() -> None:
+    store = SnapshotStore()
+    store.save_streams([stream_item(i) for i in range(3)])
+    store.save_streams([stream_item(5)])
+
+    assert [s.user_id for s in store.live_streams()] == [stream_item(5)['user_id']]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from tests.helpers import follow
+from tests.helpers import make_api
+from tests.helpers import paged_handler
+from twitchAPI.store import SnapshotStore
+from twitchAPI.sync import FollowedSyncState
+from twitchAPI.twitch import Twitch
+
+
+def failing_once_at(offset: str, total: int) -> Any:
+    """Serves `total` follows, the request for the page at `offset` fails the first time."""
+    serve = paged_handler(total, item=follow)
+    failed: list[bool] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get('after') == offset and not failed:
+            failed.append(True)
+            return httpx.Response(404, json={'status': 404})
+        return serve(request)
+
+    return handler
+
+
+def test_interrupted_resync_reports_every_addition_on_resume() -> None:
+    api = make_api(failing_once_at('100', 250))
+    state = FollowedSyncState()
+    checkpoints: list[dict[str, Any]] = []
+
+    async def on_page(added: list[dict[str, Any]]) -> None:
+        checkpoints.append(FollowedSyncState.from_dict(state.to_dict()).to_dict())
+        assert len(added) == 100
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(api.channels.sync_followed(state, full=True, on_page=on_page))
+    assert checkpoints[-1]['cursor'] == '100'
+    assert len(checkpoints[-1]['resync_added']) == 100
+
+    resumed = FollowedSyncState.from_dict(checkpoints[-1])
+    result = asyncio.run(api.channels.sync_followed(resumed, full=True))
+    assert [item['broadcaster_id'] for item in result.added] == [str(i) for i in range(250)]
+    assert resumed.known_ids == {str(i) for i in range(250)}
+    assert resumed.cursor is None
+    assert resumed.resync_added == []
+
+
+def test_refresh_channels_stores_each_page_and_resumes() -> None:
+    store = SnapshotStore()
+    twitch = Twitch(make_api(failing_once_at('100', 250)), store=store)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(twitch.refresh_channels())
+    assert len(store.channels()) == 100
+    assert (store.get_meta('followed_sync') or {})['cursor'] == '100'
+
+    asyncio.run(twitch.refresh_channels())
+    assert len(store.channels()) == 250
+    state = FollowedSyncState.from_dict(store.get_meta('followed_sync') or {})
+    assert len(state.known_ids) == 250
+    assert state.cursor is None
+
+
+def test_incremental_sync_stops_at_the_first_known_follow() -> None:
+    requests: list[httpx.Request] = []
+    api = make_api(paged_handler(250, requests, item=follow))
+    state = FollowedSyncState()
+    state.add([follow(i) for i in range(5, 250)])
+
+    result = asyncio.run(api.channels.sync_followed(state))
+    assert [item['broadcaster_id'] for item in result.added] == ['0', '1', '2', '3', '4']
+    assert len(requests) == 1
+
+
+def follows_handler(ids: list[int]) -> Any:
+    """Serves a follow for each of `ids`, newest first, read on each request."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return paged_handler(len(ids), item=lambda i: follow(ids[i]))(request)
+
+    return handler
+
+
+def test_capped_channels_fetch_keeps_the_synced_channels() -> None:
+    store = SnapshotStore()
+    twitch = Twitch(make_api(follows_handler(list(range(600)))), store=store)
+
+    asyncio.run(twitch.refresh_channels())
+    assert len(store.channels()) == 600
+    assert len(asyncio.run(twitch.channels())) == 500
+    assert len(store.channels()) == 600
+    asyncio.run(twitch.refresh_channels())
+    assert len(store.channels()) == 600
+
+
+def test_full_resync_drops_unfollowed_channels() -> None:
+    ids = list(range(250))
+    store = SnapshotStore()
+    twitch = Twitch(make_api(follows_handler(ids)), store=store)
+    asyncio.run(twitch.refresh_channels())
+    ids.remove(7)
+
+    asyncio.run(twitch.refresh_channels())
+    assert len(store.channels()) == 250
+    asyncio.run(twitch.refresh_channels(resync_interval=3600))
+    assert len(store.channels()) == 250
+
+    asyncio.run(twitch.refresh_channels(full=True))
+    assert '7' not in {c.broadcaster_id for c in store.channels()}
+    assert len(store.channels()) == 249
+
+
+def test_stale_resync_runs_on_refresh() -> None:
+    ids = list(range(50))
+    store = SnapshotStore()
+    twitch = Twitch(make_api(follows_handler(ids)), store=store)
+    asyncio.run(twitch.refresh_channels())
+    ids.remove(0)
+
+    asyncio.run(twitch.refresh_channels(resync_interval=0))
+    assert len(store.channels()) == 49
+    state = FollowedSyncState.from_dict(store.get_meta('followed_sync') or {})
+    assert state.resynced_at is not None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests.helpers import make_api
+from tests.helpers import make_auth
+from twitchAPI._exceptions import TokenRefreshError
+from twitchAPI.tokens import TokenManager
+
+
+class OAuthServer:
+    """Answers Helix requests for `valid` only, refreshing to a new token on each POST to the token URL."""
+
+    def __init__(self, valid: str = 'token', expires_in: int = 3600) -> None:
+        self.valid = valid
+        self.expires_in = expires_in
+        self.refreshes = 0
+        self.rejected = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        # keeps concurrent requests, refreshes included, in flight together.
+        await asyncio.sleep(0.01)
+        if request.url.path == '/oauth2/validate':
+            return httpx.Response(200, json={'login': 'user1', 'expires_in': self.expires_in})
+        if request.url.path == '/oauth2/token':
+            self.refreshes += 1
+            self.valid = f'fresh-{self.refreshes}'
+            return httpx.Response(200, json={'access_token': self.valid, 'expires_in': 3600})
+        if request.headers['Authorization'] != f'Bearer {self.valid}':
+            self.rejected += 1
+            return httpx.Response(401, json={'status': 401})
+        return httpx.Response(200, json={'data': [], 'pagination': {}})
+
+
+def test_concurrent_401s_share_one_refresh() -> None:
+    server = OAuthServer(valid='other')
+    refreshed: list[str | None] = []
+    auth = make_auth(refresh_token='refresh', client_secret='secret')
+    tokens = TokenManager(on_refresh=lambda a: refreshed.append(a.access_token))
+    api = make_api(server.handler, auth=auth, tokens=tokens)
+
+    async def many() -> None:
+        await asyncio.gather(*(api.request_get(httpx.URL('games'), {'id': str(i)}) for i in range(5)))
+
+    asyncio.run(many())
+    assert server.refreshes == 1
+    assert server.rejected == 5
+    assert refreshed == ['fresh-1']
+    assert auth.access_token == 'fresh-1'
+
+
+def test_token_about_to_expire_is_refreshed_before_sending() -> None:
+    server = OAuthServer(expires_in=60)
+    auth = make_auth(refresh_token='refresh', client_secret='secret')
+    api = make_api(server.handler, auth=auth, tokens=TokenManager())
+
+    asyncio.run(api.request_get(httpx.URL('games'), {'id': '1'}))
+    assert server.refreshes == 1
+    assert server.rejected == 0
+
+
+def test_expired_token_without_refresh_token_fails() -> None:
+    server = OAuthServer(valid='other')
+    api = make_api(server.handler, tokens=TokenManager())
+
+    with pytest.raises(TokenRefreshError):
+        asyncio.run(api.request_get(httpx.URL('games'), {'id': '1'}))
+
+
+def test_manager_outlives_its_event_loop() -> None:
+    server = OAuthServer(valid='other')
+    auth = make_auth(refresh_token='refresh', client_secret='secret')
+    tokens = TokenManager()
+    api = make_api(server.handler, auth=auth, tokens=tokens)
+
+    async def many() -> None:
+        await asyncio.gather(*(api.request_get(httpx.URL('games'), {'id': str(i)}) for i in range(3)))
+
+    asyncio.run(many())
+    server.valid = 'other'
+    asyncio.run(many())
+    assert tokens.refreshes == server.refreshes == 2
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from typing import TYPE_CHECKING
+from typing import Any
+
+import httpx
+
+from tests.helpers import make_api
+from tests.helpers import make_auth
+from twitchAPI.api_helix import HelixAPI
+from twitchAPI.config import HelixConfig
+from twitchAPI.transport import TransportConfig
+
+if TYPE_CHECKING:
+    import pytest
+
+TRANSPORT = TransportConfig(
+    max_connections=7,
+    max_keepalive_connections=3,
+    keepalive_expiry=12.0,
+    connect_timeout=1.0,
+    read_timeout=2.0,
+    write_timeout=3.0,
+    pool_timeout=4.0,
+)
+
+
+def test_client_is_built_with_the_transport_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[dict[str, Any]] = []
+    client = httpx.AsyncClient
+
+    def record(**kwargs: Any) -> httpx.AsyncClient:
+        built.append(kwargs)
+        return client(**kwargs)
+
+    monkeypatch.setattr(httpx, 'AsyncClient', record)
+    api = HelixAPI(make_auth(), HelixConfig(transport=TRANSPORT))
+
+    limits = built[0]['limits']
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (7, 3, 12.0)
+    assert built[0]['http2'] is False
+    assert api.client.timeout == httpx.Timeout(connect=1.0, read=2.0, write=3.0, pool=4.0)
+    asyncio.run(api.close())
+
+
+def test_timeout_can_be_overridden_per_request() -> None:
+    timeouts: list[dict[str, float]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions['timeout'])
+        return httpx.Response(200, json={'data': [], 'pagination': {}})
+
+    transport = dataclasses.replace(TRANSPORT, transport=httpx.MockTransport(handler))
+    api = HelixAPI(make_auth(), HelixConfig(transport=transport))
+    url = api.base_url.join('games')
+
+    asyncio.run(api.send_request(url, {}))
+    asyncio.run(api.send_request(url, {}, timeout=0.5))
+    asyncio.run(api.send_request(url, {}, timeout=httpx.Timeout(9.0, read=30.0)))
+    assert timeouts == [
+        {'connect': 1.0, 'read': 2.0, 'write': 3.0, 'pool': 4.0},
+        {'connect': 0.5, 'read': 0.5, 'write': 0.5, 'pool': 0.5},
+        {'connect': 9.0, 'read': 30.0, 'write': 9.0, 'pool': 9.0},
+    ]
+
+
+def test_warmup_opens_connections_and_logs_failures(caplog: pytest.LogCaptureFixture) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) > 1:
+            err_msg = 'unreachable'
+            raise httpx.ConnectError(err_msg, request=request)
+        return httpx.Response(200)
+
+    api = make_api(handler)
+    with caplog.at_level(logging.WARNING, logger='twitchAPI.api_helix'):
+        asyncio.run(api.warmup(connections=3))
+
+    assert [request.method for request in requests] == ['HEAD'] * 3
+    assert all(request.url == api.base_url for request in requests)
+    assert len([r for r in caplog.records if 'could not connect' in r.getMessage()]) == 2
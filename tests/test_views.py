@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+from tests.helpers import stream_item
+from twitchAPI.models.streams import FollowedStream
+from twitchAPI.models.views import StreamView
+
+
+def test_view_reads_and_coerces_on_access() -> None:
+    view: Any = StreamView({**stream_item(1), 'viewer_count': '5'})
+    assert view.viewer_count == 5
+    assert view.user_name == 'User1'
+    assert view.live is True
+    assert view.name == 'User1'
+    assert view.started_at_ts == FollowedStream(**stream_item(1)).started_at_ts
+
+
+def test_materialize_applies_the_same_coercions() -> None:
+    view = StreamView({**stream_item(1), 'viewer_count': '5'})
+    model = view.materialize()
+    assert isinstance(model, FollowedStream)
+    assert model.viewer_count == 5
+    assert model == FollowedStream(**{**stream_item(1), 'viewer_count': 5})
+
+
+def test_materialize_leaves_the_raw_item_untouched() -> None:
+    raw = {**stream_item(1), 'viewer_count': '5'}
+    StreamView(raw).materialize()
+    assert raw['viewer_count'] == '5'